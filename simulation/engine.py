@@ -37,7 +37,7 @@ if TYPE_CHECKING:
     from src.models.team import Team
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentContext:
     """Context for simulating a game segment."""
 
@@ -169,38 +169,26 @@ class GameSimulationEngine:
             matchup_analysis=matchup_analysis,
         )
 
-        sample_games = []
-
-        for i in range(config.iterations):
-            game = self._simulate_single_game(
-                i + 1, config, home_team, away_team, home_xg, away_xg, players
-            )
-
-            # Record outcome
-            if game.winner == home_team.team_id:
-                result.home_wins += 1
-            else:
-                result.away_wins += 1
-
-            if game.went_to_overtime:
-                result.overtime_games += 1
-            if game.went_to_shootout:
-                result.shootout_games += 1
-
-            # Add to score distribution
-            result.score_distribution.add_result(game.home_score, game.away_score)
-
-            # Track xG
-            result.average_home_xg += game.home_xg_total
-            result.average_away_xg += game.away_xg_total
-
-            # Save sample games
-            if i < 10:
-                sample_games.append(game)
-
-        # Calculate averages
-        result.average_home_xg /= config.iterations
-        result.average_away_xg /= config.iterations
+        games = self._simulate_game_batch(config, home_xg, away_xg, home_team, away_team, players)
+        home_score = games["home_score"]
+        away_score = games["away_score"]
+
+        # Record outcomes
+        result.home_wins = int(np.count_nonzero(home_score > away_score))
+        result.away_wins = config.iterations - result.home_wins
+        result.overtime_games = int(np.count_nonzero(games["overtime"]))
+        result.shootout_games = int(np.count_nonzero(games["shootout"]))
+        result.score_distribution.add_results(home_score, away_score)
+
+        # Average regulation xG per game
+        result.average_home_xg = float(games["home_segment_xg"].sum()) / config.iterations
+        result.average_away_xg = float(games["away_segment_xg"].sum()) / config.iterations
+
+        # Save sample games
+        sample_games = [
+            self._build_sample_game(i, games, home_team, away_team)
+            for i in range(min(10, config.iterations))
+        ]
 
         # Calculate win probabilities
         result.home_win_probability = result.home_wins / config.iterations
@@ -226,6 +214,176 @@ class GameSimulationEngine:
 
         return result
 
+    def _simulate_game_batch(
+        self,
+        config: SimulationConfig,
+        home_xg: TeamExpectedGoals,
+        away_xg: TeamExpectedGoals,
+        home_team: Team,
+        away_team: Team,
+        players: dict[int, Player] | None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Simulate ``config.iterations`` games at once.
+
+        Draws the same quantities as _simulate_single_game (per-segment xG
+        variance and Poisson goals, then overtime and shootout for tied
+        games), one array per quantity instead of one game at a time.
+
+        Returns:
+            Arrays keyed by name: (iterations, segments) segment xG and goals,
+            and per-game final scores, overtime/shootout flags and OT xG
+        """
+        rng = self._rng
+        n = config.iterations
+        variance = config.variance_factor
+
+        # Segment contexts do not depend on the iteration, so build them once
+        contexts = self._build_segment_contexts(
+            config, home_xg, away_xg, home_team, away_team, players
+        )
+        home_base = np.array([
+            c.home_xg_base * c.segment_weight * c.clutch_home * c.fatigue_home
+            for c in contexts
+        ])
+        away_base = np.array([
+            c.away_xg_base * c.segment_weight * c.clutch_away * c.fatigue_away
+            for c in contexts
+        ])
+
+        # Regulation: per-game segment xG with variance, then Poisson goals
+        shape = (n, len(contexts))
+        home_segment_xg = np.maximum(home_base * (1 + rng.normal(0, variance, shape)), 0.0)
+        away_segment_xg = np.maximum(away_base * (1 + rng.normal(0, variance, shape)), 0.0)
+        home_segment_goals = rng.poisson(home_segment_xg)
+        away_segment_goals = rng.poisson(away_segment_xg)
+        home_score = home_segment_goals.sum(axis=1)
+        away_score = away_segment_goals.sum(axis=1)
+
+        # Overtime for tied games (3-on-3, 5 minutes at 1.5x scoring)
+        overtime = home_score == away_score
+        tied = np.flatnonzero(overtime)
+        ot_multiplier = 1.5
+        home_ot_xg = np.zeros(n)
+        away_ot_xg = np.zeros(n)
+        home_ot_xg[tied] = (home_xg.total_xg_for / 60) * 5 * ot_multiplier * (
+            1 + rng.normal(0, variance, tied.size)
+        )
+        away_ot_xg[tied] = (away_xg.total_xg_for / 60) * 5 * ot_multiplier * (
+            1 + rng.normal(0, variance, tied.size)
+        )
+
+        # 50% chance someone scores in OT, split by relative OT xG
+        ot_goal = np.zeros(n, dtype=bool)
+        ot_goal[tied] = rng.random(tied.size) < 0.5
+        total_ot_xg = home_ot_xg[tied] + away_ot_xg[tied]
+        home_prob = np.full(tied.size, 0.5)
+        np.divide(home_ot_xg[tied], total_ot_xg, out=home_prob, where=total_ot_xg > 0)
+        home_ot_winner = rng.random(tied.size) < home_prob
+
+        scorers = ot_goal[tied]
+        home_score[tied[scorers & home_ot_winner]] += 1
+        away_score[tied[scorers & ~home_ot_winner]] += 1
+
+        # Shootout for the rest; the winner gets one goal
+        shootout = overtime & ~ot_goal
+        shooters = np.flatnonzero(shootout)
+        home_shootout_wins = self._simulate_shootout_batch(shooters.size)
+        home_score[shooters[home_shootout_wins]] += 1
+        away_score[shooters[~home_shootout_wins]] += 1
+
+        return {
+            "home_segment_xg": home_segment_xg,
+            "away_segment_xg": away_segment_xg,
+            "home_segment_goals": home_segment_goals,
+            "away_segment_goals": away_segment_goals,
+            "home_score": home_score,
+            "away_score": away_score,
+            "overtime": overtime,
+            "shootout": shootout,
+            "ot_goal": ot_goal,
+            "home_ot_xg": home_ot_xg,
+            "away_ot_xg": away_ot_xg,
+        }
+
+    def _simulate_shootout_batch(self, n: int) -> np.ndarray:
+        """Simulate n shootouts at once; returns True where the home team wins."""
+        # Three rounds at ~33% success per shooter
+        makes = self._rng.random((n, self.SHOOTOUT_ROUNDS, 2)) < 0.33
+        home_goals = makes[:, :, 0].sum(axis=1)
+        away_goals = makes[:, :, 1].sum(axis=1)
+
+        # Sudden death rounds until every shootout is decided
+        undecided = np.flatnonzero(home_goals == away_goals)
+        while undecided.size:
+            round_makes = self._rng.random((undecided.size, 2)) < 0.33
+            home_only = round_makes[:, 0] & ~round_makes[:, 1]
+            away_only = round_makes[:, 1] & ~round_makes[:, 0]
+            home_goals[undecided[home_only]] += 1
+            away_goals[undecided[away_only]] += 1
+            undecided = undecided[~(home_only | away_only)]
+
+        return home_goals > away_goals
+
+    def _build_sample_game(
+        self,
+        index: int,
+        games: dict[str, np.ndarray],
+        home_team: Team,
+        away_team: Team,
+    ) -> SimulatedGame:
+        """Materialize one game of a _simulate_game_batch result as a SimulatedGame."""
+        home_score = int(games["home_score"][index])
+        away_score = int(games["away_score"][index])
+        game = SimulatedGame(
+            game_number=index + 1,
+            home_score=home_score,
+            away_score=away_score,
+            winner=home_team.team_id if home_score > away_score else away_team.team_id,
+            went_to_overtime=bool(games["overtime"][index]),
+            went_to_shootout=bool(games["shootout"][index]),
+        )
+
+        segments = (GameSegment.EARLY_GAME, GameSegment.MID_GAME, GameSegment.LATE_GAME)
+        for column, segment in enumerate(segments):
+            home_xg = float(games["home_segment_xg"][index, column])
+            away_xg = float(games["away_segment_xg"][index, column])
+            home_goals = int(games["home_segment_goals"][index, column])
+            away_goals = int(games["away_segment_goals"][index, column])
+
+            segment_result = SegmentResult(
+                segment=segment,
+                home_goals=home_goals,
+                away_goals=away_goals,
+                home_xg=home_xg,
+                away_xg=away_xg,
+                # Estimate shots (roughly 10x xG)
+                home_shots=max(home_goals, int(home_xg * 10)),
+                away_shots=max(away_goals, int(away_xg * 10)),
+            )
+            if home_goals > away_goals:
+                segment_result.dominant_team = 1  # Home
+            elif away_goals > home_goals:
+                segment_result.dominant_team = 2  # Away
+            game.segments.append(segment_result)
+
+            game.home_xg_total += home_xg
+            game.away_xg_total += away_xg
+
+        if games["ot_goal"][index]:
+            home_won = home_score > away_score
+            game.segments.append(
+                SegmentResult(
+                    segment=GameSegment.OVERTIME,
+                    home_goals=1 if home_won else 0,
+                    away_goals=0 if home_won else 1,
+                    home_xg=float(games["home_ot_xg"][index]),
+                    away_xg=float(games["away_ot_xg"][index]),
+                )
+            )
+
+        return game
+
     def _simulate_single_game(
         self,
         game_number: int,
@@ -235,8 +393,14 @@ class GameSimulationEngine:
         home_xg: TeamExpectedGoals,
         away_xg: TeamExpectedGoals,
         players: dict[int, Player] | None,
+        contexts: list[SegmentContext] | None = None,
     ) -> SimulatedGame:
-        """Simulate a single game."""
+        """
+        Simulate a single game.
+
+        ``contexts`` may carry the segment contexts from a previous
+        _build_segment_contexts call for the same teams and xG.
+        """
         game = SimulatedGame(
             game_number=game_number,
             home_score=0,
@@ -244,17 +408,13 @@ class GameSimulationEngine:
             winner=0,
         )
 
-        # Simulate each segment
-        segments = [
-            (GameSegment.EARLY_GAME, "early_game", home_xg.early_game_xg_for, away_xg.early_game_xg_for),
-            (GameSegment.MID_GAME, "mid_game", home_xg.mid_game_xg_for, away_xg.mid_game_xg_for),
-            (GameSegment.LATE_GAME, "late_game", home_xg.late_game_xg_for, away_xg.late_game_xg_for),
-        ]
-
-        for segment_enum, segment_name, h_xg, a_xg in segments:
-            context = self._build_segment_context(
-                segment_enum, h_xg, a_xg, config, home_team, away_team, players
+        if contexts is None:
+            contexts = self._build_segment_contexts(
+                config, home_xg, away_xg, home_team, away_team, players
             )
+
+        # Simulate each segment
+        for context in contexts:
             segment_result = self._simulate_segment(context, config)
             game.segments.append(segment_result)
 
@@ -275,6 +435,28 @@ class GameSimulationEngine:
 
         return game
 
+    def _build_segment_contexts(
+        self,
+        config: SimulationConfig,
+        home_xg: TeamExpectedGoals,
+        away_xg: TeamExpectedGoals,
+        home_team: Team,
+        away_team: Team,
+        players: dict[int, Player] | None,
+    ) -> list[SegmentContext]:
+        """Build the early, mid and late game segment contexts for a matchup."""
+        segments = [
+            (GameSegment.EARLY_GAME, home_xg.early_game_xg_for, away_xg.early_game_xg_for),
+            (GameSegment.MID_GAME, home_xg.mid_game_xg_for, away_xg.mid_game_xg_for),
+            (GameSegment.LATE_GAME, home_xg.late_game_xg_for, away_xg.late_game_xg_for),
+        ]
+        return [
+            self._build_segment_context(
+                segment_enum, h_xg, a_xg, config, home_team, away_team, players
+            )
+            for segment_enum, h_xg, a_xg in segments
+        ]
+
     def _build_segment_context(
         self,
         segment: GameSegment,
@@ -466,6 +648,14 @@ class GameSimulationEngine:
         games_to_win = config.series_games_to_win
         start_home, start_away = config.current_series_score
 
+        # Segment contexts for each home-ice orientation, built once
+        home_ice_contexts = self._build_segment_contexts(
+            config, home_xg, away_xg, home_team, away_team, players
+        )
+        away_ice_contexts = self._build_segment_contexts(
+            config, away_xg, home_xg, home_team, away_team, players
+        )
+
         for _ in range(config.iterations):
             home_series_wins = start_home
             away_series_wins = start_away
@@ -484,7 +674,8 @@ class GameSimulationEngine:
 
                 game = self._simulate_single_game(
                     games_played + 1, config, home_team, away_team,
-                    h_xg, a_xg, players
+                    h_xg, a_xg, players,
+                    home_ice_contexts if is_home_game else away_ice_contexts,
                 )
 
                 if is_home_game:
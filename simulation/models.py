@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -179,6 +180,18 @@ class SimulatedGame:
         return abs(self.goal_differential) <= 1 or self.went_to_overtime
 
 
+def _first_seen_counts(keys: np.ndarray) -> list[tuple[int, int]]:
+    """Distinct non-negative integer keys with their counts, in first-seen order."""
+    if keys.size == 0:
+        return []
+    counts = np.bincount(keys)
+    first_seen = np.full(counts.size, keys.size)
+    np.minimum.at(first_seen, keys, np.arange(keys.size))
+    present = np.flatnonzero(counts)
+    present = present[np.argsort(first_seen[present], kind="stable")]
+    return list(zip(present.tolist(), counts[present].tolist()))
+
+
 @dataclass
 class ScoreDistribution:
     """Distribution of scores from simulation."""
@@ -206,6 +219,34 @@ class ScoreDistribution:
             self.total_goals_distribution.get(total, 0) + 1
         )
 
+    def add_results(self, home_scores: np.ndarray, away_scores: np.ndarray) -> None:
+        """
+        Add many game results at once.
+
+        Equivalent to calling add_result for each pair in order, including
+        the order in which new scores are first recorded.
+
+        Args:
+            home_scores: Home final scores (non-negative integer array)
+            away_scores: Away final scores (non-negative integer array, same length)
+        """
+        home_scores = np.asarray(home_scores, dtype=np.int64)
+        away_scores = np.asarray(away_scores, dtype=np.int64)
+
+        # Encode each (home, away) score as one integer key
+        stride = int(away_scores.max(initial=0)) + 1
+        for key, count in _first_seen_counts(home_scores * stride + away_scores):
+            score = divmod(key, stride)
+            self.score_counts[score] = self.score_counts.get(score, 0) + count
+
+        for distribution, values in (
+            (self.home_goals_distribution, home_scores),
+            (self.away_goals_distribution, away_scores),
+            (self.total_goals_distribution, home_scores + away_scores),
+        ):
+            for value, count in _first_seen_counts(values):
+                distribution[value] = distribution.get(value, 0) + count
+
     def most_likely_score(self) -> tuple[int, int]:
         """Get the most likely final score."""
         if not self.score_counts:
@@ -33,6 +33,8 @@ from src.analytics.clutch_analysis import (
     ClutchLevel,
     ClutchMetrics,
     ClutchPerformerRanking,
+    Recommendation,
+    RecommendationTag,
     StaminaAnalyzer,
     StaminaMetrics,
     FatigueLevel,
@@ -67,6 +69,8 @@ __all__ = [
     "StaminaAnalyzer",
     "StaminaMetrics",
     "FatigueLevel",
+    "Recommendation",
+    "RecommendationTag",
     # Team Resilience
     "TeamResilienceAnalyzer",
     "TeamResilienceMetrics",
@@ -10,10 +10,13 @@ Provides comprehensive analysis of clutch performance and fatigue patterns:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntFlag
+from operator import attrgetter
 from typing import Any, Iterable
 
+import numpy as np
 from loguru import logger
 
 
@@ -37,7 +40,31 @@ class FatigueLevel(Enum):
     SEVERE = "severe"  # > 35% decline
 
 
-@dataclass
+class RecommendationTag(IntFlag):
+    """Topics a usage recommendation covers, combinable as bit flags."""
+
+    NONE = 0
+    THIRD_PERIOD = 1 << 0
+    LATE_GAME = 1 << 1
+    OVERTIME = 1 << 2
+    ICE_TIME = 1 << 3
+    MATCHUPS = 1 << 4
+    ROLE = 1 << 5
+    INSUFFICIENT_DATA = 1 << 6
+
+
+class Recommendation(str):
+    """A usage recommendation: the recommendation text, plus its topic tags."""
+
+    tags: RecommendationTag
+
+    def __new__(cls, text: str, tags: RecommendationTag = RecommendationTag.NONE) -> Recommendation:
+        recommendation = super().__new__(cls, text)
+        recommendation.tags = tags
+        return recommendation
+
+
+@dataclass(slots=True)
 class ClutchMetrics:
     """Comprehensive clutch performance metrics for a player."""
 
@@ -73,7 +100,7 @@ class ClutchMetrics:
             self.late_game_points = self.late_game_goals + self.late_game_assists
 
 
-@dataclass
+@dataclass(slots=True)
 class StaminaMetrics:
     """Stamina and fatigue metrics for a player."""
 
@@ -107,7 +134,7 @@ class StaminaMetrics:
     back_to_back_decline: float = 0.0  # Performance drop in B2B games
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamResilienceMetrics:
     """Team-level metrics for resilience vs collapse patterns."""
 
@@ -145,6 +172,26 @@ class ClutchPerformerRanking:
     key_stats: dict[str, Any] = field(default_factory=dict)
 
 
+# (ClutchMetrics field, weight key) pairs summed into the raw clutch score, in
+# the order calculate_clutch_score adds them. lead_protecting_plus_minus is
+# clamped at zero before weighting.
+_CLUTCH_SCORE_TERMS = (
+    ("game_winning_goals", "game_winning_goal"),
+    ("game_tying_goals", "game_tying_goal"),
+    ("overtime_goals", "overtime_goal"),
+    ("shootout_goals", "shootout_goal"),
+    ("late_game_goals", "late_game_goal"),
+    ("late_game_assists", "late_game_assist"),
+    ("close_game_goals", "close_game_goal"),
+    ("close_game_assists", "close_game_assist"),
+    ("must_score_goals", "must_score_goal"),
+    ("lead_protecting_plus_minus", "lead_protecting_plus"),
+)
+_clutch_score_inputs = attrgetter(
+    *(attr for attr, _ in _CLUTCH_SCORE_TERMS), "games_played"
+)
+
+
 class ClutchAnalyzer:
     """
     Analyzer for clutch performance metrics.
@@ -183,6 +230,12 @@ class ClutchAnalyzer:
         self.weights = {**self.DEFAULT_WEIGHTS, **(weights or {})}
         self.player_metrics: dict[int, ClutchMetrics] = {}
 
+        # Ascending score cutoffs; a score reaching cutoff i (and not i + 1)
+        # is classified as level i + 1, below the first as POOR
+        ordered = sorted(self.CLUTCH_THRESHOLDS.items(), key=lambda item: item[1])
+        self._clutch_cutoffs = tuple(cutoff for _, cutoff in ordered)
+        self._clutch_levels = (ClutchLevel.POOR, *(level for level, _ in ordered))
+
     def record_game_winning_goal(self, player_id: int) -> None:
         """Record a game-winning goal for a player."""
         metrics = self._get_or_create_metrics(player_id)
@@ -217,6 +270,50 @@ class ClutchAnalyzer:
         metrics.close_game_points = metrics.close_game_goals + metrics.close_game_assists
         metrics.close_game_plus_minus += plus_minus
 
+    def ingest_game_winning_goals(self, player_ids: Iterable[int]) -> None:
+        """
+        Record a batch of game-winning goals, one per entry in player_ids.
+
+        Goals are tallied per player first, so each player's metrics are
+        updated once however many goals they appear with.
+
+        Args:
+            player_ids: Scorer of each game-winning goal (repeats allowed)
+        """
+        ids, counts = np.unique(np.fromiter(player_ids, dtype=np.int64), return_counts=True)
+        for player_id, count in zip(ids.tolist(), counts.tolist()):
+            self._get_or_create_metrics(player_id).game_winning_goals += count
+
+    def ingest_late_game_points(
+        self,
+        player_ids: Iterable[int],
+        goals: Iterable[int],
+        assists: Iterable[int],
+    ) -> None:
+        """
+        Record a batch of late game points.
+
+        Args:
+            player_ids: Player ID of each entry (repeats allowed)
+            goals: Late game goals per entry
+            assists: Late game assists per entry
+        """
+        ids, rows = np.unique(np.fromiter(player_ids, dtype=np.int64), return_inverse=True)
+        goal_totals = np.bincount(
+            rows, weights=np.fromiter(goals, dtype=np.float64), minlength=ids.size
+        ).astype(np.int64)
+        assist_totals = np.bincount(
+            rows, weights=np.fromiter(assists, dtype=np.float64), minlength=ids.size
+        ).astype(np.int64)
+
+        for player_id, player_goals, player_assists in zip(
+            ids.tolist(), goal_totals.tolist(), assist_totals.tolist()
+        ):
+            metrics = self._get_or_create_metrics(player_id)
+            metrics.late_game_goals += player_goals
+            metrics.late_game_assists += player_assists
+            metrics.late_game_points = metrics.late_game_goals + metrics.late_game_assists
+
     def ingest_player_metrics(self, metrics: ClutchMetrics) -> None:
         """Ingest pre-calculated clutch metrics for a player."""
         self.player_metrics[metrics.player_id] = metrics
@@ -274,28 +371,97 @@ class ClutchAnalyzer:
         Returns:
             Sorted list of ClutchPerformerRanking objects
         """
+        ranked = [
+            metrics
+            for metrics in map(self.player_metrics.get, player_ids)
+            if metrics is not None
+        ]
+        if not ranked:
+            return []
+
+        scores = self._score_and_classify(ranked)
+
+        # Keep every player scoring at least the limit-th best score, then
+        # stable-sort those (ties keep input order, as with list.sort)
+        if 0 < limit < len(ranked):
+            cutoff = np.partition(scores, len(ranked) - limit)[len(ranked) - limit]
+            candidates = np.flatnonzero(scores >= cutoff)
+        else:
+            candidates = np.arange(len(ranked))
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:limit]
+
         rankings = []
-        for player_id in player_ids:
-            score = self.calculate_clutch_score(player_id)
-            metrics = self.player_metrics.get(player_id)
-
-            if metrics:
-                rankings.append(
-                    ClutchPerformerRanking(
-                        player_id=player_id,
-                        name=f"Player_{player_id}",  # Name would come from player model
-                        clutch_score=score,
-                        clutch_level=self._classify_clutch_level(score),
-                        key_stats={
-                            "game_winning_goals": metrics.game_winning_goals,
-                            "overtime_goals": metrics.overtime_goals,
-                            "late_game_points": metrics.late_game_points,
-                        },
-                    )
+        for row in order.tolist():
+            metrics = ranked[row]
+            rankings.append(
+                ClutchPerformerRanking(
+                    player_id=metrics.player_id,
+                    name=f"Player_{metrics.player_id}",  # Name would come from player model
+                    clutch_score=metrics.clutch_score,
+                    clutch_level=metrics.clutch_level,
+                    key_stats={
+                        "game_winning_goals": metrics.game_winning_goals,
+                        "overtime_goals": metrics.overtime_goals,
+                        "late_game_points": metrics.late_game_points,
+                    },
                 )
+            )
+        return rankings
+
+    def classify_players(self, player_ids: Iterable[int]) -> list[ClutchLevel]:
+        """
+        Classify several players' clutch performance levels at once.
+
+        Args:
+            player_ids: Player IDs to classify
+
+        Returns:
+            ClutchLevel per player ID, in input order (players without
+            metrics score 0.0, as with classify_player)
+        """
+        player_ids = list(player_ids)
+        known = [m for m in map(self.player_metrics.get, player_ids) if m is not None]
+        scores = dict.fromkeys(player_ids, 0.0)
+        scores.update(
+            zip((m.player_id for m in known), self._score_and_classify(known).tolist())
+        )
+
+        player_scores = np.fromiter(map(scores.get, player_ids), dtype=np.float64)
+        levels = np.searchsorted(self._clutch_cutoffs, player_scores, side="right")
+        return [self._clutch_levels[i] for i in levels.tolist()]
+
+    def _score_and_classify(self, ranked: list[ClutchMetrics]) -> np.ndarray:
+        """
+        Compute clutch scores for many players in one vectorized pass.
 
-        rankings.sort(key=lambda r: r.clutch_score, reverse=True)
-        return rankings[:limit]
+        Stores each score and level on its ClutchMetrics, as
+        calculate_clutch_score does.
+
+        Args:
+            ranked: Metrics of the players to score
+
+        Returns:
+            float64 array of normalized clutch scores, aligned with ranked
+        """
+        if not ranked:
+            return np.zeros(0)
+
+        # One row per player: the weighted stats followed by games played
+        table = np.array([_clutch_score_inputs(m) for m in ranked], dtype=np.float64)
+        np.maximum(table[:, -2], 0, out=table[:, -2])  # lead_protecting_plus_minus
+
+        # Accumulate term by term, in calculate_clutch_score's order, so the
+        # scores match the scalar path exactly
+        raw_scores = np.zeros(len(ranked))
+        for column, (_, weight_key) in zip(table.T, _CLUTCH_SCORE_TERMS):
+            raw_scores += column * self.weights[weight_key]
+        scores = raw_scores / np.maximum(table[:, -1], 1)
+
+        levels = np.searchsorted(self._clutch_cutoffs, scores, side="right")
+        for metrics, score, level in zip(ranked, scores.tolist(), levels.tolist()):
+            metrics.clutch_score = score
+            metrics.clutch_level = self._clutch_levels[level]
+        return scores
 
     def get_metrics(self, player_id: int) -> ClutchMetrics | None:
         """Get clutch metrics for a player."""
@@ -309,15 +475,7 @@ class ClutchAnalyzer:
 
     def _classify_clutch_level(self, score: float) -> ClutchLevel:
         """Classify clutch level based on score."""
-        if score >= self.CLUTCH_THRESHOLDS[ClutchLevel.ELITE]:
-            return ClutchLevel.ELITE
-        elif score >= self.CLUTCH_THRESHOLDS[ClutchLevel.STRONG]:
-            return ClutchLevel.STRONG
-        elif score >= self.CLUTCH_THRESHOLDS[ClutchLevel.AVERAGE]:
-            return ClutchLevel.AVERAGE
-        elif score >= self.CLUTCH_THRESHOLDS[ClutchLevel.BELOW_AVERAGE]:
-            return ClutchLevel.BELOW_AVERAGE
-        return ClutchLevel.POOR
+        return self._clutch_levels[bisect_right(self._clutch_cutoffs, score)]
 
 
 class StaminaAnalyzer:
@@ -340,6 +498,12 @@ class StaminaAnalyzer:
         """Initialize the stamina analyzer."""
         self.player_metrics: dict[int, StaminaMetrics] = {}
 
+        # Ascending indicator cutoffs; an indicator reaching cutoff i (and not
+        # i + 1) is classified as level i + 1, below the first as SEVERE
+        ordered = sorted(self.FATIGUE_THRESHOLDS.items(), key=lambda item: item[1])
+        self._fatigue_cutoffs = tuple(cutoff for _, cutoff in ordered)
+        self._fatigue_levels = (FatigueLevel.SEVERE, *(level for level, _ in ordered))
+
     def ingest_segment_stats(
         self,
         player_id: int,
@@ -483,7 +647,7 @@ class StaminaAnalyzer:
         vulnerable.sort(key=lambda x: x[1])
         return vulnerable
 
-    def get_late_game_recommendations(self, player_id: int) -> list[str]:
+    def get_late_game_recommendations(self, player_id: int) -> list[Recommendation]:
         """
         Get usage recommendations for late game situations.
 
@@ -491,11 +655,16 @@ class StaminaAnalyzer:
             player_id: Player ID
 
         Returns:
-            List of recommendation strings
+            List of recommendation strings; each also carries ``tags`` to
+            filter on rather than matching the text
         """
         metrics = self.player_metrics.get(player_id)
         if not metrics:
-            return ["Insufficient data for recommendations"]
+            return [
+                Recommendation(
+                    "Insufficient data for recommendations", RecommendationTag.INSUFFICIENT_DATA
+                )
+            ]
 
         recommendations = []
         fatigue = self.calculate_fatigue_indicator(player_id)
@@ -504,23 +673,39 @@ class StaminaAnalyzer:
         if level in (FatigueLevel.HIGH, FatigueLevel.SEVERE):
             recommendations.extend(
                 [
-                    "Limit ice time in third period",
-                    "Avoid deploying in crucial late-game situations",
-                    "Consider as early/mid game specialist",
+                    Recommendation(
+                        "Limit ice time in third period",
+                        RecommendationTag.THIRD_PERIOD | RecommendationTag.ICE_TIME,
+                    ),
+                    Recommendation(
+                        "Avoid deploying in crucial late-game situations",
+                        RecommendationTag.LATE_GAME,
+                    ),
+                    Recommendation(
+                        "Consider as early/mid game specialist", RecommendationTag.ROLE
+                    ),
                 ]
             )
         elif level == FatigueLevel.MODERATE:
             recommendations.extend(
                 [
-                    "Monitor ice time in late game",
-                    "Use fresh legs for key matchups in third period",
+                    Recommendation(
+                        "Monitor ice time in late game",
+                        RecommendationTag.LATE_GAME | RecommendationTag.ICE_TIME,
+                    ),
+                    Recommendation(
+                        "Use fresh legs for key matchups in third period",
+                        RecommendationTag.THIRD_PERIOD | RecommendationTag.MATCHUPS,
+                    ),
                 ]
             )
         elif level in (FatigueLevel.MINIMAL, FatigueLevel.LOW):
             recommendations.extend(
                 [
-                    "Strong candidate for late game deployment",
-                    "Consider for overtime situations",
+                    Recommendation(
+                        "Strong candidate for late game deployment", RecommendationTag.LATE_GAME
+                    ),
+                    Recommendation("Consider for overtime situations", RecommendationTag.OVERTIME),
                 ]
             )
 
@@ -538,15 +723,7 @@ class StaminaAnalyzer:
 
     def _classify_fatigue_level(self, fatigue_indicator: float) -> FatigueLevel:
         """Classify fatigue level based on indicator."""
-        if fatigue_indicator >= self.FATIGUE_THRESHOLDS[FatigueLevel.MINIMAL]:
-            return FatigueLevel.MINIMAL
-        elif fatigue_indicator >= self.FATIGUE_THRESHOLDS[FatigueLevel.LOW]:
-            return FatigueLevel.LOW
-        elif fatigue_indicator >= self.FATIGUE_THRESHOLDS[FatigueLevel.MODERATE]:
-            return FatigueLevel.MODERATE
-        elif fatigue_indicator >= self.FATIGUE_THRESHOLDS[FatigueLevel.HIGH]:
-            return FatigueLevel.HIGH
-        return FatigueLevel.SEVERE
+        return self._fatigue_levels[bisect_right(self._fatigue_cutoffs, fatigue_indicator)]
 
 
 class TeamResilienceAnalyzer:
@@ -572,6 +749,30 @@ class TeamResilienceAnalyzer:
             metrics.leads_blown += 1
         self._update_rates(team_id)
 
+    def ingest_lead_results(self, team_ids: Iterable[int], held: Iterable[bool]) -> None:
+        """
+        Record a batch of lead results.
+
+        Results are tallied per team first, so rates are recomputed once per
+        team rather than once per game.
+
+        Args:
+            team_ids: Team that held a lead in each game (repeats allowed)
+            held: Whether each lead was held
+        """
+        ids, rows = np.unique(np.fromiter(team_ids, dtype=np.int64), return_inverse=True)
+        held_mask = np.fromiter(held, dtype=bool)
+        held_counts = np.bincount(rows[held_mask], minlength=ids.size)
+        blown_counts = np.bincount(rows[~held_mask], minlength=ids.size)
+
+        for team_id, leads_held, leads_blown in zip(
+            ids.tolist(), held_counts.tolist(), blown_counts.tolist()
+        ):
+            metrics = self._get_or_create_metrics(team_id)
+            metrics.leads_held += leads_held
+            metrics.leads_blown += leads_blown
+            self._update_rates(team_id)
+
     def record_comeback_result(self, team_id: int, completed: bool) -> None:
         """Record whether a team completed a comeback."""
         metrics = self._get_or_create_metrics(team_id)
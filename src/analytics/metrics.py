@@ -9,6 +9,8 @@ Calculates advanced hockey statistics including:
 - Per-60 minute rates
 """
 
+import math
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -30,7 +32,7 @@ class ShotAttempt:
     strength: str = "5v5"  # "5v5", "5v4", "4v5", etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class CorsiStats:
     """Corsi statistics for a player or team."""
 
@@ -104,7 +106,7 @@ class CorsiStats:
         return self.corsi_against / (self.time_on_ice_seconds / 3600)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpectedGoalsStats:
     """Expected goals statistics."""
 
@@ -137,7 +139,7 @@ class ExpectedGoalsStats:
         return self.xg_for - self.xg_against
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneMetrics:
     """Zone-specific metrics for a player or team."""
 
@@ -154,6 +156,33 @@ class ZoneMetrics:
         return self.goals - self.expected_goals
 
 
+def _group_counts(
+    keys: np.ndarray,
+    *flags: np.ndarray,
+    weights: np.ndarray | None = None,
+) -> Iterable[tuple[Any, ...]]:
+    """
+    Total boolean flags (and optional weights) per distinct key.
+
+    Args:
+        keys: Integer key per row
+        flags: Boolean arrays aligned with keys
+        weights: Optional float array aligned with keys
+
+    Returns:
+        Iterable of (key, row count, flag totals..., [weight total]) tuples
+    """
+    unique_keys, rows = np.unique(keys, return_inverse=True)
+    columns = [np.bincount(rows, minlength=unique_keys.size).tolist()]
+    columns += [
+        np.bincount(rows, weights=flag, minlength=unique_keys.size).astype(np.int64).tolist()
+        for flag in flags
+    ]
+    if weights is not None:
+        columns.append(np.bincount(rows, weights=weights, minlength=unique_keys.size).tolist())
+    return zip(unique_keys.tolist(), *columns)
+
+
 class MetricsCalculator:
     """
     Calculator for advanced hockey statistics.
@@ -166,6 +195,16 @@ class MetricsCalculator:
     XG_ANGLE_PENALTY = 0.3
     XG_BASE_RATE = 0.08
 
+    # Base xG by distance band: (upper distance bound in feet, rate), nearest
+    # first; shots beyond the last bound use XG_LONG_RANGE_RATE
+    XG_DISTANCE_BANDS = ((10, 0.25), (20, 0.12), (35, 0.06), (50, 0.03))
+    XG_LONG_RANGE_RATE = 0.01
+    XG_MAX = 0.95
+
+    # Integer |x| and |y| bounds covered by the precomputed base xG table
+    XG_LUT_MAX_X = 100
+    XG_LUT_MAX_Y = 43
+
     # Shot type xG modifiers
     # Note: Keys must match normalized names from shot_data.py SHOT_TYPE_MAP
     SHOT_TYPE_MODIFIERS = {
@@ -184,6 +223,7 @@ class MetricsCalculator:
     # Rebound and rush modifiers
     REBOUND_MODIFIER = 1.3
     RUSH_MODIFIER = 1.2
+    POWER_PLAY_MODIFIER = 1.15
 
     def __init__(self) -> None:
         """Initialize the metrics calculator."""
@@ -222,32 +262,14 @@ class MetricsCalculator:
         if x is None or y is None:
             return self.XG_BASE_RATE
 
-        # Normalize to offensive zone
+        # Coordinates are symmetric about both axes, so integer positions are
+        # served from the per-class table; anything else is computed live
         x = abs(x)
-        goal_x = 89
-        goal_y = 0
-
-        # Calculate distance to goal
-        distance = np.sqrt((goal_x - x) ** 2 + y ** 2)
-
-        # Calculate angle to goal (0 = straight on, pi/2 = from side)
-        angle = np.arctan2(abs(y), max(goal_x - x, 0.1))
-
-        # Base xG from distance
-        if distance < 10:
-            base_xg = 0.25
-        elif distance < 20:
-            base_xg = 0.12
-        elif distance < 35:
-            base_xg = 0.06
-        elif distance < 50:
-            base_xg = 0.03
+        y = abs(y)
+        if x <= self.XG_LUT_MAX_X and y <= self.XG_LUT_MAX_Y and x == int(x) and y == int(y):
+            xg = self._base_xg_table()[int(x)][int(y)]
         else:
-            base_xg = 0.01
-
-        # Angle penalty
-        angle_factor = max(0.3, 1 - (angle / (np.pi / 2)) * self.XG_ANGLE_PENALTY)
-        xg = base_xg * angle_factor
+            xg = self._base_xg(x, y)
 
         # Shot type modifier
         if shot_type:
@@ -260,10 +282,122 @@ class MetricsCalculator:
         if is_rush:
             xg *= self.RUSH_MODIFIER
         if is_power_play:
-            xg *= 1.15
+            xg *= self.POWER_PLAY_MODIFIER
 
         # Cap at reasonable maximum
-        return min(xg, 0.95)
+        return min(xg, self.XG_MAX)
+
+    def _base_xg(self, x: float, y: float) -> float:
+        """
+        Base xG from shot location alone, before any modifiers.
+
+        Args:
+            x: Absolute X coordinate (goal at x=89)
+            y: Absolute Y coordinate
+
+        Returns:
+            Distance band rate scaled by the angle factor
+        """
+        # Scalar math via the math module: numpy ufuncs on Python floats cost
+        # far more in dispatch than the arithmetic itself
+        goal_x = 89
+        dx = goal_x - x
+
+        # Calculate distance to goal
+        distance = math.sqrt(dx**2 + y**2)
+
+        # Calculate angle to goal (0 = straight on, pi/2 = from side)
+        angle = math.atan2(y, max(dx, 0.1))
+
+        # Base xG from distance
+        base_xg = self.XG_LONG_RANGE_RATE
+        for max_distance, rate in self.XG_DISTANCE_BANDS:
+            if distance < max_distance:
+                base_xg = rate
+                break
+
+        # Angle penalty
+        angle_factor = max(0.3, 1 - (angle / (math.pi / 2)) * self.XG_ANGLE_PENALTY)
+        return base_xg * angle_factor
+
+    def _base_xg_table(self) -> list[list[float]]:
+        """
+        Base xG for every integer (|x|, |y|) on the rink, built once per class.
+
+        Entries come from _base_xg itself, so table lookups match the live
+        computation exactly. Subclasses that change the model parameters get
+        their own table.
+
+        Returns:
+            Nested list indexed as table[|x|][|y|]
+        """
+        cls = type(self)
+        table = cls.__dict__.get("_xg_table")
+        if table is None:
+            table = [
+                [self._base_xg(float(ix), float(iy)) for iy in range(self.XG_LUT_MAX_Y + 1)]
+                for ix in range(self.XG_LUT_MAX_X + 1)
+            ]
+            cls._xg_table = table
+        return table
+
+    def calculate_shot_xg_batch(
+        self,
+        x: Any,
+        y: Any,
+        shot_types: Iterable[str | None] | None = None,
+        is_rebound: Any = False,
+        is_rush: Any = False,
+        is_power_play: Any = False,
+    ) -> np.ndarray:
+        """
+        Calculate expected goals for many shots at once.
+
+        Vectorized equivalent of calculate_shot_xg; missing coordinates
+        (NaN) get XG_BASE_RATE.
+
+        Args:
+            x: X coordinates (array-like, goal at x=89)
+            y: Y coordinates (array-like, same length)
+            shot_types: Shot type per shot (None entries get no modifier)
+            is_rebound: Rebound flags (array-like or a single bool)
+            is_rush: Rush flags (array-like or a single bool)
+            is_power_play: Power play flags (array-like or a single bool)
+
+        Returns:
+            float64 array of xG values (0-1)
+        """
+        x = np.abs(np.asarray(x, dtype=np.float64))
+        y = np.asarray(y, dtype=np.float64)
+        dx = 89 - x
+
+        distance = np.sqrt(dx**2 + y**2)
+        angle = np.arctan2(np.abs(y), np.maximum(dx, 0.1))
+
+        bands = self.XG_DISTANCE_BANDS
+        base_xg = np.select(
+            [distance < max_distance for max_distance, _ in bands],
+            [rate for _, rate in bands],
+            default=self.XG_LONG_RANGE_RATE,
+        )
+        angle_factor = np.maximum(0.3, 1 - (angle / (np.pi / 2)) * self.XG_ANGLE_PENALTY)
+        xg = base_xg * angle_factor
+
+        if shot_types is not None:
+            modifiers = self.SHOT_TYPE_MODIFIERS
+            xg *= np.fromiter(
+                (modifiers.get(t.lower(), 1.0) if t else 1.0 for t in shot_types),
+                dtype=np.float64,
+                count=xg.size,
+            )
+
+        xg = np.where(is_rebound, xg * self.REBOUND_MODIFIER, xg)
+        xg = np.where(is_rush, xg * self.RUSH_MODIFIER, xg)
+        xg = np.where(is_power_play, xg * self.POWER_PLAY_MODIFIER, xg)
+
+        np.minimum(xg, self.XG_MAX, out=xg)
+        xg[np.isnan(x) | np.isnan(y)] = self.XG_BASE_RATE
+        return xg
 
     def process_shot_attempt(
         self,
@@ -331,6 +465,151 @@ class MetricsCalculator:
 
         return xg
 
+    def process_shot_attempts_batch(
+        self,
+        event_types: Sequence[str],
+        team_ids: Sequence[int],
+        opponent_ids: Sequence[int],
+        player_ids: Sequence[int | None] | None = None,
+        x: Sequence[float | None] | None = None,
+        y: Sequence[float | None] | None = None,
+        shot_types: Sequence[str | None] | None = None,
+        strengths: Sequence[str] | None = None,
+        is_rebound: Any = False,
+        is_rush: Any = False,
+        zones: Sequence[str | None] | None = None,
+    ) -> np.ndarray:
+        """
+        Process many shot attempts at once.
+
+        Produces the same stats as calling process_shot_attempt for each
+        attempt in order (up to floating-point summation order in the xG
+        totals), but computes xG in one vectorized pass and updates each
+        team's and player's stats once with per-entity totals.
+
+        Args:
+            event_types: "goal", "shot", "blocked" or "missed" per attempt
+            team_ids: Shooting team ID per attempt
+            opponent_ids: Defending team ID per attempt
+            player_ids: Shooter player ID per attempt (None entries skipped)
+            x, y: Shot coordinates per attempt (None for unknown)
+            shot_types: Shot type per attempt
+            strengths: Game strength state per attempt (default "5v5")
+            is_rebound: Rebound flags (array-like or a single bool)
+            is_rush: Rush flags (array-like or a single bool)
+            zones: Ice zone name per attempt
+
+        Returns:
+            float64 array of expected goals values, one per attempt
+        """
+        n = len(event_types)
+        if n == 0:
+            return np.zeros(0)
+
+        missing = np.full(n, np.nan)
+        is_power_play = (
+            np.fromiter((s in ("5v4", "5v3", "4v3") for s in strengths), dtype=bool, count=n)
+            if strengths is not None
+            else False
+        )
+        xg = self.calculate_shot_xg_batch(
+            missing if x is None else np.array(x, dtype=np.float64),
+            missing if y is None else np.array(y, dtype=np.float64),
+            shot_types,
+            is_rebound,
+            is_rush,
+            is_power_play,
+        )
+
+        event_types = np.asarray(event_types)
+        is_goal = event_types == "goal"
+        is_blocked = event_types == "blocked"
+        is_missed = event_types == "missed"
+        is_shot = is_goal | (event_types == "shot")
+        unblocked = ~is_blocked
+
+        team_ids = np.fromiter(team_ids, dtype=np.int64, count=n)
+        opponent_ids = np.fromiter(opponent_ids, dtype=np.int64, count=n)
+
+        # Team Corsi: shooting side, then defending side
+        for team_id, attempts, goals, shots, blocked, missed in _group_counts(
+            team_ids, is_goal, is_shot, is_blocked, is_missed
+        ):
+            stats = self._ensure_team_corsi(team_id)
+            stats.corsi_for += attempts
+            stats.goals_for += goals
+            stats.shots_for += shots
+            stats.blocked_against += blocked
+            stats.missed_for += missed
+        for team_id, attempts, goals, shots, blocked, missed in _group_counts(
+            opponent_ids, is_goal, is_shot, is_blocked, is_missed
+        ):
+            stats = self._ensure_team_corsi(team_id)
+            stats.corsi_against += attempts
+            stats.goals_against += goals
+            stats.shots_against += shots
+            stats.blocked_for += blocked
+            stats.missed_against += missed
+
+        # Team xG (unblocked attempts only)
+        for team_id, attempts, goals, xg_total in _group_counts(
+            team_ids[unblocked], is_goal[unblocked], weights=xg[unblocked]
+        ):
+            stats = self._ensure_team_xg(team_id)
+            stats.xg_for += xg_total
+            stats.shots_for += attempts
+            stats.goals_for += goals
+        for team_id, attempts, goals, xg_total in _group_counts(
+            opponent_ids[unblocked], is_goal[unblocked], weights=xg[unblocked]
+        ):
+            stats = self._ensure_team_xg(team_id)
+            stats.xg_against += xg_total
+            stats.shots_against += attempts
+            stats.goals_against += goals
+
+        if player_ids is None:
+            return xg
+
+        has_player = np.fromiter((pid is not None for pid in player_ids), dtype=bool, count=n)
+        shooters = np.fromiter(
+            (pid if pid is not None else -1 for pid in player_ids), dtype=np.int64, count=n
+        )
+
+        # Player Corsi
+        for player_id, attempts, goals, shots, blocked, missed in _group_counts(
+            shooters[has_player],
+            is_goal[has_player],
+            is_shot[has_player],
+            is_blocked[has_player],
+            is_missed[has_player],
+        ):
+            stats = self._ensure_player_corsi(player_id)
+            stats.corsi_for += attempts
+            stats.goals_for += goals
+            stats.shots_for += shots
+            stats.blocked_against += blocked
+            stats.missed_for += missed
+
+        # Player xG (unblocked attempts only)
+        counted = has_player & unblocked
+        for player_id, _, shots, goals, xg_total in _group_counts(
+            shooters[counted], is_shot[counted], is_goal[counted], weights=xg[counted]
+        ):
+            stats = self._ensure_player_xg(player_id)
+            stats.xg_for += xg_total
+            stats.shots_for += shots
+            stats.goals_for += goals
+
+        # Zone metrics
+        if zones is not None:
+            for i in np.flatnonzero(has_player).tolist():
+                if zones[i]:
+                    self._update_zone_metrics(
+                        int(shooters[i]), zones[i], bool(is_shot[i]), bool(is_goal[i]), xg[i]
+                    )
+
+        return xg
+
     def _ensure_team_corsi(self, team_id: int) -> CorsiStats:
         """Ensure team Corsi stats exist."""
         if team_id not in self.team_corsi:
@@ -9,8 +9,11 @@ Identifies and analyzes playing patterns including:
 - Clutch performance patterns
 """
 
+import math
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import itemgetter
 from typing import Any
 
 import numpy as np
@@ -51,7 +54,7 @@ class PatternMatch:
     recommendations: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SpatialPattern:
     """Pattern in spatial shot/event distribution."""
 
@@ -65,7 +68,7 @@ class SpatialPattern:
     left_side_bias: float  # >0.5 = prefers left, <0.5 = prefers right
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporalPattern:
     """Pattern in performance across time."""
 
@@ -107,6 +110,8 @@ class PatternDetector:
     SLOT_ZONES = {"slot", "inner_slot", "crease"}
     PERIMETER_ZONES = {"left_point", "right_point", "left_wing", "right_wing", "high_slot"}
     HIGH_DANGER_ZONES = {"slot", "inner_slot", "crease", "left_circle", "right_circle"}
+    LEFT_ZONES = {"left_point", "left_wing", "left_circle"}
+    RIGHT_ZONES = {"right_point", "right_wing", "right_circle"}
 
     # Thresholds for pattern detection
     STRONG_PATTERN_THRESHOLD = 0.65
@@ -137,7 +142,23 @@ class PatternDetector:
         Returns:
             SpatialPattern with analysis results
         """
-        total_shots = sum(zone_shots.values())
+        # Tally totals and zone-group counts in one pass over the dict
+        total_shots = slot_shots = perimeter_shots = left_shots = right_shots = 0
+        slot_zones = self.SLOT_ZONES
+        perimeter_zones = self.PERIMETER_ZONES
+        left_zones = self.LEFT_ZONES
+        right_zones = self.RIGHT_ZONES
+        for zone, count in zone_shots.items():
+            total_shots += count
+            if zone in slot_zones:
+                slot_shots += count
+            if zone in perimeter_zones:
+                perimeter_shots += count
+            if zone in left_zones:
+                left_shots += count
+            if zone in right_zones:
+                right_shots += count
+
         if total_shots == 0:
             return SpatialPattern(
                 entity_id=entity_id,
@@ -151,29 +172,24 @@ class PatternDetector:
             )
 
         # Find primary and secondary zones
-        sorted_zones = sorted(zone_shots.items(), key=lambda x: x[1], reverse=True)
-        primary_zone = sorted_zones[0][0] if sorted_zones else "unknown"
+        sorted_zones = sorted(zone_shots.items(), key=itemgetter(1), reverse=True)
+        primary_zone = sorted_zones[0][0]
         secondary_zone = sorted_zones[1][0] if len(sorted_zones) > 1 else None
 
-        # Calculate zone diversity (entropy-based)
-        proportions = [count / total_shots for count in zone_shots.values() if count > 0]
-        diversity = -sum(p * np.log2(p) for p in proportions if p > 0)
-        max_entropy = np.log2(len(zone_shots)) if len(zone_shots) > 1 else 1
+        # Calculate zone diversity (entropy-based); math.log2 avoids numpy
+        # ufunc dispatch on every scalar
+        diversity = 0.0
+        for count in zone_shots.values():
+            if count > 0:
+                p = count / total_shots
+                diversity -= p * math.log2(p)
+        max_entropy = math.log2(len(zone_shots)) if len(zone_shots) > 1 else 1
         normalized_diversity = diversity / max_entropy if max_entropy > 0 else 0
 
-        # Calculate slot preference
-        slot_shots = sum(zone_shots.get(z, 0) for z in self.SLOT_ZONES)
         slot_preference = slot_shots / total_shots
-
-        # Calculate perimeter preference
-        perimeter_shots = sum(zone_shots.get(z, 0) for z in self.PERIMETER_ZONES)
         perimeter_preference = perimeter_shots / total_shots
 
         # Calculate left/right bias
-        left_zones = {"left_point", "left_wing", "left_circle"}
-        right_zones = {"right_point", "right_wing", "right_circle"}
-        left_shots = sum(zone_shots.get(z, 0) for z in left_zones)
-        right_shots = sum(zone_shots.get(z, 0) for z in right_zones)
         total_sided = left_shots + right_shots
         left_bias = left_shots / total_sided if total_sided > 0 else 0.5
 
@@ -245,6 +261,74 @@ class PatternDetector:
         self.temporal_patterns[entity_id] = pattern
         return pattern
 
+    def analyze_segment_performance_batch(
+        self,
+        entity_ids: Sequence[int],
+        entity_type: str,
+        early_rates: Any,
+        mid_rates: Any,
+        late_rates: Any,
+        clutch_goals: Any = 0,
+        games: Any = 1,
+    ) -> list[TemporalPattern]:
+        """
+        Analyze segment performance for many entities at once.
+
+        Equivalent to calling analyze_segment_performance per entity with
+        each segment's points (or goals) per 60 already extracted.
+
+        Args:
+            entity_ids: Player or team IDs
+            entity_type: "player" or "team"
+            early_rates: Early game points/goals per 60, one per entity
+            mid_rates: Mid game points/goals per 60
+            late_rates: Late game points/goals per 60
+            clutch_goals: Late game-winning plus game-tying goals (scalar or array)
+            games: Late game games played (scalar or array)
+
+        Returns:
+            TemporalPattern per entity, in input order
+        """
+        n = len(entity_ids)
+        early = np.broadcast_to(np.asarray(early_rates, dtype=np.float64), n)
+        mid = np.broadcast_to(np.asarray(mid_rates, dtype=np.float64), n)
+        late = np.broadcast_to(np.asarray(late_rates, dtype=np.float64), n)
+        clutch = np.broadcast_to(np.asarray(clutch_goals, dtype=np.float64), n)
+        game_counts = np.broadcast_to(np.asarray(games, dtype=np.float64), n)
+
+        total = early + mid + late
+        avg_rate = np.where(total > 0, total / 3, 1.0)
+        early_strength = early / avg_rate
+        mid_strength = mid / avg_rate
+        late_strength = late / avg_rate
+
+        has_early = early_strength > 0
+        fatigue = np.where(has_early, late_strength / np.where(has_early, early_strength, 1.0), 1.0)
+        has_games = game_counts > 0
+        clutch_rating = np.where(has_games, clutch / np.where(has_games, game_counts, 1.0), 0.0)
+
+        patterns = [
+            TemporalPattern(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                early_game_strength=early_value,
+                mid_game_strength=mid_value,
+                late_game_strength=late_value,
+                fatigue_indicator=fatigue_value,
+                clutch_rating=clutch_value,
+            )
+            for entity_id, early_value, mid_value, late_value, fatigue_value, clutch_value in zip(
+                entity_ids,
+                early_strength.tolist(),
+                mid_strength.tolist(),
+                late_strength.tolist(),
+                fatigue.tolist(),
+                clutch_rating.tolist(),
+            )
+        ]
+        self.temporal_patterns.update(zip(entity_ids, patterns))
+        return patterns
+
     def classify_play_style(
         self,
         entity_id: int,
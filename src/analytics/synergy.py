@@ -10,8 +10,14 @@ from dataclasses import dataclass, field
 from itertools import combinations
 from typing import Iterable
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+_GOAL_EVENT_TYPES = frozenset({"goal"})
+_SHOT_EVENT_TYPES = frozenset({"shot", "goal", "missed_shot", "blocked_shot"})
+
+
+@dataclass(frozen=True, slots=True)
 class SynergyEvent:
     """Represents a shared on-ice event for synergy calculations."""
 
@@ -25,7 +31,7 @@ class SynergyEvent:
     time_on_ice_seconds: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerSynergyStats:
     """Aggregated synergy stats for a player pair."""
 
@@ -40,17 +46,41 @@ class PlayerSynergyStats:
 
     def record_event(self, event: SynergyEvent) -> None:
         """Update the stats based on a synergy event."""
+        self._add(*_event_contribution(event))
+
+    def _add(
+        self,
+        is_goal: bool,
+        is_shot: bool,
+        shot_quality: float | None,
+        segment: str | None,
+        time_on_ice_seconds: int | None,
+    ) -> None:
+        """Apply a pre-classified event contribution (see _event_contribution)."""
         self.shared_events += 1
-        if event.event_type in {"goal"}:
+        if is_goal:
             self.shared_goals += 1
-        if event.event_type in {"shot", "goal", "missed_shot", "blocked_shot"}:
+        if is_shot:
             self.shared_shots += 1
-        if event.shot_quality is not None:
-            self.shared_xg += event.shot_quality
-        if event.segment:
-            self.segment_points[event.segment] = self.segment_points.get(event.segment, 0) + 1
-        if event.time_on_ice_seconds:
-            self.time_on_ice_seconds += event.time_on_ice_seconds
+        if shot_quality is not None:
+            self.shared_xg += shot_quality
+        if segment:
+            self.segment_points[segment] = self.segment_points.get(segment, 0) + 1
+        if time_on_ice_seconds:
+            self.time_on_ice_seconds += time_on_ice_seconds
+
+
+def _event_contribution(
+    event: SynergyEvent,
+) -> tuple[bool, bool, float | None, str | None, int | None]:
+    """Classify an event once so it can be applied to every pair involved."""
+    return (
+        event.event_type in _GOAL_EVENT_TYPES,
+        event.event_type in _SHOT_EVENT_TYPES,
+        event.shot_quality,
+        event.segment,
+        event.time_on_ice_seconds,
+    )
 
 
 class SynergyAnalyzer:
@@ -96,15 +126,17 @@ class SynergyAnalyzer:
         unique_players = sorted(set(event.player_ids))
         if len(unique_players) < 2:
             return
-        for player_a, player_b in combinations(unique_players, 2):
-            key = (player_a, player_b)
-            if key not in self.pair_stats:
-                self.pair_stats[key] = PlayerSynergyStats(player_a=player_a, player_b=player_b)
-            self.pair_stats[key].record_event(event)
+        contribution = _event_contribution(event)
+        pair_stats = self.pair_stats
+        for key in combinations(unique_players, 2):
+            stats = pair_stats.get(key)
+            if stats is None:
+                stats = pair_stats[key] = PlayerSynergyStats(player_a=key[0], player_b=key[1])
+            stats._add(*contribution)
 
     def get_pair_stats(self, player_a: int, player_b: int) -> PlayerSynergyStats | None:
         """Return stored synergy stats for a player pair."""
-        key = tuple(sorted((player_a, player_b)))
+        key = (player_a, player_b) if player_a < player_b else (player_b, player_a)
         return self.pair_stats.get(key)
 
     def synergy_score(self, player_a: int, player_b: int) -> float:
@@ -125,15 +157,37 @@ class SynergyAnalyzer:
     def compatibility_matrix(self, player_ids: Iterable[int]) -> dict[int, dict[int, float]]:
         """Build a pairwise compatibility matrix for a group of players."""
         players = sorted(set(player_ids))
-        matrix: dict[int, dict[int, float]] = {player: {} for player in players}
+        matrix: dict[int, dict[int, float]] = {player: dict.fromkeys(players) for player in players}
         for player in players:
-            for other in players:
-                if player == other:
-                    matrix[player][other] = 1.0
-                else:
-                    matrix[player][other] = self.synergy_score(player, other)
+            matrix[player][player] = 1.0
+        # Scores are symmetric, so score each unordered pair once and mirror it
+        for player, other in combinations(players, 2):
+            score = self.synergy_score(player, other)
+            matrix[player][other] = score
+            matrix[other][player] = score
         return matrix
 
+    def compatibility_array(self, player_ids: Iterable[int]) -> tuple[list[int], np.ndarray]:
+        """
+        Build the compatibility matrix as a dense array.
+
+        Same values as compatibility_matrix, for callers that want to do
+        array math or plotting on the whole matrix.
+
+        Args:
+            player_ids: Players to include
+
+        Returns:
+            Tuple of (sorted unique player IDs, symmetric n x n float64 array
+            indexed in that order, with 1.0 on the diagonal)
+        """
+        players = sorted(set(player_ids))
+        n = len(players)
+        matrix = np.eye(n)
+        for i, j in combinations(range(n), 2):
+            matrix[i, j] = matrix[j, i] = self.synergy_score(players[i], players[j])
+        return players, matrix
+
     def _score_from_stats(self, stats: PlayerSynergyStats) -> float:
         """Calculate a weighted synergy score from stats."""
         goal_component = stats.shared_goals * self.weights["goal"]
@@ -5,7 +5,10 @@ Core client for interacting with the NHL Stats API.
 Handles authentication, rate limiting, caching, and request management.
 """
 
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -25,9 +28,15 @@ class RateLimiter:
         self.last_request_time: float = 0
         self.request_count: int = 0
         self.window_start: float = time.time()
+        # Serializes callers so concurrent requests still honor the spacing
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """Wait if we're hitting rate limits."""
+        with self._lock:
+            self._wait()
+
+    def _wait(self) -> None:
         current_time = time.time()
 
         # Reset window if a minute has passed
@@ -95,8 +104,14 @@ class NHLApiClient:
         else:
             self.cache = None
 
-        # Set up HTTP client with redirect following enabled
-        self.client = httpx.Client(timeout=self.timeout, follow_redirects=True)
+        # HTTP clients are checked out per request, so threads sharing this
+        # API client never use one connection pool at the same time. The
+        # disk cache needs no such handling: diskcache opens a SQLite
+        # connection per thread.
+        self._clients_lock = threading.Lock()
+        self.client = self._new_http_client()
+        self._all_clients = [self.client]
+        self._idle_clients = [self.client]
 
         logger.info("NHL API client initialized")
 
@@ -113,6 +128,25 @@ class NHLApiClient:
         with open(config_path) as f:
             return yaml.safe_load(f)
 
+    def _new_http_client(self) -> httpx.Client:
+        """Create an HTTP client with redirect following enabled."""
+        return httpx.Client(timeout=self.timeout, follow_redirects=True)
+
+    @contextmanager
+    def _http_client(self) -> Iterator[httpx.Client]:
+        """Check out an HTTP client no other thread is using, creating one if needed."""
+        with self._clients_lock:
+            client = self._idle_clients.pop() if self._idle_clients else None
+        if client is None:
+            client = self._new_http_client()
+            with self._clients_lock:
+                self._all_clients.append(client)
+        try:
+            yield client
+        finally:
+            with self._clients_lock:
+                self._idle_clients.append(client)
+
     def _get_cache_key(self, endpoint: str, params: dict[str, Any] | None = None) -> str:
         """Generate a cache key for the request."""
         key = endpoint
@@ -155,7 +189,8 @@ class NHLApiClient:
         for attempt in range(self.max_retries + 1):
             try:
                 self.rate_limiter.wait_if_needed()
-                response = self.client.get(url, params=params)
+                with self._http_client() as client:
+                    response = client.get(url, params=params)
                 response.raise_for_status()
                 data = response.json()
 
@@ -498,8 +533,10 @@ class NHLApiClient:
             logger.info("Cache cleared")
 
     def close(self) -> None:
-        """Close the HTTP client and cache."""
-        self.client.close()
+        """Close the HTTP clients and cache."""
+        with self._clients_lock:
+            for client in self._all_clients:
+                client.close()
         if self.cache is not None:
             self.cache.close()
 
@@ -15,8 +15,15 @@ from loguru import logger
 
 from src.collectors.nhl_api import NHLApiClient
 
+try:
+    import orjson
 
-@dataclass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class Shot:
     """Represents a single shot event."""
 
@@ -256,31 +263,25 @@ class ShotDataCollector:
         if not situation_code or len(situation_code) < 4:
             return None
 
-        try:
-            # Situation code format: HHAA where HH=home skaters, AA=away skaters
-            home_skaters = int(situation_code[:2])
-            away_skaters = int(situation_code[2:4])
-
-            # Determine if shooting team is home or away
-            home_team_id = play.get("homeTeamId")
-            is_home_team = team_id == home_team_id
-
-            if is_home_team:
-                own_skaters = home_skaters
-                opp_skaters = away_skaters
-            else:
-                own_skaters = away_skaters
-                opp_skaters = home_skaters
-
-            if own_skaters > opp_skaters:
-                return "pp"  # Power play
-            elif own_skaters < opp_skaters:
-                return "sh"  # Shorthanded
-            else:
-                return "even"
-
-        except (ValueError, IndexError):
+        # Situation code format: HHAA where HH=home skaters, AA=away skaters.
+        # Decode the digits arithmetically rather than slicing and int()-parsing
+        # each field; this runs once per shot play.
+        code = situation_code[:4]
+        if not (code.isdigit() and code.isascii()):
             return None
+        # Home minus away skaters, flipped below when the away team shot
+        skater_advantage = (ord(code[0]) - ord(code[2])) * 10 + ord(code[1]) - ord(code[3])
+
+        # Determine if shooting team is home or away
+        if team_id != play.get("homeTeamId"):
+            skater_advantage = -skater_advantage
+
+        if skater_advantage > 0:
+            return "pp"  # Power play
+        elif skater_advantage < 0:
+            return "sh"  # Shorthanded
+        else:
+            return "even"
 
     def save_shots(self, shots: list[Shot], path: Path | str) -> None:
         """
@@ -293,6 +294,12 @@ class ShotDataCollector:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if ORJSON_AVAILABLE:
+            # orjson serializes dataclasses natively, in field order
+            path.write_bytes(orjson.dumps(shots, option=orjson.OPT_INDENT_2))
+            logger.info(f"Saved {len(shots)} shots to {path}")
+            return
+
         # Convert dataclass instances to dictionaries
         shots_data = []
         for shot in shots:
@@ -321,7 +328,9 @@ class ShotDataCollector:
             }
             shots_data.append(shot_dict)
 
-        with open(path, "w") as f:
+        # orjson always writes UTF-8, so the fallback must too for the
+        # files to be interchangeable
+        with open(path, "w", encoding="utf-8") as f:
             json.dump(shots_data, f, indent=2)
 
         logger.info(f"Saved {len(shots)} shots to {path}")
@@ -338,8 +347,11 @@ class ShotDataCollector:
         """
         path = Path(path)
 
-        with open(path) as f:
-            shots_data = json.load(f)
+        if ORJSON_AVAILABLE:
+            shots_data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, encoding="utf-8") as f:
+                shots_data = json.load(f)
 
         shots = []
         for shot_dict in shots_data:
@@ -130,7 +130,26 @@ class SegmentProcessor:
         Args:
             segments_config_path: Path to segments configuration file.
         """
-        self.config = self._load_config(segments_config_path)
+        self._setup(self._load_config(segments_config_path))
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "SegmentProcessor":
+        """
+        Create a processor from an already-loaded segments configuration.
+
+        Args:
+            config: Configuration in the format of config/segments.yaml
+
+        Returns:
+            SegmentProcessor with empty statistics
+        """
+        processor = cls.__new__(cls)
+        processor._setup(config)
+        return processor
+
+    def _setup(self, config: dict[str, Any]) -> None:
+        """Build segment definitions and empty statistics storage for a config."""
+        self.config = config
         self.segments = self._build_segment_definitions()
 
         # Storage for statistics
@@ -13,7 +13,7 @@ import yaml
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneDefinition:
     """Definition of an ice zone."""
 
@@ -33,7 +33,7 @@ class ZoneDefinition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneStats:
     """Statistics for a single zone."""
 
@@ -54,7 +54,7 @@ class ZoneStats:
         self.shooting_percentage = self.goals / self.shots if self.shots > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerZoneProfile:
     """Zone-based profile for a player."""
 
@@ -84,7 +84,7 @@ class PlayerZoneProfile:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamZoneProfile:
     """Zone-based profile for a team."""
 
@@ -126,6 +126,32 @@ class ZoneAnalyzer:
     heat maps for players and teams.
     """
 
+    # Zones are checked in order of specificity (inner_slot before slot)
+    ZONE_PRIORITY = (
+        "inner_slot", "crease", "slot", "left_circle", "right_circle",
+        "left_wing", "right_wing", "high_slot", "left_point", "right_point",
+        "behind_net",
+    )
+
+    # Integer coordinates within these bounds (x after normalizing to the
+    # offensive zone) are resolved through a precomputed zone grid
+    ZONE_GRID_MAX_X = 100
+    ZONE_GRID_MAX_Y = 43
+
+    # ZoneStats shot type counters; unlisted shot types count as "other"
+    SHOT_TYPE_FIELDS = ("wrist_shots", "slap_shots", "snap_shots", "backhand_shots", "other_shots")
+    SHOT_TYPE_INDEX = {"wrist": 0, "slap": 1, "snap": 2, "backhand": 3}
+
+    # Zone mismatch weight per danger level (unknown levels weigh 1.0)
+    DANGER_MULTIPLIERS = {
+        "extreme": 2.0,
+        "high": 1.5,
+        "medium": 1.0,
+        "medium-low": 0.8,
+        "low": 0.5,
+        "none": 0.0,
+    }
+
     def __init__(self, zones_config_path: str | Path | None = None):
         """
         Initialize the zone analyzer.
@@ -221,20 +247,129 @@ class ZoneAnalyzer:
         # Normalize coordinates to offensive zone (positive x)
         x = abs(x)
 
-        # Check zones in order of specificity (inner_slot before slot)
-        zone_priority = [
-            "inner_slot", "crease", "slot", "left_circle", "right_circle",
-            "left_wing", "right_wing", "high_slot", "left_point", "right_point",
-            "behind_net"
-        ]
+        max_y = self.ZONE_GRID_MAX_Y
+        if x <= self.ZONE_GRID_MAX_X and -max_y <= y <= max_y and x == int(x) and y == int(y):
+            return self._zone_grid()[int(x)][int(y) + max_y]
 
-        for zone_name in zone_priority:
+        for zone_name in self.ZONE_PRIORITY:
             if zone_name in self.zones:
                 if self.zones[zone_name].contains_point(x, y):
                     return zone_name
 
         return "other"
 
+    def _zone_grid(self) -> list[list[str]]:
+        """
+        Zone name for every integer (|x|, y) point, indexed [x][y + ZONE_GRID_MAX_Y].
+
+        Built on first use and rebuilt whenever ``zones`` is reassigned.
+        """
+        return self._zone_grids()[1]
+
+    def _zone_index_grid(self) -> np.ndarray:
+        """Same as _zone_grid, as indexes into the _zone_bounds names."""
+        return self._zone_grids()[0]
+
+    def _zone_grids(self) -> tuple[np.ndarray, list[list[str]]]:
+        """Build (or fetch) the zone index grid and the matching name grid."""
+        cached = self.__dict__.get("_zone_grid_cache")
+        if cached is not None and cached[0] is self.zones:
+            return cached[1]
+
+        max_x, max_y = self.ZONE_GRID_MAX_X, self.ZONE_GRID_MAX_Y
+        columns = 2 * max_y + 1
+        xs = np.repeat(np.arange(max_x + 1, dtype=np.float64), columns)
+        ys = np.tile(np.arange(-max_y, max_y + 1, dtype=np.float64), max_x + 1)
+        index_grid = self._zone_indexes_by_bounds(xs, ys).reshape(max_x + 1, columns)
+        index_grid.flags.writeable = False
+
+        names = self._zone_bounds()[0]
+        name_grid = [[names[i] for i in row] for row in index_grid.tolist()]
+
+        entry = (index_grid, name_grid)
+        self._zone_grid_cache = (self.zones, entry)
+        return entry
+
+    def _zone_bounds(self) -> tuple[tuple[str, ...], np.ndarray]:
+        """
+        Zone names and (x_min, x_max, y_min, y_max) bounds in priority order.
+
+        The names end with "other", which has no bounds row. Built on first
+        use and rebuilt whenever ``zones`` is reassigned.
+        """
+        cached = self.__dict__.get("_zone_bounds_cache")
+        if cached is not None and cached[0] is self.zones:
+            return cached[1]
+
+        names = [name for name in self.ZONE_PRIORITY if name in self.zones]
+        bounds = np.array(
+            [
+                (zone.x_min, zone.x_max, zone.y_min, zone.y_max)
+                for zone in map(self.zones.__getitem__, names)
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        bounds.flags.writeable = False
+
+        entry = (tuple(names) + ("other",), bounds)
+        self._zone_bounds_cache = (self.zones, entry)
+        return entry
+
+    def identify_zones(self, xs: Any, ys: Any) -> list[str | None]:
+        """
+        Identify the zone of many coordinates at once.
+
+        Equivalent to calling identify_zone for each point, with NaN standing
+        in for a missing coordinate.
+
+        Args:
+            xs: X coordinates (array-like, NaN where missing)
+            ys: Y coordinates (array-like, same length, NaN where missing)
+
+        Returns:
+            Zone name per point, "other" outside all zones, None if missing
+        """
+        xs = np.abs(np.asarray(xs, dtype=np.float64))
+        ys = np.asarray(ys, dtype=np.float64)
+
+        missing = np.isnan(xs) | np.isnan(ys)
+
+        # Integer points on the rink come from the zone grid; only the rest
+        # need the (points, zones) containment test
+        max_x, max_y = self.ZONE_GRID_MAX_X, self.ZONE_GRID_MAX_Y
+        on_grid = (
+            (xs <= max_x) & (np.abs(ys) <= max_y) & (xs == np.floor(xs)) & (ys == np.floor(ys))
+        )
+        indexes = np.empty(xs.size, dtype=np.int64)
+        indexes[on_grid] = self._zone_index_grid()[
+            xs[on_grid].astype(np.int64), ys[on_grid].astype(np.int64) + max_y
+        ]
+        off_grid = ~on_grid
+        indexes[off_grid] = self._zone_indexes_by_bounds(xs[off_grid], ys[off_grid])
+
+        names = self._zone_bounds()[0]
+        return [
+            None if is_missing else names[index]
+            for index, is_missing in zip(indexes.tolist(), missing.tolist())
+        ]
+
+    def _zone_indexes_by_bounds(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Index into the _zone_bounds names for normalized (|x|, y) points."""
+        names, bounds = self._zone_bounds()
+
+        # (points, zones + "other") containment; the last column always hits,
+        # so argmax picks the highest priority zone or falls through to "other"
+        x_col = xs[:, np.newaxis]
+        y_col = ys[:, np.newaxis]
+        hits = np.ones((xs.size, len(names)), dtype=bool)
+        hits[:, :-1] = (
+            (x_col >= bounds[:, 0])
+            & (x_col <= bounds[:, 1])
+            & (y_col >= bounds[:, 2])
+            & (y_col <= bounds[:, 3])
+        )
+        return hits.argmax(axis=1)
+
     def process_shot(
         self,
         x: float | None,
@@ -399,31 +534,195 @@ class ZoneAnalyzer:
         """
         Process a batch of shots.
 
+        Equivalent to calling process_shot for each shot in order: zones are
+        identified with identify_zones and the counts are aggregated per
+        (player or team, zone) before updating the profiles once per group.
+
         Args:
             shots: List of shot dictionaries
             game_context: Optional game context with team mappings
         """
+        home_id = game_context.get("home_team_id") if game_context else None
+        away_id = game_context.get("away_team_id") if game_context else None
+
+        # One pass over the shot dicts into per-shot columns
+        columns = []
         for shot in shots:
             # Determine opponent team
             team_id = shot.get("team_id")
             if game_context and team_id:
-                home_id = game_context.get("home_team_id")
-                away_id = game_context.get("away_team_id")
                 opponent_id = away_id if team_id == home_id else home_id
             else:
                 opponent_id = 0
+            columns.append((
+                shot.get("x_coord"),
+                shot.get("y_coord"),
+                bool(shot.get("is_goal", False)),
+                self._shot_type_index(shot.get("shot_type")),
+                shot.get("shooter_id", 0),
+                team_id or 0,
+                opponent_id or 0,
+            ))
+        if not columns:
+            return
+        xs, ys, goal_col, type_col, player_col, team_col, opponent_col = zip(*columns)
+
+        zones = self.identify_zones(
+            np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64)
+        )
+        kept = [i for i, zone in enumerate(zones) if zone]
+        if not kept:
+            return
+
+        # Per-shot arrays for the shots that landed in a zone
+        zone_names = list(dict.fromkeys(zones[i] for i in kept))
+        zone_index = {zone: i for i, zone in enumerate(zone_names)}
+        zone_pct = np.array([
+            zone_def.expected_shooting_pct if (zone_def := self.zones.get(zone)) else 0.05
+            for zone in zone_names
+        ])
+        shot_zone = np.array([zone_index[zones[i]] for i in kept], dtype=np.int64)
+        pct = zone_pct[shot_zone]
+        is_goal = np.array(goal_col)[kept]
+        shot_type = np.array(type_col, dtype=np.int64)[kept]
+        # Shooter IDs may be missing (None), which process_shot keeps as a
+        # profile key, so group on dense first-seen codes instead of the IDs
+        player_codes: dict[Any, int] = {}
+        player_ids = np.array(
+            [player_codes.setdefault(player_col[i], len(player_codes)) for i in kept],
+            dtype=np.int64,
+        )
+        player_keys = list(player_codes)
+        team_arr = np.array(team_col, dtype=np.int64)[kept]
+        opponent_arr = np.array(opponent_col, dtype=np.int64)[kept]
+
+        # Player profiles
+        for row, code, zone, shot_count, goals, xg, type_counts in self._group_zone_shots(
+            player_ids, shot_zone, len(zone_names), is_goal, pct, shot_type
+        ):
+            player_id = player_keys[code]
+            profile = self.player_profiles.get(player_id)
+            if profile is None:
+                profile = self.player_profiles[player_id] = PlayerZoneProfile(
+                    player_id=player_id,
+                    player_name=shots[kept[row]].get("shooter_name", ""),
+                )
+            stats = self._add_zone_counts(
+                profile.zone_stats, zone_names[zone], shot_count, goals, xg
+            )
+            for field_name, count in zip(self.SHOT_TYPE_FIELDS, type_counts):
+                setattr(stats, field_name, getattr(stats, field_name) + count)
+            profile.total_goals += goals
+            profile.total_shots += shot_count
+            profile.total_xg += xg
+
+        # Team profiles are created in the order process_shot would create them:
+        # shooting team, then opponent, shot by shot
+        appearances = np.column_stack((team_arr, opponent_arr)).ravel()
+        _, first = np.unique(appearances, return_index=True)
+        for position in np.sort(first).tolist():
+            team_id = int(appearances[position])
+            if team_id not in self.team_profiles:
+                shooting = position % 2 == 0
+                self.team_profiles[team_id] = TeamZoneProfile(
+                    team_id=team_id,
+                    team_abbrev=shots[kept[position // 2]].get("team_abbrev", "")
+                    if shooting
+                    else "UNK",  # Will be updated when team shoots
+                )
+
+        for _, entity, zone, shot_count, goals, xg, _ in self._group_zone_shots(
+            team_arr, shot_zone, len(zone_names), is_goal, pct
+        ):
+            profile = self.team_profiles[entity]
+            self._add_zone_counts(
+                profile.offensive_zone_stats, zone_names[zone], shot_count, goals, xg
+            )
+            profile.total_goals_for += goals
+            profile.total_shots_for += shot_count
+
+        for _, entity, zone, shot_count, goals, xg, _ in self._group_zone_shots(
+            opponent_arr, shot_zone, len(zone_names), is_goal, pct
+        ):
+            profile = self.team_profiles[entity]
+            self._add_zone_counts(
+                profile.defensive_zone_stats, zone_names[zone], shot_count, goals, xg
+            )
+            profile.total_goals_against += goals
+            profile.total_shots_against += shot_count
 
-            self.process_shot(
-                x=shot.get("x_coord"),
-                y=shot.get("y_coord"),
-                is_goal=shot.get("is_goal", False),
-                shot_type=shot.get("shot_type"),
-                player_id=shot.get("shooter_id", 0),
-                player_name=shot.get("shooter_name", ""),
-                team_id=team_id or 0,
-                team_abbrev=shot.get("team_abbrev", ""),
-                opponent_team_id=opponent_id or 0,
+    def _shot_type_index(self, shot_type: str | None) -> int:
+        """Index into SHOT_TYPE_FIELDS for a shot type, -1 if not recorded."""
+        if not shot_type:
+            return -1
+        return self.SHOT_TYPE_INDEX.get(shot_type, len(self.SHOT_TYPE_FIELDS) - 1)
+
+    def _group_zone_shots(
+        self,
+        entity_ids: np.ndarray,
+        shot_zone: np.ndarray,
+        n_zones: int,
+        is_goal: np.ndarray,
+        pct: np.ndarray,
+        shot_type: np.ndarray | None = None,
+    ) -> list[tuple[int, int, int, int, int, float, list[int]]]:
+        """
+        Aggregate shots per (entity, zone) in first-seen order.
+
+        Returns:
+            (first shot row, entity ID, zone index, shots, goals, expected goals,
+            per-SHOT_TYPE_FIELDS counts) per group; counts are empty without
+            shot_type
+        """
+        _, first, inverse = np.unique(
+            entity_ids * n_zones + shot_zone, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first, kind="stable")
+        n_groups = first.size
+
+        shot_counts = np.bincount(inverse, minlength=n_groups)
+        goals = np.bincount(inverse, weights=is_goal, minlength=n_groups)
+        xg = np.bincount(inverse, weights=pct, minlength=n_groups)
+
+        n_types = len(self.SHOT_TYPE_FIELDS)
+        type_counts: list[list[int]] = [[] for _ in range(n_groups)]
+        if shot_type is not None:
+            typed = shot_type >= 0
+            type_counts = np.bincount(
+                inverse[typed] * n_types + shot_type[typed], minlength=n_groups * n_types
+            ).reshape(n_groups, n_types).tolist()
+
+        rows = first.tolist()
+        return [
+            (
+                rows[g],
+                int(entity_ids[rows[g]]),
+                int(shot_zone[rows[g]]),
+                int(shot_counts[g]),
+                int(goals[g]),
+                float(xg[g]),
+                type_counts[g],
             )
+            for g in order.tolist()
+        ]
+
+    @staticmethod
+    def _add_zone_counts(
+        zone_stats: dict[str, ZoneStats],
+        zone: str,
+        shots: int,
+        goals: int,
+        expected_goals: float,
+    ) -> ZoneStats:
+        """Add aggregated shot counts to a profile's zone stats."""
+        stats = zone_stats.get(zone)
+        if stats is None:
+            stats = zone_stats[zone] = ZoneStats()
+        stats.shots += shots
+        stats.goals += goals
+        stats.expected_goals += expected_goals
+        stats.update_shooting_percentage()
+        return stats
 
     def get_player_profile(self, player_id: int) -> PlayerZoneProfile | None:
         """Get zone profile for a player."""
@@ -523,14 +822,7 @@ class ZoneAnalyzer:
             # Mismatch: offensive strength meets defensive weakness
             # Normalize by zone danger level
             zone_def = self.zones[zone_name]
-            danger_mult = {
-                "extreme": 2.0,
-                "high": 1.5,
-                "medium": 1.0,
-                "medium-low": 0.8,
-                "low": 0.5,
-                "none": 0.0,
-            }.get(zone_def.danger_level, 1.0)
+            danger_mult = self.DANGER_MULTIPLIERS.get(zone_def.danger_level, 1.0)
 
             mismatches[zone_name] = (off_strength * def_weakness) * danger_mult
 
@@ -7,6 +7,10 @@ Provides offline fallback capability and refresh commands.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -20,7 +24,7 @@ from src.models.player import Player, PlayerPosition, PlayerStats
 from src.models.team import Team, TeamRoster, TeamStats
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStatus:
     """Status information about cached data."""
 
@@ -43,6 +47,53 @@ class CacheStatus:
         }
 
 
+class _MemoryCache:
+    """
+    Bounded in-memory LRU cache whose entries expire after a fixed TTL.
+
+    Safe to share between threads (load_team_players fills it from a pool).
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        """Return the live value for key (marking it recently used), else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> Any | None:
+        """Remove key and return its value (expired or not), else None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class DataLoader:
     """
     Data loading service with caching layer.
@@ -56,6 +107,13 @@ class DataLoader:
     ROSTER_CACHE_TTL = 43200  # 12 hours
     PLAYER_CACHE_TTL = 86400  # 24 hours
 
+    # In-memory cache bounds (the disk cache remains the full store)
+    TEAM_MEMORY_CACHE_SIZE = 64
+    PLAYER_MEMORY_CACHE_SIZE = 4096
+
+    # Concurrent player fetches when loading a roster
+    PLAYER_FETCH_WORKERS = 8
+
     # Cache key prefixes
     TEAM_PREFIX = "team:"
     ROSTER_PREFIX = "roster:"
@@ -80,9 +138,10 @@ class DataLoader:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache = Cache(str(self.cache_dir))
 
-        # In-memory cache for current session
-        self._teams: dict[int, Team] = {}
-        self._players: dict[int, Player] = {}
+        # In-memory cache for current session, bounded and expiring with the
+        # same TTLs as the disk cache
+        self._teams = _MemoryCache(self.TEAM_MEMORY_CACHE_SIZE, self.TEAM_CACHE_TTL)
+        self._players = _MemoryCache(self.PLAYER_MEMORY_CACHE_SIZE, self.PLAYER_CACHE_TTL)
 
         logger.info(f"DataLoader initialized with cache at {self.cache_dir}")
 
@@ -158,8 +217,9 @@ class DataLoader:
                 raise ValueError(f"Team not found: {team_abbrev}")
 
         # Check in-memory cache
-        if team_id in self._teams:
-            return self._teams[team_id]
+        team = self._teams.get(team_id)
+        if team is not None:
+            return team
 
         # Check disk cache
         cache_key = f"{self.TEAM_PREFIX}{team_id}"
@@ -277,8 +337,9 @@ class DataLoader:
             Player object with stats
         """
         # Check in-memory cache
-        if player_id in self._players:
-            return self._players[player_id]
+        player = self._players.get(player_id)
+        if player is not None:
+            return player
 
         # Check disk cache
         cache_key = f"{self.PLAYER_PREFIX}{player_id}"
@@ -366,10 +427,26 @@ class DataLoader:
             Dict mapping player_id to Player
         """
         players = {}
+        player_ids = team.roster.all_players
+
+        # Players not already in memory may need an API round trip each, so
+        # load those concurrently. The API client gives each in-flight
+        # request its own HTTP client and its rate limiter still spaces the
+        # actual requests
+        pending: dict[int, Future[Player]] = {}
+        missing = [pid for pid in dict.fromkeys(player_ids) if self._players.get(pid) is None]
+        if len(missing) > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=min(self.PLAYER_FETCH_WORKERS, len(missing)),
+                thread_name_prefix="player-load",
+            )
+            with executor:
+                pending = {pid: executor.submit(self.load_player, pid) for pid in missing}
 
-        for player_id in team.roster.all_players:
+        for player_id in player_ids:
             try:
-                player = self.load_player(player_id)
+                future = pending.get(player_id)
+                player = future.result() if future else self.load_player(player_id)
                 players[player_id] = player
             except Exception as e:
                 logger.warning(f"Failed to load player {player_id}: {e}")
@@ -410,17 +487,18 @@ class DataLoader:
         # Clear team from caches
         cache_key = f"{self.TEAM_PREFIX}{resolved_id}"
         self.cache.delete(cache_key)
-        self._teams.pop(resolved_id, None)
+        cached_team = self._teams.pop(resolved_id)
 
         # Clear roster from cache
         if resolved_abbrev:
             roster_key = f"{self.ROSTER_PREFIX}{resolved_abbrev.upper()}"
             self.cache.delete(roster_key)
 
-        # Get current player IDs before refresh (if we have them cached)
+        # Get current player IDs before refresh (if we have them cached), from
+        # the entry just evicted, so players who left the team are refreshed too
         old_player_ids = []
-        if resolved_id in self._teams:
-            old_player_ids = self._teams[resolved_id].roster.all_players
+        if cached_team is not None:
+            old_player_ids = cached_team.roster.all_players
 
         # Reload team (this will fetch fresh roster)
         team = self.load_team(team_id=resolved_id)
@@ -430,7 +508,7 @@ class DataLoader:
         for player_id in player_ids_to_refresh:
             player_key = f"{self.PLAYER_PREFIX}{player_id}"
             self.cache.delete(player_key)
-            self._players.pop(player_id, None)
+            self._players.pop(player_id)
 
         self.load_team_players(team)
 
@@ -0,0 +1,201 @@
+"""
+Visualization Numeric Kernels
+
+Small numeric loops used by the chart and heat map renderers. When numba
+is installed they are JIT-compiled on first call; otherwise equivalent
+NumPy implementations are used.
+"""
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Grids with more cells than this use the multi-threaded nonzero kernel
+PARALLEL_MIN_CELLS = 256 * 256
+
+
+def _lazy_njit(**options: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a kernel to be compiled with numba.njit on its first call."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        compiled: Callable[..., Any] | None = None
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            nonlocal compiled
+            if compiled is None:
+                compiled = numba.njit(**options)(func)
+            return compiled(*args)
+
+        return wrapper
+
+    return decorate
+
+
+def _cf_pct_numpy(cf: np.ndarray, ca: np.ndarray) -> np.ndarray:
+    """CF% per entry, 50.0 where there were no attempts."""
+    total = cf + ca
+    has_attempts = total > 0
+    return np.where(has_attempts, cf / np.where(has_attempts, total, 1.0) * 100.0, 50.0)
+
+
+def _rolling_mean_numpy(values: np.ndarray, window: int) -> np.ndarray:
+    """Sliding-window mean ("valid" positions only) via cumulative sums."""
+    cumsum = np.cumsum(np.insert(values, 0, 0.0))
+    return (cumsum[window:] - cumsum[:-window]) / window
+
+
+@_lazy_njit(cache=True)
+def _cf_pct_jit(cf: np.ndarray, ca: np.ndarray) -> np.ndarray:  # pragma: no cover
+    out = np.empty_like(cf)
+    for i in range(cf.size):
+        total = cf[i] + ca[i]
+        out[i] = cf[i] / total * 100.0 if total > 0 else 50.0
+    return out
+
+
+@_lazy_njit(cache=True)
+def _rolling_mean_jit(values: np.ndarray, window: int) -> np.ndarray:  # pragma: no cover
+    out = np.empty(values.size - window + 1)
+    running = 0.0
+    for i in range(window):
+        running += values[i]
+    out[0] = running / window
+    for i in range(window, values.size):
+        running += values[i] - values[i - window]
+        out[i - window + 1] = running / window
+    return out
+
+
+@_lazy_njit(cache=True)
+def _collect_nonzero_jit(grid: np.ndarray) -> tuple:  # pragma: no cover
+    rows, cols = grid.shape
+    count = 0
+    for i in range(rows):
+        for j in range(cols):
+            if grid[i, j] > 0:
+                count += 1
+
+    xs = np.empty(count)
+    ys = np.empty(count)
+    values = np.empty(count)
+    k = 0
+    for i in range(rows):
+        y = (i / rows) * 85 - 42.5
+        for j in range(cols):
+            value = grid[i, j]
+            if value > 0:
+                xs[k] = (j / cols) * 100
+                ys[k] = y
+                values[k] = value
+                k += 1
+    return xs, ys, values
+
+
+@_lazy_njit(cache=True, parallel=True)
+def _collect_nonzero_parallel_jit(grid: np.ndarray) -> tuple:  # pragma: no cover
+    rows, cols = grid.shape
+
+    # Count per row in parallel, then fill each row's slice independently
+    row_counts = np.zeros(rows, dtype=np.int64)
+    for i in prange(rows):
+        n = 0
+        for j in range(cols):
+            if grid[i, j] > 0:
+                n += 1
+        row_counts[i] = n
+
+    offsets = np.zeros(rows + 1, dtype=np.int64)
+    for i in range(rows):
+        offsets[i + 1] = offsets[i] + row_counts[i]
+
+    count = offsets[rows]
+    xs = np.empty(count)
+    ys = np.empty(count)
+    values = np.empty(count)
+    for i in prange(rows):
+        k = offsets[i]
+        y = (i / rows) * 85 - 42.5
+        for j in range(cols):
+            value = grid[i, j]
+            if value > 0:
+                xs[k] = (j / cols) * 100
+                ys[k] = y
+                values[k] = value
+                k += 1
+    return xs, ys, values
+
+
+def cf_pct(corsi_for: np.ndarray, corsi_against: np.ndarray) -> np.ndarray:
+    """
+    Compute Corsi-for percentage per entry.
+
+    Args:
+        corsi_for: CF values (float64 array)
+        corsi_against: CA values (float64 array, same length)
+
+    Returns:
+        CF% values on a 0-100 scale, 50.0 where there were no attempts
+
+    Raises:
+        ValueError: If the arrays differ in length
+    """
+    if corsi_for.shape != corsi_against.shape:
+        raise ValueError(
+            f"corsi_for and corsi_against differ in length "
+            f"({corsi_for.size} vs {corsi_against.size})"
+        )
+    if NUMBA_AVAILABLE:
+        return _cf_pct_jit(corsi_for, corsi_against)
+    return _cf_pct_numpy(corsi_for, corsi_against)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Compute a sliding-window mean over the positions where the window fits.
+
+    Args:
+        values: Input series (float64 array, at least ``window`` long)
+        window: Window length
+
+    Returns:
+        Array of ``len(values) - window + 1`` window means
+
+    Raises:
+        ValueError: If ``window`` is not between 1 and ``len(values)``
+    """
+    if not 1 <= window <= values.size:
+        raise ValueError(f"window must be between 1 and {values.size}, got {window}")
+    if NUMBA_AVAILABLE:
+        return _rolling_mean_jit(values, window)
+    return _rolling_mean_numpy(values, window)
+
+
+def collect_nonzero(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collect rink coordinates and values of all positive heat map cells.
+
+    Requires numba (see NUMBA_AVAILABLE); HeatMapVisualizer has its own
+    NumPy path for when it is missing.
+
+    Args:
+        grid: 2D heat map array (rows span the rink width, columns its length)
+
+    Returns:
+        Tuple of (x, y, value) float64 arrays in row-major cell order
+    """
+    grid = np.ascontiguousarray(grid)
+    if grid.size > PARALLEL_MIN_CELLS:
+        return _collect_nonzero_parallel_jit(grid)
+    return _collect_nonzero_jit(grid)
@@ -9,19 +9,182 @@ Creates statistical visualizations including:
 - Matchup analysis charts
 """
 
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import numpy as np
-from loguru import logger
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    logger.warning("matplotlib not available, chart functions will be limited")
+from src.visualization import _kernels as kernels
+
+# matplotlib (and loguru, only needed to report its absence) are imported on
+# the first render so that importing this module for colors or data export
+# stays cheap.
+plt: Any = None
+mpatches: Any = None
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+# Style last applied to the global rcParams, as (requested, actually applied);
+# the two differ when the requested style was unavailable and ggplot was used.
+_ACTIVE_STYLE: tuple[str, str] | None = None
+
+
+def _ensure_mpl() -> bool:
+    """Import matplotlib on first use; return whether it is available."""
+    global plt, mpatches, MATPLOTLIB_AVAILABLE
+
+    if plt is not None:
+        return True
+    if not MATPLOTLIB_AVAILABLE:
+        return False
+
+    try:
+        import matplotlib
+
+        # Charts are only ever written to files, so use the non-interactive
+        # Agg backend rather than letting pyplot probe for a GUI toolkit.
+        matplotlib.use("Agg")
+        import matplotlib.patches as _mpatches
+        import matplotlib.pyplot as _plt
+    except ImportError:
+        from loguru import logger
+
+        MATPLOTLIB_AVAILABLE = False
+        logger.warning("matplotlib not available, chart functions will be limited")
+        return False
+
+    plt, mpatches = _plt, _mpatches
+    return True
+
+
+class ChartZone(IntEnum):
+    """Index of each rink zone in the chart zone palette."""
+
+    SLOT = 0
+    INNER_SLOT = 1
+    CREASE = 2
+    LEFT_CIRCLE = 3
+    RIGHT_CIRCLE = 4
+    HIGH_SLOT = 5
+    LEFT_POINT = 6
+    RIGHT_POINT = 7
+    LEFT_WING = 8
+    RIGHT_WING = 9
+    BEHIND_NET = 10
+
+
+def _hex_to_rgba(colors: Iterable[str]) -> np.ndarray:
+    """Convert "#RRGGBB" strings to a contiguous (N, 4) float32 RGBA array (opaque)."""
+    rgb = [[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in colors]
+    rgba = np.ones((len(rgb), 4), dtype=np.float32)
+    if rgb:
+        rgba[:, :3] = np.asarray(rgb, dtype=np.float32) / 255.0
+    return rgba
+
+
+def _digest_value(digest: Any, value: Any) -> bool:
+    """
+    Feed a render argument into a cache-key digest.
+
+    Args:
+        digest: hashlib digest to update
+        value: Argument value
+
+    Returns:
+        False if the value (or anything nested in it) has no value-based
+        representation, in which case the call must not be cached
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return False
+        digest.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+        return True
+    if value is None or isinstance(value, (bool, int, float, str, bytes, Path, np.generic)):
+        digest.update(repr(value).encode())
+        return True
+    if isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        return all(_digest_value(digest, item) for item in value)
+    if isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode())
+        return all(
+            _digest_value(digest, key) and _digest_value(digest, item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _cached_png(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Cache the PNG bytes of a render method, keyed by a hash of its inputs.
+
+    Only used when the caller saves to a ``.png`` path with
+    ``close_after_save=True`` (i.e. does not want the figure back); on a hit
+    the cached bytes are written straight to ``output_path``. Calls with
+    arguments that cannot be keyed by value (see ``_digest_value``) render
+    uncached.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "ChartVisualizer", *args: Any, **kwargs: Any) -> Any | None:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        params.pop("self")
+        output_path = params.pop("output_path")
+        close_after_save = params.pop("close_after_save")
+
+        if not (output_path and close_after_save and Path(output_path).suffix.lower() == ".png"):
+            return method(self, *args, **kwargs)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(method.__name__.encode())
+        digest.update(repr((self.figsize, self.dpi, self.style)).encode())
+        for name, value in params.items():
+            digest.update(name.encode())
+            if not _digest_value(digest, value):
+                return method(self, *args, **kwargs)
+        key = digest.hexdigest()
+
+        png = self._png_cache.get(key)
+        if png is None:
+            fig = method(self, **params)
+            if fig is None:
+                return None
+            buffer = BytesIO()
+            try:
+                self._save(fig, buffer)
+            finally:
+                self.release_figure(fig)
+            png = buffer.getvalue()
+            self._png_cache[key] = png
+            while len(self._png_cache) > self.PNG_CACHE_SIZE:
+                self._png_cache.popitem(last=False)
+        else:
+            self._png_cache.move_to_end(key)
+
+        Path(output_path).write_bytes(png)
+        return None
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=256)
+def _pretty(label: str) -> str:
+    """Format a snake_case metric/segment key as a display label."""
+    return label.replace("_", " ").title()
 
 
 class ChartVisualizer:
@@ -65,6 +228,37 @@ class ChartVisualizer:
         "late_game": "#FF4136",
     }
 
+    # Zone palette as sorted names + parallel color array for vectorized lookup
+    DEFAULT_COLOR = "#666666"
+
+    # Palettes as parallel name tuples + contiguous float32 RGBA arrays, so
+    # matplotlib never re-parses hex strings and lookups are one fancy index.
+    # The extra last row holds DEFAULT_COLOR for unknown names.
+    _ZONE_NAMES: tuple[str, ...] = tuple(zone.name.lower() for zone in ChartZone)
+    _ZONE_INDEX: dict[str, int] = {name: i for i, name in enumerate(_ZONE_NAMES)}
+    _ZONE_RGBA = _hex_to_rgba([*map(ZONE_COLORS.get, _ZONE_NAMES), DEFAULT_COLOR])
+
+    _SEGMENT_NAMES: tuple[str, ...] = tuple(SEGMENT_COLORS)
+    _SEGMENT_INDEX: dict[str, int] = {name: i for i, name in enumerate(_SEGMENT_NAMES)}
+    _SEGMENT_RGBA = _hex_to_rgba([*SEGMENT_COLORS.values(), DEFAULT_COLOR])
+
+    # Palettes serialized once for web export; payloads reference them by etag
+    _PALETTES_JSON = json.dumps({"zones": ZONE_COLORS, "segments": SEGMENT_COLORS})
+    _PALETTES_ETAG = hashlib.blake2b(_PALETTES_JSON.encode(), digest_size=8).hexdigest()
+
+    # Released figures available for reuse, keyed by
+    # (figsize, dpi, subplot_kw, nrows, ncols)
+    _fig_pool: dict[tuple, list[tuple[Any, Any]]] = {}
+    _fig_pool_keys: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    FIG_POOL_SIZE = 4
+
+    # Recently rendered PNG payloads (see _cached_png), oldest first
+    _png_cache: OrderedDict[str, bytes] = OrderedDict()
+    PNG_CACHE_SIZE = 64
+
+    # Closed (first angle repeated) radar angles, keyed by metric count
+    _ANGLES_CACHE: dict[int, np.ndarray] = {}
+
     def __init__(
         self,
         figsize: tuple[float, float] = (10, 6),
@@ -81,17 +275,190 @@ class ChartVisualizer:
         """
         self.figsize = figsize
         self.dpi = dpi
+        self.style = style
 
-        if MATPLOTLIB_AVAILABLE:
+    def _ready(self) -> bool:
+        """Load matplotlib and apply this visualizer's style before rendering."""
+        if not _ensure_mpl():
+            return False
+
+        # rcParams are global, so re-apply whenever another style took over
+        global _ACTIVE_STYLE
+        if _ACTIVE_STYLE is None or _ACTIVE_STYLE[0] != self.style:
+            applied = self.style
             try:
-                plt.style.use(style)
+                plt.style.use(applied)
             except OSError:
-                plt.style.use("ggplot")
+                applied = "ggplot"
+                plt.style.use(applied)
+            _ACTIVE_STYLE = (self.style, applied)
+        return True
+
+    def _acquire_fig(self, key: tuple, factory: Callable[[], tuple[Any, Any]]) -> tuple[Any, Any]:
+        """
+        Get a cleared figure and axes, reusing a released one when possible.
+
+        Args:
+            key: Pool key (figsize, dpi, subplot_kw, nrows, ncols)
+            factory: Creates a new (figure, axes) pair on a pool miss
+
+        Returns:
+            Tuple of (figure, axes)
+        """
+        pooled = self._fig_pool.get(key)
+        if pooled:
+            fig, axes = pooled.pop()
+            owned = set(np.atleast_1d(axes).ravel())
+            # Drop axes added during the previous render (e.g. twinx)
+            for extra in [a for a in fig.axes if a not in owned]:
+                extra.remove()
+            for ax in owned:
+                ax.cla()
+        else:
+            fig, axes = factory()
+
+        self._fig_pool_keys[fig] = (key, axes)
+        return fig, axes
+
+    def _release_fig(self, key: tuple, fig: Any, axes: Any) -> None:
+        """Return a figure to the pool, closing it if the pool is full."""
+        pooled = self._fig_pool.setdefault(key, [])
+        if any(f is fig for f, _ in pooled):
+            return
+        if len(pooled) < self.FIG_POOL_SIZE:
+            pooled.append((fig, axes))
+        else:
+            self._fig_pool_keys.pop(fig, None)
+            plt.close(fig)
+
+    def release_figure(self, fig: Any) -> None:
+        """
+        Hand a rendered figure back for reuse by later renders.
+
+        The figure must not be used by the caller after release.
+
+        Args:
+            fig: Figure previously returned by a render method
+        """
+        if plt is None or fig is None:
+            return
+
+        entry = self._fig_pool_keys.get(fig)
+        if entry is None:
+            plt.close(fig)
+            return
+
+        key, axes = entry
+        self._release_fig(key, fig, axes)
+
+    def _single_axes_fig(self) -> tuple[Any, Any]:
+        """Acquire a pooled single-axes figure at the default size."""
+        return self._acquire_fig(
+            (self.figsize, self.dpi, None, 1, 1),
+            lambda: plt.subplots(figsize=self.figsize, dpi=self.dpi),
+        )
+
+    @classmethod
+    def _closed_angles(cls, n: int) -> np.ndarray:
+        """Get read-only radar angles for n metrics, closed back to 0."""
+        angles = cls._ANGLES_CACHE.get(n)
+        if angles is None:
+            angles = np.linspace(0, 2 * np.pi, n + 1)
+            angles[-1] = 0.0
+            angles.setflags(write=False)
+            cls._ANGLES_CACHE[n] = angles
+        return angles
+
+    def render_batch(
+        self,
+        specs: list[dict[str, Any]],
+        max_workers: int | None = None,
+    ) -> list[bytes | None]:
+        """
+        Render several charts in parallel worker processes.
+
+        Each spec names a render method and its keyword arguments, e.g.
+        ``{"method": "render_corsi_chart", "kwargs": {...}}``. Workers build
+        their own visualizer with this instance's settings and return the
+        chart as PNG bytes.
+
+        Args:
+            specs: Chart specs with "method" and optional "kwargs"
+            max_workers: Worker process count (defaults to CPU count)
+
+        Returns:
+            PNG bytes for each spec, in order (None if nothing was rendered)
+        """
+        if not _ensure_mpl():
+            return [None] * len(specs)
+
+        init_kwargs = {"figsize": self.figsize, "dpi": self.dpi, "style": self.style}
+        tasks = []
+        for spec in specs:
+            method = spec["method"]
+            if not method.startswith("render_") or not hasattr(self, method):
+                raise ValueError(f"Unknown render method: {method}")
+            tasks.append((init_kwargs, method, spec.get("kwargs", {})))
+
+        # Not worth spinning up worker processes for a single chart
+        if len(tasks) <= 1:
+            return [_render_to_png(*task) for task in tasks]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_render_to_png, *zip(*tasks)))
+
+    def _finish(
+        self,
+        fig: Any,
+        output_path: str | Path | None,
+        close_after_save: bool,
+    ) -> Any | None:
+        """Save a rendered figure if requested and decide whether to return it."""
+        if output_path:
+            self._save(fig, output_path)
+            if close_after_save:
+                self.release_figure(fig)
+                return None
+
+        return fig
+
+    def _save(self, fig: Any, output_path: str | Path | BinaryIO) -> None:
+        """
+        Save a figure, computing the tight bounding box once up front.
+
+        Passing an explicit bbox avoids the extra draw that
+        ``bbox_inches="tight"`` performs, and PNGs are written with fast
+        (low) zlib compression.
+
+        Args:
+            fig: Figure to save
+            output_path: Destination path (format inferred from the suffix)
+                or a binary file object (written as PNG)
+        """
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+        save_kwargs: dict[str, Any] = {}
+        if not isinstance(output_path, (str, Path)):
+            save_kwargs["format"] = "png"
+            save_kwargs["pil_kwargs"] = {"compress_level": 1}
+        elif Path(output_path).suffix.lower() in ("", ".png"):
+            save_kwargs["pil_kwargs"] = {"compress_level": 1}
+
+        fig.savefig(output_path, dpi=self.dpi, bbox_inches=bbox, **save_kwargs)
+
+    @classmethod
+    def _zone_colors(cls, zones: list[str]) -> np.ndarray:
+        """Look up RGBA colors for zone names, using the default for unknown zones."""
+        default = len(cls._ZONE_NAMES)
+        idx = np.fromiter(
+            (cls._ZONE_INDEX.get(z, default) for z in zones), dtype=np.intp, count=len(zones)
+        )
+        return cls._ZONE_RGBA[idx]
 
     def _get_team_color(self, team_abbrev: str) -> str:
         """Get color for a team."""
         return self.TEAM_COLORS.get(team_abbrev, self.TEAM_COLORS["default"])
 
+    @_cached_png
     def render_player_comparison(
         self,
         player_1_stats: dict[str, float],
@@ -101,6 +468,7 @@ class ChartVisualizer:
         metrics: list[str] | None = None,
         title: str = "Player Comparison",
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render a radar chart comparing two players.
@@ -113,31 +481,36 @@ class ChartVisualizer:
             metrics: List of metrics to compare (keys in stats dicts)
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if (metrics is not None and not metrics) or not self._ready():
             return None
 
         if metrics is None:
             metrics = ["goals", "assists", "shots", "hits", "blocks", "takeaways"]
 
         # Get values for each player
-        p1_values = [player_1_stats.get(m, 0) for m in metrics]
-        p2_values = [player_2_stats.get(m, 0) for m in metrics]
+        n_metrics = len(metrics)
+        p1_values = np.fromiter(
+            (player_1_stats.get(m, 0) for m in metrics), dtype=np.float64, count=n_metrics
+        )
+        p2_values = np.fromiter(
+            (player_2_stats.get(m, 0) for m in metrics), dtype=np.float64, count=n_metrics
+        )
 
         # Normalize values (0-1 scale)
-        max_vals = [max(p1_values[i], p2_values[i], 1) for i in range(len(metrics))]
-        p1_normalized = [p1_values[i] / max_vals[i] for i in range(len(metrics))]
-        p2_normalized = [p2_values[i] / max_vals[i] for i in range(len(metrics))]
+        max_vals = np.maximum(np.maximum(p1_values, p2_values), 1.0)
+        p1_normalized = p1_values / max_vals
+        p2_normalized = p2_values / max_vals
 
-        # Create radar chart
-        angles = np.linspace(0, 2 * np.pi, len(metrics), endpoint=False).tolist()
-        angles += angles[:1]  # Complete the circle
+        # Create radar chart, repeating the first point to complete the circle
+        angles = self._closed_angles(n_metrics)
 
-        p1_normalized += p1_normalized[:1]
-        p2_normalized += p2_normalized[:1]
+        p1_normalized = np.append(p1_normalized, p1_normalized[:1])
+        p2_normalized = np.append(p2_normalized, p2_normalized[:1])
 
         fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True), dpi=self.dpi)
 
@@ -148,18 +521,16 @@ class ChartVisualizer:
         ax.fill(angles, p2_normalized, alpha=0.25, color="#FF4136")
 
         ax.set_xticks(angles[:-1])
-        ax.set_xticklabels([m.replace("_", " ").title() for m in metrics])
+        ax.set_xticklabels([_pretty(m) for m in metrics])
 
         ax.set_title(title, size=14, fontweight="bold", pad=20)
         ax.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1))
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
-
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
+    @_cached_png
     def render_zone_breakdown(
         self,
         zone_stats: dict[str, dict[str, float]],
@@ -167,6 +538,7 @@ class ChartVisualizer:
         metric: str = "shots",
         title: str | None = None,
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render a bar chart showing performance by zone.
@@ -177,42 +549,38 @@ class ChartVisualizer:
             metric: Metric to display
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not zone_stats or not self._ready():
             return None
 
         zones = list(zone_stats.keys())
         values = [zone_stats[z].get(metric, 0) for z in zones]
-        colors = [self.ZONE_COLORS.get(z, "#666666") for z in zones]
+        colors = self._zone_colors(zones)
 
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        fig, ax = self._single_axes_fig()
 
         bars = ax.barh(zones, values, color=colors, edgecolor="white", linewidth=0.5)
 
         # Add value labels
-        for bar, val in zip(bars, values):
-            width = bar.get_width()
-            ax.text(
-                width + max(values) * 0.02,
-                bar.get_y() + bar.get_height() / 2,
-                f"{val:.1f}" if isinstance(val, float) else str(val),
-                va="center",
-                fontsize=10,
-            )
+        ax.bar_label(
+            bars,
+            labels=[f"{val:.1f}" if isinstance(val, float) else str(val) for val in values],
+            padding=3,
+            fontsize=10,
+        )
 
-        ax.set_xlabel(metric.replace("_", " ").title())
+        ax.set_xlabel(_pretty(metric))
         ax.set_title(title or f"{entity_name} - {metric.title()} by Zone", fontweight="bold")
 
-        plt.tight_layout()
-
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+        fig.tight_layout()
 
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
+    @_cached_png
     def render_segment_performance(
         self,
         segment_stats: dict[str, dict[str, float]],
@@ -220,6 +588,7 @@ class ChartVisualizer:
         metrics: list[str] | None = None,
         title: str | None = None,
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render a grouped bar chart showing performance by game segment.
@@ -230,11 +599,12 @@ class ChartVisualizer:
             metrics: List of metrics to display
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not segment_stats or (metrics is not None and not metrics) or not self._ready():
             return None
 
         if metrics is None:
@@ -244,18 +614,22 @@ class ChartVisualizer:
         x = np.arange(len(metrics))
         width = 0.25
 
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        # Segment x metric value matrix, one row per bar group
+        values = np.array(
+            [[segment_stats.get(s, {}).get(m, 0) for m in metrics] for s in segments],
+            dtype=np.float64,
+        )
+
+        fig, ax = self._single_axes_fig()
 
         for i, segment in enumerate(segments):
-            stats = segment_stats.get(segment, {})
-            values = [stats.get(m, 0) for m in metrics]
             offset = (i - 1) * width
-            bars = ax.bar(
+            ax.bar(
                 x + offset,
-                values,
+                values[i],
                 width,
-                label=segment.replace("_", " ").title(),
-                color=self.SEGMENT_COLORS.get(segment, "#666666"),
+                label=_pretty(segment),
+                color=self._SEGMENT_RGBA[self._SEGMENT_INDEX.get(segment, -1)],
                 edgecolor="white",
                 linewidth=0.5,
             )
@@ -263,16 +637,14 @@ class ChartVisualizer:
         ax.set_ylabel("Value")
         ax.set_title(title or f"{entity_name} - Performance by Game Segment", fontweight="bold")
         ax.set_xticks(x)
-        ax.set_xticklabels([m.replace("_", " ").title() for m in metrics])
+        ax.set_xticklabels([_pretty(m) for m in metrics])
         ax.legend()
 
-        plt.tight_layout()
-
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+        fig.tight_layout()
 
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
+    @_cached_png
     def render_corsi_chart(
         self,
         corsi_for: list[float],
@@ -280,6 +652,7 @@ class ChartVisualizer:
         labels: list[str],
         title: str = "Corsi Comparison",
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render a Corsi comparison chart.
@@ -290,23 +663,27 @@ class ChartVisualizer:
             labels: Labels for each entry
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not labels or not self._ready():
             return None
 
         x = np.arange(len(labels))
         width = 0.35
 
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        fig, ax = self._single_axes_fig()
 
         bars1 = ax.bar(x - width / 2, corsi_for, width, label="CF", color="#2ECC40")
         bars2 = ax.bar(x + width / 2, corsi_against, width, label="CA", color="#FF4136")
 
         # Add CF% line
-        cf_pct = [cf / (cf + ca) * 100 if (cf + ca) > 0 else 50 for cf, ca in zip(corsi_for, corsi_against)]
+        cf_pct = kernels.cf_pct(
+            np.asarray(corsi_for, dtype=np.float64),
+            np.asarray(corsi_against, dtype=np.float64),
+        )
 
         ax2 = ax.twinx()
         ax2.plot(x, cf_pct, "ko-", linewidth=2, markersize=8, label="CF%")
@@ -324,13 +701,11 @@ class ChartVisualizer:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax.legend(lines1 + lines2, labels1 + labels2, loc="upper right")
 
-        plt.tight_layout()
-
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+        fig.tight_layout()
 
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
+    @_cached_png
     def render_xg_chart(
         self,
         xg_for: list[float],
@@ -340,6 +715,7 @@ class ChartVisualizer:
         labels: list[str],
         title: str = "Expected Goals Analysis",
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render an expected goals analysis chart.
@@ -352,41 +728,64 @@ class ChartVisualizer:
             labels: Labels for each entry
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not labels or not self._ready():
             return None
 
+        xg_f = np.asarray(xg_for, dtype=np.float64)
+        xg_a = np.asarray(xg_against, dtype=np.float64)
+        g_f = np.asarray(goals_for, dtype=np.float64)
+        g_a = np.asarray(goals_against, dtype=np.float64)
+
         fig, axes = plt.subplots(1, 2, figsize=(14, 6), dpi=self.dpi)
 
         # Left: xG vs Actual Goals scatter
         ax1 = axes[0]
-        ax1.scatter(xg_for, goals_for, c="#2ECC40", s=100, alpha=0.7, label="Goals For")
-        ax1.scatter(xg_against, goals_against, c="#FF4136", s=100, alpha=0.7, label="Goals Against")
+        # Both series go into one PathCollection; legend entries use proxies
+        point_colors = np.concatenate([
+            np.full(len(xg_f), "#2ECC40"),
+            np.full(len(xg_a), "#FF4136"),
+        ])
+        ax1.scatter(
+            np.concatenate([xg_f, xg_a]),
+            np.concatenate([g_f, g_a]),
+            c=point_colors,
+            s=100,
+            alpha=0.7,
+        )
 
         # Add diagonal line (perfect prediction)
-        max_val = max(max(xg_for + xg_against), max(goals_for + goals_against))
-        ax1.plot([0, max_val], [0, max_val], "k--", alpha=0.5, label="Perfect Prediction")
+        max_val = max(
+            xg_f.max(initial=0.0), xg_a.max(initial=0.0),
+            g_f.max(initial=0.0), g_a.max(initial=0.0),
+        )
+        (diagonal,) = ax1.plot([0, max_val], [0, max_val], "k--", alpha=0.5, label="Perfect Prediction")
 
         ax1.set_xlabel("Expected Goals")
         ax1.set_ylabel("Actual Goals")
         ax1.set_title("xG vs Actual Goals", fontweight="bold")
-        ax1.legend()
+        ax1.legend(handles=[
+            mpatches.Patch(color="#2ECC40", alpha=0.7, label="Goals For"),
+            mpatches.Patch(color="#FF4136", alpha=0.7, label="Goals Against"),
+            diagonal,
+        ])
 
         # Right: Goals Above Expected bar chart
         ax2 = axes[1]
-        gae_for = [g - x for g, x in zip(goals_for, xg_for)]
-        gae_against = [x - g for g, x in zip(goals_against, xg_against)]  # Positive = good defense
+        gae_for = g_f - xg_f
+        gae_against = xg_a - g_a  # Positive = good defense
 
         x = np.arange(len(labels))
         width = 0.35
 
         ax2.bar(x - width / 2, gae_for, width, label="Goals Above Expected (Offense)",
-                color=["#2ECC40" if v >= 0 else "#FF4136" for v in gae_for])
+                color=np.where(gae_for >= 0, "#2ECC40", "#FF4136"))
         ax2.bar(x + width / 2, gae_against, width, label="Goals Saved Above Expected",
-                color=["#0074D9" if v >= 0 else "#FF851B" for v in gae_against])
+                color=np.where(gae_against >= 0, "#0074D9", "#FF851B"))
 
         ax2.axhline(y=0, color="black", linewidth=0.5)
         ax2.set_ylabel("Goals Above/Below Expected")
@@ -396,13 +795,11 @@ class ChartVisualizer:
         ax2.legend()
 
         fig.suptitle(title, fontsize=14, fontweight="bold")
-        plt.tight_layout()
-
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+        fig.tight_layout()
 
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
+    @_cached_png
     def render_matchup_history(
         self,
         team_1_wins: int,
@@ -414,6 +811,7 @@ class ChartVisualizer:
         goals_against: int,
         title: str | None = None,
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render a matchup history summary chart.
@@ -428,11 +826,12 @@ class ChartVisualizer:
             goals_against: Total goals against team 1
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not self._ready():
             return None
 
         fig, axes = plt.subplots(1, 2, figsize=(12, 5), dpi=self.dpi)
@@ -463,16 +862,7 @@ class ChartVisualizer:
 
         bars = ax2.bar(categories, values, color=colors, edgecolor="white", linewidth=2)
 
-        for bar, val in zip(bars, values):
-            ax2.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + max(values) * 0.02,
-                str(val),
-                ha="center",
-                va="bottom",
-                fontsize=12,
-                fontweight="bold",
-            )
+        ax2.bar_label(bars, labels=[str(val) for val in values], padding=3, fontsize=12, fontweight="bold")
 
         ax2.set_ylabel("Goals")
         ax2.set_title("Goals Summary", fontweight="bold")
@@ -482,13 +872,11 @@ class ChartVisualizer:
             fontsize=14,
             fontweight="bold",
         )
-        plt.tight_layout()
-
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+        fig.tight_layout()
 
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
+    @_cached_png
     def render_shooting_percentage_trend(
         self,
         games: list[str],
@@ -497,6 +885,7 @@ class ChartVisualizer:
         entity_name: str = "",
         title: str | None = None,
         output_path: str | Path | None = None,
+        close_after_save: bool = False,
     ) -> Any | None:
         """
         Render a shooting percentage trend line chart.
@@ -508,14 +897,15 @@ class ChartVisualizer:
             entity_name: Name of player/team
             title: Chart title
             output_path: Path to save the figure
+            close_after_save: Release the figure once saved and return None
 
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not shooting_pcts or not self._ready():
             return None
 
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        fig, ax = self._single_axes_fig()
 
         x = range(len(games))
 
@@ -524,7 +914,7 @@ class ChartVisualizer:
 
         # Add rolling average
         if len(shooting_pcts) >= 5:
-            rolling_avg = np.convolve(shooting_pcts, np.ones(5) / 5, mode="valid")
+            rolling_avg = kernels.rolling_mean(np.asarray(shooting_pcts, dtype=np.float64), 5)
             ax.plot(
                 range(2, len(shooting_pcts) - 2),
                 rolling_avg,
@@ -542,12 +932,9 @@ class ChartVisualizer:
         # Format y-axis as percentage
         ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: f"{y:.0%}"))
 
-        plt.tight_layout()
-
-        if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+        fig.tight_layout()
 
-        return fig
+        return self._finish(fig, output_path, close_after_save)
 
     def export_chart_data(
         self,
@@ -561,19 +948,54 @@ class ChartVisualizer:
             chart_type: Type of chart
             data: Chart data
 
+        The color palettes are not embedded; the payload carries a
+        ``palette_etag`` that clients resolve once via ``get_palettes``.
+
         Returns:
             Dictionary with data for web rendering
         """
         return {
             "chart_type": chart_type,
             "data": data,
-            "colors": {
-                "zones": self.ZONE_COLORS,
-                "segments": self.SEGMENT_COLORS,
-            },
+            "palette_etag": self._PALETTES_ETAG,
         }
 
+    def get_palettes(self, etag: str | None = None) -> str | None:
+        """
+        Get the zone/segment color palettes as a JSON string.
+
+        Args:
+            etag: Palette etag the client already holds, if any
+
+        Returns:
+            Serialized palettes, or None if the client's etag is current
+        """
+        if etag == self._PALETTES_ETAG:
+            return None
+        return self._PALETTES_JSON
+
     def close_all(self) -> None:
-        """Close all open figures."""
-        if MATPLOTLIB_AVAILABLE:
+        """Close all open figures, including pooled ones."""
+        if plt is not None:
+            self._fig_pool.clear()
+            self._fig_pool_keys.clear()
             plt.close("all")
+
+
+def _render_to_png(
+    init_kwargs: dict[str, Any],
+    method: str,
+    kwargs: dict[str, Any],
+) -> bytes | None:
+    """Render one chart spec and return it as PNG bytes (worker entry point)."""
+    visualizer = ChartVisualizer(**init_kwargs)
+    fig = getattr(visualizer, method)(**kwargs)
+    if fig is None:
+        return None
+
+    buffer = BytesIO()
+    try:
+        visualizer._save(fig, buffer)
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
@@ -5,6 +5,11 @@ Renders heat maps for shot distributions, zone performance, and matchup analysis
 Uses matplotlib for static images and can generate data for interactive visualizations.
 """
 
+import base64
+import copy
+import importlib.util
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -12,20 +17,53 @@ from typing import Any
 import numpy as np
 from loguru import logger
 
-# Optional matplotlib import for systems without display
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    from matplotlib.colors import LinearSegmentedColormap
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    logger.warning("matplotlib not available, visualization functions will be limited")
-
-
-@dataclass
+from src.visualization import _kernels as kernels
+
+# matplotlib is imported on the first render so that data export (e.g.
+# export_for_web) does not pay its import cost. Heat maps are drawn on
+# standalone Agg figures, so pyplot itself is never needed.
+patches: Any = None
+colormaps: Any = None
+to_rgba: Any = None
+Figure: Any = None
+FigureCanvasAgg: Any = None
+LineCollection: Any = None
+PatchCollection: Any = None
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+
+def _ensure_mpl() -> bool:
+    """Import matplotlib on first use; return whether it is available."""
+    global patches, colormaps, to_rgba, Figure, FigureCanvasAgg
+    global LineCollection, PatchCollection, MATPLOTLIB_AVAILABLE
+
+    if Figure is not None:
+        return True
+    if not MATPLOTLIB_AVAILABLE:
+        return False
+
+    try:
+        import matplotlib.patches as _patches
+        from matplotlib import colormaps as _colormaps
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+        from matplotlib.collections import LineCollection as _LineCollection
+        from matplotlib.collections import PatchCollection as _PatchCollection
+        from matplotlib.colors import to_rgba as _to_rgba
+        from matplotlib.figure import Figure as _Figure
+    except ImportError:
+        MATPLOTLIB_AVAILABLE = False
+        logger.warning("matplotlib not available, visualization functions will be limited")
+        return False
+
+    patches, colormaps, to_rgba = _patches, _colormaps, _to_rgba
+    LineCollection, PatchCollection = _LineCollection, _PatchCollection
+    FigureCanvasAgg, Figure = _FigureCanvasAgg, _Figure
+    return True
+
+
+@dataclass(frozen=True, slots=True)
 class RinkDimensions:
-    """NHL rink dimensions for visualization."""
+    """NHL rink dimensions for visualization (immutable, hashable)."""
 
     length: float = 200.0  # feet
     width: float = 85.0  # feet
@@ -53,11 +91,24 @@ class HeatMapVisualizer:
     GOAL_COLORMAP = "RdYlGn"  # Red-Yellow-Green for efficiency
     COMPARISON_COLORMAP = "RdBu"  # Red-Blue for comparisons
 
+    # Multi-panel renders smooth their inputs on worker threads above this size
+    PARALLEL_SMOOTH_MIN_CELLS = 256 * 256
+
+    # Prototype rink artists keyed by rink dimensions (see _rink_artists)
+    _RINK_ARTIST_CACHE: dict[RinkDimensions, tuple[Any, Any]] = {}
+    # Prototype zone boundary lines (see _draw_zone_boundaries)
+    _zone_boundary_lines: Any = None
+    # Resolved Colormap objects keyed by name (see _colormap)
+    _CMAP_CACHE: dict[str, Any] = {}
+    # 256-entry uint8 RGBA lookup tables keyed by colormap name (see _colormap_lut)
+    _LUT_CACHE: dict[str, np.ndarray] = {}
+
     def __init__(
         self,
         figsize: tuple[float, float] = (12, 8),
         dpi: int = 100,
         half_rink: bool = True,
+        smooth_sigma: float = 1.5,
     ):
         """
         Initialize the heat map visualizer.
@@ -66,65 +117,221 @@ class HeatMapVisualizer:
             figsize: Figure size in inches
             dpi: Dots per inch for output
             half_rink: Whether to show half rink (offensive zone only)
+            smooth_sigma: Gaussian smoothing (in grid cells) applied before
+                rendering; 0 disables smoothing
         """
         self.figsize = figsize
         self.dpi = dpi
         self.half_rink = half_rink
+        self.smooth_sigma = smooth_sigma
         self.rink = RinkDimensions()
 
+        # Figure kept alive between render_shot_heat_map(reuse=True) calls
+        self._persistent: dict[str, Any] = {
+            "fig": None, "ax": None, "im": None, "cbar": None, "show_zones": None,
+        }
+        # Rink x/y coordinates of each grid column/row, keyed by (rows, cols)
+        self._grid_cache: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+
         if not MATPLOTLIB_AVAILABLE:
             logger.warning("Visualization features require matplotlib")
 
+    def _rink_artists(self) -> tuple[Any, Any]:
+        """
+        Get prototype artists for the static half-rink markings.
+
+        The line markings and the crease/faceoff-circle patches are built once
+        per set of rink dimensions as two collections; callers add shallow
+        copies to their axes.
+
+        Returns:
+            Tuple of (LineCollection, PatchCollection) prototypes
+        """
+        rink = self.rink
+        cached = self._RINK_ARTIST_CACHE.get(rink)
+        if cached is not None:
+            return cached
+
+        goal_line_x = rink.goal_line_x
+        blue_line_x = rink.blue_line_x
+        crease_width = rink.crease_width
+        line_color = "#333333"
+        end_x = goal_line_x + 11
+        half_width = rink.width / 2
+
+        lines = LineCollection(
+            [
+                # Rink outline
+                [(0, half_width), (end_x, half_width)],
+                [(0, -half_width), (end_x, -half_width)],
+                # Blue line
+                [(blue_line_x, -45), (blue_line_x, 45)],
+                # Goal line
+                [(goal_line_x, -45), (goal_line_x, 45)],
+                # Center line (at x=0 for half rink)
+                [(0, -45), (0, 45)],
+            ],
+            colors=[
+                to_rgba(line_color),
+                to_rgba(line_color),
+                to_rgba("blue", 0.7),
+                to_rgba("red", 0.7),
+                to_rgba("red", 0.7),
+            ],
+            linewidths=[2, 2, 3, 2, 2],
+            zorder=2,
+        )
+
+        # Goal crease and faceoff circles (left and right)
+        rink_patches = [
+            patches.Rectangle(
+                (goal_line_x, -crease_width / 2),
+                rink.crease_depth,
+                crease_width,
+                fill=True,
+                facecolor="lightblue",
+                edgecolor="blue",
+                linewidth=2,
+                alpha=0.5,
+            )
+        ]
+        for y_pos in [22, -22]:
+            rink_patches.append(
+                patches.Circle(
+                    (69, y_pos),
+                    rink.faceoff_circle_radius,
+                    fill=False,
+                    edgecolor="red",
+                    linewidth=1.5,
+                )
+            )
+        shapes = PatchCollection(rink_patches, match_original=True, zorder=1)
+
+        self._RINK_ARTIST_CACHE[rink] = (lines, shapes)
+        return lines, shapes
+
+    @staticmethod
+    def _to_render_dtype(data: np.ndarray) -> np.ndarray:
+        """
+        Convert image data to contiguous float32 for imshow.
+
+        The output is an 8-bit image, so float32 is ample and halves the data
+        moved through the resampler and colormap compared to float64.
+        """
+        return np.ascontiguousarray(data, dtype=np.float32)
+
+    def _smooth(self, data: np.ndarray) -> np.ndarray:
+        """
+        Gaussian-smooth heat map data once before rendering.
+
+        Images are drawn with nearest-neighbour interpolation, so smoothing
+        here replaces matplotlib's per-draw gaussian resampling.
+        """
+        if self.smooth_sigma <= 0:
+            return data
+
+        from scipy.ndimage import gaussian_filter
+        return gaussian_filter(data, sigma=self.smooth_sigma)
+
+    def _smooth_panels(self, *panels: np.ndarray) -> list[np.ndarray]:
+        """
+        Smooth the independent inputs of a multi-panel render.
+
+        Large grids are filtered concurrently (scipy.ndimage releases the GIL
+        while filtering); small ones sequentially, where thread setup would
+        cost more than it saves.
+
+        Args:
+            panels: 2D arrays to smooth
+
+        Returns:
+            Smoothed arrays in input order
+        """
+        if self.smooth_sigma <= 0 or panels[0].size < self.PARALLEL_SMOOTH_MIN_CELLS:
+            return [self._smooth(panel) for panel in panels]
+
+        with ThreadPoolExecutor(max_workers=len(panels)) as executor:
+            return list(executor.map(self._smooth, panels))
+
+    def _new_figure(
+        self,
+        ncols: int = 1,
+        figsize: tuple[float, float] | None = None,
+        layout: str | None = None,
+    ) -> tuple[Any, Any]:
+        """
+        Create a figure on its own Agg canvas, outside pyplot's figure manager.
+
+        Figures are not registered with pyplot, so they are freed once the
+        caller drops them and can be rendered from worker threads.
+
+        Args:
+            ncols: Number of side-by-side axes
+            figsize: Figure size in inches (defaults to self.figsize)
+            layout: Matplotlib layout engine name (e.g. "constrained")
+
+        Returns:
+            Tuple of (figure, axes), axes being an array when ncols > 1
+        """
+        fig = Figure(figsize=figsize or self.figsize, dpi=self.dpi, layout=layout)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(1, ncols)
+
+    def _save(self, fig: Any, output_path: str | Path) -> None:
+        """
+        Save a figure cropped to its tight bounding box.
+
+        PNGs are written with fast (low) zlib compression. The tight bbox may
+        extend past the figure edges, so artists drawn outside the figure
+        are kept.
+
+        Args:
+            fig: Figure to save
+            output_path: Destination path (format inferred from the suffix)
+        """
+        save_kwargs: dict[str, Any] = {}
+        if Path(output_path).suffix.lower() in ("", ".png"):
+            save_kwargs["pil_kwargs"] = {"compress_level": 1}
+
+        fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight", **save_kwargs)
+
+    @classmethod
+    def _colormap(cls, cmap: Any) -> Any:
+        """
+        Resolve a colormap name to a shared Colormap instance.
+
+        matplotlib's registry hands out a fresh copy on every lookup, so
+        names are resolved once and cached; Colormap objects pass through.
+        The cached instances must not be modified.
+        """
+        if not isinstance(cmap, str):
+            return cmap
+
+        resolved = cls._CMAP_CACHE.get(cmap)
+        if resolved is None:
+            resolved = cls._CMAP_CACHE[cmap] = colormaps[cmap]
+        return resolved
+
+    @classmethod
+    def _colormap_lut(cls, name: str) -> np.ndarray:
+        """Get the cached (256, 4) uint8 RGBA lookup table for a colormap."""
+        lut = cls._LUT_CACHE.get(name)
+        if lut is None:
+            lut = cls._colormap(name)(np.linspace(0, 1, 256), bytes=True)
+            cls._LUT_CACHE[name] = lut
+        return lut
+
     def _draw_half_rink(self, ax: Any) -> None:
         """Draw half-rink outline on axes."""
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return
 
-        # Rink boundaries (half rink from center to end)
-        rink_color = "#EEEEEE"
-        line_color = "#333333"
-
         # Background
-        ax.set_facecolor(rink_color)
-
-        # Rink outline
-        ax.plot([0, self.rink.goal_line_x + 11], [self.rink.width / 2, self.rink.width / 2],
-                color=line_color, linewidth=2)
-        ax.plot([0, self.rink.goal_line_x + 11], [-self.rink.width / 2, -self.rink.width / 2],
-                color=line_color, linewidth=2)
-
-        # Blue line
-        ax.axvline(x=self.rink.blue_line_x, color="blue", linewidth=3, alpha=0.7)
-
-        # Goal line
-        ax.axvline(x=self.rink.goal_line_x, color="red", linewidth=2, alpha=0.7)
-
-        # Center line (at x=0 for half rink)
-        ax.axvline(x=0, color="red", linewidth=2, alpha=0.7)
-
-        # Goal crease
-        crease = patches.Rectangle(
-            (self.rink.goal_line_x, -self.rink.crease_width / 2),
-            self.rink.crease_depth,
-            self.rink.crease_width,
-            fill=True,
-            facecolor="lightblue",
-            edgecolor="blue",
-            linewidth=2,
-            alpha=0.5,
-        )
-        ax.add_patch(crease)
-
-        # Faceoff circles
-        for y_pos in [22, -22]:  # Left and right circles
-            circle = patches.Circle(
-                (69, y_pos),
-                self.rink.faceoff_circle_radius,
-                fill=False,
-                edgecolor="red",
-                linewidth=1.5,
-            )
-            ax.add_patch(circle)
+        ax.set_facecolor("#EEEEEE")
+
+        lines, shapes = self._rink_artists()
+        ax.add_collection(copy.copy(lines), autolim=False)
+        ax.add_collection(copy.copy(shapes), autolim=False)
 
         # Set limits
         ax.set_xlim(-5, 100)
@@ -136,50 +343,73 @@ class HeatMapVisualizer:
         self,
         heat_map_data: np.ndarray,
         title: str = "Shot Heat Map",
-        colormap: str | None = None,
+        colormap: Any = None,
         show_zones: bool = True,
         output_path: str | Path | None = None,
+        reuse: bool = False,
     ) -> Any | None:
         """
         Render a shot distribution heat map.
 
+        With ``reuse=True`` the first call builds a persistent figure and
+        later reuse calls only swap in the new data, colormap and title
+        (e.g. when stepping through games or players). The same figure
+        object is returned each time.
+
         Args:
             heat_map_data: 2D numpy array with heat map values
             title: Title for the visualization
-            colormap: Matplotlib colormap name
+            colormap: Matplotlib colormap name or Colormap instance
             show_zones: Whether to overlay zone boundaries
             output_path: Path to save the figure (optional)
+            reuse: Update the persistent figure instead of creating one
 
         Returns:
             matplotlib figure or None if matplotlib unavailable
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             logger.warning("Cannot render heat map: matplotlib not available")
             return None
 
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        heat_map_data = self._to_render_dtype(heat_map_data)
+        cmap = self._colormap(colormap or self.SHOT_COLORMAP)
+
+        persistent = self._persistent
+        if reuse and persistent["fig"] is not None and persistent["show_zones"] == show_zones:
+            fig, ax, im = persistent["fig"], persistent["ax"], persistent["im"]
+            smoothed = self._smooth(heat_map_data)
+            im.set_data(smoothed)
+            im.set_cmap(cmap)
+            im.set_clim(vmin=float(smoothed.min()), vmax=float(smoothed.max()))
+            ax.set_title(title, fontsize=14, fontweight="bold", pad=10)
+            fig.canvas.draw_idle()
+
+            if output_path:
+                self._save(fig, output_path)
+                logger.info(f"Saved heat map to {output_path}")
+
+            return fig
+
+        fig, ax = self._new_figure()
 
         # Draw rink
         self._draw_half_rink(ax)
 
-        # Create heat map overlay
-        cmap = colormap or self.SHOT_COLORMAP
-
         # Transform data to rink coordinates
         extent = [0, 100, -42.5, 42.5]  # x_min, x_max, y_min, y_max
 
         im = ax.imshow(
-            heat_map_data,
+            self._smooth(heat_map_data),
             extent=extent,
             origin="lower",
             cmap=cmap,
             alpha=0.6,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
         )
 
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax, shrink=0.6, pad=0.02)
+        cbar = fig.colorbar(im, ax=ax, shrink=0.6, pad=0.02)
         cbar.set_label("Shot Density", rotation=270, labelpad=15)
 
         # Add zone overlays if requested
@@ -188,10 +418,13 @@ class HeatMapVisualizer:
 
         ax.set_title(title, fontsize=14, fontweight="bold", pad=10)
 
-        plt.tight_layout()
+        fig.tight_layout()
+
+        if reuse:
+            persistent.update(fig=fig, ax=ax, im=im, cbar=cbar, show_zones=show_zones)
 
         if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+            self._save(fig, output_path)
             logger.info(f"Saved heat map to {output_path}")
 
         return fig
@@ -217,15 +450,20 @@ class HeatMapVisualizer:
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return None
 
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        shooting_pct_data = self._to_render_dtype(shooting_pct_data)
+
+        fig, ax = self._new_figure()
 
         self._draw_half_rink(ax)
 
         # Mask low sample size areas
-        masked_data = np.ma.masked_where(shot_count_data < min_shots, shooting_pct_data)
+        masked_data = np.ma.masked_where(
+            shot_count_data < min_shots,
+            self._smooth(np.nan_to_num(shooting_pct_data)),
+        )
 
         extent = [0, 100, -42.5, 42.5]
 
@@ -233,23 +471,23 @@ class HeatMapVisualizer:
             masked_data,
             extent=extent,
             origin="lower",
-            cmap=self.GOAL_COLORMAP,
+            cmap=self._colormap(self.GOAL_COLORMAP),
             alpha=0.7,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
             vmin=0,
             vmax=0.3,  # Cap at 30% for visualization
         )
 
-        cbar = plt.colorbar(im, ax=ax, shrink=0.6, pad=0.02)
+        cbar = fig.colorbar(im, ax=ax, shrink=0.6, pad=0.02)
         cbar.set_label("Shooting %", rotation=270, labelpad=15)
 
         ax.set_title(title, fontsize=14, fontweight="bold", pad=10)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+            self._save(fig, output_path)
 
         return fig
 
@@ -276,63 +514,79 @@ class HeatMapVisualizer:
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return None
 
-        fig, axes = plt.subplots(1, 3, figsize=(16, 6), dpi=self.dpi)
+        heat_map_1 = self._to_render_dtype(heat_map_1)
+        heat_map_2 = self._to_render_dtype(heat_map_2)
+
+        # Constrained layout handles the colorbar spanning two axes
+        fig, axes = self._new_figure(ncols=3, figsize=(16, 6), layout="constrained")
 
         extent = [0, 100, -42.5, 42.5]
 
+        # Smoothing is linear, so the difference of the smoothed maps equals
+        # the smoothed difference; filter each input once and reuse it.
+        smoothed_1, smoothed_2 = self._smooth_panels(heat_map_1, heat_map_2)
+
+        # Both heat maps share one color scale (and a single colorbar)
+        shared_min = float(min(smoothed_1.min(), smoothed_2.min()))
+        shared_max = float(max(smoothed_1.max(), smoothed_2.max()))
+
         # First heat map
         self._draw_half_rink(axes[0])
         im1 = axes[0].imshow(
-            heat_map_1,
+            smoothed_1,
             extent=extent,
             origin="lower",
-            cmap=self.SHOT_COLORMAP,
+            cmap=self._colormap(self.SHOT_COLORMAP),
             alpha=0.6,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
+            vmin=shared_min,
+            vmax=shared_max,
         )
         axes[0].set_title(label_1, fontsize=12)
-        plt.colorbar(im1, ax=axes[0], shrink=0.5)
 
         # Second heat map
         self._draw_half_rink(axes[1])
-        im2 = axes[1].imshow(
-            heat_map_2,
+        axes[1].imshow(
+            smoothed_2,
             extent=extent,
             origin="lower",
-            cmap=self.SHOT_COLORMAP,
+            cmap=self._colormap(self.SHOT_COLORMAP),
             alpha=0.6,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
+            vmin=shared_min,
+            vmax=shared_max,
         )
         axes[1].set_title(label_2, fontsize=12)
-        plt.colorbar(im2, ax=axes[1], shrink=0.5)
+        fig.colorbar(im1, ax=[axes[0], axes[1]], shrink=0.5)
 
         # Difference map
-        diff = heat_map_1 - heat_map_2
+        diff = np.subtract(smoothed_1, smoothed_2, out=np.empty_like(smoothed_1))
+        # Symmetric color limits so zero difference sits at the colormap center
+        diff_limit = float(max(-diff.min(), diff.max()))
         self._draw_half_rink(axes[2])
         im3 = axes[2].imshow(
             diff,
             extent=extent,
             origin="lower",
-            cmap=self.COMPARISON_COLORMAP,
+            cmap=self._colormap(self.COMPARISON_COLORMAP),
             alpha=0.6,
             aspect="auto",
-            interpolation="gaussian",
-            vmin=-np.abs(diff).max(),
-            vmax=np.abs(diff).max(),
+            interpolation="nearest",
+            vmin=-diff_limit,
+            vmax=diff_limit,
         )
         axes[2].set_title("Difference", fontsize=12)
-        plt.colorbar(im3, ax=axes[2], shrink=0.5)
+        fig.colorbar(im3, ax=axes[2], shrink=0.5)
 
         fig.suptitle(title, fontsize=14, fontweight="bold")
-        plt.tight_layout()
 
         if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+            self._save(fig, output_path)
 
         return fig
 
@@ -361,114 +615,270 @@ class HeatMapVisualizer:
         Returns:
             matplotlib figure or None
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return None
 
-        fig, axes = plt.subplots(1, 3, figsize=(16, 6), dpi=self.dpi)
+        offensive_map = self._to_render_dtype(offensive_map)
+        defensive_map = self._to_render_dtype(defensive_map)
+
+        mismatch = np.multiply(offensive_map, defensive_map, out=np.empty_like(offensive_map))
+        smoothed_off, smoothed_def, smoothed_mismatch = self._smooth_panels(
+            offensive_map, defensive_map, mismatch
+        )
+
+        fig, axes = self._new_figure(ncols=3, figsize=(16, 6))
 
         extent = [0, 100, -42.5, 42.5]
 
         # Offensive heat map
         self._draw_half_rink(axes[0])
         im1 = axes[0].imshow(
-            offensive_map,
+            smoothed_off,
             extent=extent,
             origin="lower",
-            cmap="Oranges",
+            cmap=self._colormap("Oranges"),
             alpha=0.6,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
         )
         axes[0].set_title(f"{offensive_label}\n(Offensive)", fontsize=11)
-        plt.colorbar(im1, ax=axes[0], shrink=0.5)
+        fig.colorbar(im1, ax=axes[0], shrink=0.5)
 
         # Defensive weakness map
         self._draw_half_rink(axes[1])
         im2 = axes[1].imshow(
-            defensive_map,
+            smoothed_def,
             extent=extent,
             origin="lower",
-            cmap="Blues",
+            cmap=self._colormap("Blues"),
             alpha=0.6,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
         )
         axes[1].set_title(f"vs {defensive_label}\n(Shots Allowed)", fontsize=11)
-        plt.colorbar(im2, ax=axes[1], shrink=0.5)
+        fig.colorbar(im2, ax=axes[1], shrink=0.5)
 
         # Mismatch opportunity map
-        mismatch = offensive_map * defensive_map
         self._draw_half_rink(axes[2])
         im3 = axes[2].imshow(
-            mismatch,
+            smoothed_mismatch,
             extent=extent,
             origin="lower",
-            cmap="RdYlGn",
+            cmap=self._colormap("RdYlGn"),
             alpha=0.7,
             aspect="auto",
-            interpolation="gaussian",
+            interpolation="nearest",
         )
         axes[2].set_title("Mismatch\nOpportunity", fontsize=11)
-        plt.colorbar(im3, ax=axes[2], shrink=0.5)
+        fig.colorbar(im3, ax=axes[2], shrink=0.5)
 
         fig.suptitle(title, fontsize=14, fontweight="bold")
-        plt.tight_layout()
+        fig.tight_layout()
 
         if output_path:
-            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
+            self._save(fig, output_path)
 
         return fig
 
+    def render_overlay_png(
+        self,
+        heat_map_data: np.ndarray,
+        output_path: str | Path,
+        colormap: str | None = None,
+        vmin: float | None = None,
+        vmax: float | None = None,
+    ) -> Path | None:
+        """
+        Write a heat map as a bare colormapped PNG, one pixel per grid cell.
+
+        No figure is created: the smoothed data is mapped through a cached
+        colormap lookup table and written with Pillow. The image has no rink,
+        axes or colorbar and is meant to be layered over a rink drawing by
+        the web frontend (using ``bounds`` from export_for_web).
+
+        Args:
+            heat_map_data: 2D numpy array with heat map values
+            output_path: Path to save the PNG
+            colormap: Matplotlib colormap name (defaults to SHOT_COLORMAP)
+            vmin: Value mapped to the bottom of the colormap (data min if None)
+            vmax: Value mapped to the top of the colormap (data max if None)
+
+        Returns:
+            Path of the written image or None if matplotlib unavailable
+        """
+        if not _ensure_mpl():
+            logger.warning("Cannot render overlay: matplotlib not available")
+            return None
+
+        from PIL import Image
+
+        smoothed = self._smooth(self._to_render_dtype(heat_map_data))
+        lo = float(smoothed.min()) if vmin is None else vmin
+        hi = float(smoothed.max()) if vmax is None else vmax
+        scale = 255.0 / (hi - lo) if hi > lo else 0.0
+
+        indices = np.clip((smoothed - lo) * scale, 0, 255).astype(np.uint8)
+        rgba = self._colormap_lut(colormap or self.SHOT_COLORMAP)[indices]
+
+        # Row 0 is the bottom of the rink (imshow origin="lower")
+        output_path = Path(output_path)
+        Image.fromarray(np.ascontiguousarray(rgba[::-1])).save(output_path)
+        logger.info(f"Saved heat map overlay to {output_path}")
+
+        return output_path
+
     def _draw_zone_boundaries(self, ax: Any) -> None:
         """Draw zone boundary lines on the rink."""
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             return
 
-        zone_color = "#666666"
-        alpha = 0.4
-        linestyle = "--"
+        if HeatMapVisualizer._zone_boundary_lines is None:
+            HeatMapVisualizer._zone_boundary_lines = LineCollection(
+                [
+                    # Slot boundaries
+                    [(69, 22), (89, 9)],
+                    [(69, -22), (89, -9)],
+                    # High slot boundary
+                    [(25, 15), (69, 22)],
+                    [(25, -15), (69, -22)],
+                ],
+                colors=to_rgba("#666666", 0.4),
+                linestyles="--",
+                zorder=2,
+            )
+
+        ax.add_collection(copy.copy(self._zone_boundary_lines), autolim=False)
 
-        # Slot boundaries
-        ax.plot([69, 89], [22, 9], color=zone_color, alpha=alpha, linestyle=linestyle)
-        ax.plot([69, 89], [-22, -9], color=zone_color, alpha=alpha, linestyle=linestyle)
+    def _nonzero_points(
+        self,
+        heat_map_data: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get rink coordinates and values of all non-empty heat map cells.
 
-        # High slot boundary
-        ax.plot([25, 69], [15, 22], color=zone_color, alpha=alpha, linestyle=linestyle)
-        ax.plot([25, 69], [-15, -22], color=zone_color, alpha=alpha, linestyle=linestyle)
+        Args:
+            heat_map_data: 2D numpy array
+
+        Returns:
+            Tuple of (x, y, value) float64 arrays in row-major cell order
+        """
+        if heat_map_data.size == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty
+
+        if kernels.NUMBA_AVAILABLE:
+            return kernels.collect_nonzero(heat_map_data)
+
+        rows, cols = heat_map_data.shape
+        if (rows, cols) not in self._grid_cache:
+            self._grid_cache[(rows, cols)] = (
+                np.arange(cols) / cols * 100,
+                np.arange(rows) / rows * 85 - 42.5,
+            )
+        x_coords, y_coords = self._grid_cache[(rows, cols)]
+
+        # Shot maps are mostly empty away from the slot: find rows holding any
+        # positive cell with one reduction (fmax ignores NaN) and only build
+        # the mask over those rows. Row order is kept, so output stays
+        # row-major.
+        active_rows = np.flatnonzero(np.fmax.reduce(heat_map_data, axis=1) > 0)
+        if active_rows.size == rows:
+            row_idx, col_idx = np.nonzero(heat_map_data > 0)
+        else:
+            band_idx, col_idx = np.nonzero(heat_map_data[active_rows] > 0)
+            row_idx = active_rows[band_idx]
+
+        values = heat_map_data[row_idx, col_idx].astype(np.float64)
+        return x_coords[col_idx], y_coords[row_idx], values
 
     def export_for_web(
         self,
         heat_map_data: np.ndarray,
         entity_name: str,
+        columnar: bool = False,
+        value_dtype: str | None = None,
     ) -> dict[str, Any]:
         """
         Export heat map data in a format suitable for web visualization.
 
+        By default non-empty cells are listed as ``data_points``, a list of
+        ``{"x", "y", "value"}`` dicts. With ``columnar=True`` they are
+        returned instead as ``columns``: ``{"x": [...], "y": [...],
+        "value": [...]}`` parallel lists. If ``value_dtype`` is also given
+        (e.g. ``"float32"``), each column is a base64 string of the packed
+        little-endian array and ``columns["dtype"]`` names its type, ready
+        for a typed array such as ``Float32Array`` on the client.
+
         Args:
             heat_map_data: 2D numpy array
             entity_name: Name of the player/team
+            columnar: Return parallel coordinate/value columns
+            value_dtype: NumPy dtype name for packed base64 columns
 
         Returns:
             Dictionary with data for web rendering
         """
-        rows, cols = heat_map_data.shape
+        xs, ys, values = self._nonzero_points(heat_map_data)
+
+        payload: dict[str, Any] = {"entity_name": entity_name}
+
+        if columnar:
+            if value_dtype is not None:
+                dtype = np.dtype(value_dtype).newbyteorder("<")
+                payload["columns"] = {
+                    name: base64.b64encode(column.astype(dtype).tobytes()).decode("ascii")
+                    for name, column in (("x", xs), ("y", ys), ("value", values))
+                }
+                payload["columns"]["dtype"] = dtype.name
+            else:
+                payload["columns"] = {"x": xs.tolist(), "y": ys.tolist(), "value": values.tolist()}
+        else:
+            # Convert to list of dictionaries for easy JSON serialization
+            payload["data_points"] = [
+                {"x": x, "y": y, "value": value}
+                for x, y, value in zip(xs.tolist(), ys.tolist(), values.tolist())
+            ]
+
+        payload.update(self._web_metadata())
+        return payload
+
+    def export_for_web_binary(
+        self,
+        heat_map_data: np.ndarray,
+        entity_name: str,
+    ) -> dict[str, Any]:
+        """
+        Export heat map data as packed float32 buffers for WebGL clients.
 
-        # Convert to list of dictionaries for easy JSON serialization
-        data_points = []
-        for i in range(rows):
-            for j in range(cols):
-                if heat_map_data[i, j] > 0:
-                    x = (j / cols) * 100  # Scale to rink coordinates
-                    y = (i / rows) * 85 - 42.5
-                    data_points.append({
-                        "x": x,
-                        "y": y,
-                        "value": float(heat_map_data[i, j]),
-                    })
+        ``x``, ``y`` and ``value`` are raw little-endian float32 ``bytes``
+        (non-empty cells in row-major order) that the browser can wrap
+        directly with ``new Float32Array(buffer)``. Unlike export_for_web the
+        result is not JSON-serializable; send the buffers as binary (e.g.
+        ``application/octet-stream`` or msgpack).
 
-        return {
+        Args:
+            heat_map_data: 2D numpy array
+            entity_name: Name of the player/team
+
+        Returns:
+            Dictionary with the packed buffers, point count and rink metadata
+        """
+        xs, ys, values = self._nonzero_points(heat_map_data)
+
+        payload: dict[str, Any] = {
             "entity_name": entity_name,
-            "data_points": data_points,
+            "count": int(xs.size),
+            "dtype": "float32",
+            "x": xs.astype("<f4").tobytes(),
+            "y": ys.astype("<f4").tobytes(),
+            "value": values.astype("<f4").tobytes(),
+        }
+        payload.update(self._web_metadata())
+        return payload
+
+    def _web_metadata(self) -> dict[str, Any]:
+        """Rink dimensions and coordinate bounds shared by the web exports."""
+        return {
             "rink_dimensions": {
                 "length": self.rink.length,
                 "width": self.rink.width,
@@ -484,6 +894,17 @@ class HeatMapVisualizer:
         }
 
     def close_all(self) -> None:
-        """Close all open figures."""
-        if MATPLOTLIB_AVAILABLE:
-            plt.close("all")
+        """
+        Release the persistent figure and close any open pyplot figures.
+
+        Rendered heat maps live outside pyplot and are freed once the
+        caller drops them.
+        """
+        for key in self._persistent:
+            self._persistent[key] = None
+
+        # Only figures made through pyplot need closing, and those can only
+        # exist if something has imported it
+        pyplot = sys.modules.get("matplotlib.pyplot")
+        if pyplot is not None:
+            pyplot.close("all")
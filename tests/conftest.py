@@ -274,3 +274,41 @@ def sample_segments_config() -> dict[str, Any]:
             },
         }
     }
+
+
+@pytest.fixture
+def nhl_api_config() -> dict[str, Any]:
+    """NHL API client configuration, as returned by the YAML loader."""
+    return {
+        "api": {
+            "base_url": "https://api-web.nhle.com",
+            "stats_base_url": "https://api.nhle.com/stats/rest/en",
+            "legacy_base_url": "https://statsapi.web.nhl.com/api/v1",
+            "timeout": 30,
+            "rate_limit": {
+                "requests_per_minute": 60,
+                "request_delay": 0.5,
+                "max_retries": 3,
+                "retry_delay": 2.0,
+                "retry_backoff": 2.0,
+            },
+        },
+        "collection": {
+            "cache": {
+                "enabled": False,
+                "ttl_hours": 24,
+                "directory": "data/cache",
+            },
+        },
+        "endpoints": {
+            "schedule": "/v1/schedule/{date}",
+            "stats": {
+                "teams": "/team",
+                "schedule": "/game",
+                "player": "/player",
+            },
+            "legacy": {
+                "game": "/game/{game_id}/feed/live",
+            },
+        },
+    }
@@ -4,6 +4,8 @@ Tests for Clutch and Stamina Analysis Module
 Validates clutch scoring, stamina analysis, and team resilience detection.
 """
 
+import pickle
+
 import pytest
 
 from src.analytics.clutch_analysis import (
@@ -11,6 +13,7 @@ from src.analytics.clutch_analysis import (
     ClutchLevel,
     ClutchMetrics,
     FatigueLevel,
+    RecommendationTag,
     StaminaAnalyzer,
     StaminaMetrics,
     TeamResilienceAnalyzer,
@@ -99,6 +102,24 @@ class TestClutchAnalyzer:
         assert metrics.late_game_assists == 4
         assert metrics.late_game_points == 7
 
+    def test_ingest_game_winning_goals(self, analyzer):
+        """Test batch recording of game-winning goals."""
+        analyzer.record_game_winning_goal(100)
+        analyzer.ingest_game_winning_goals([100, 101, 100])
+
+        assert analyzer.get_metrics(100).game_winning_goals == 3
+        assert analyzer.get_metrics(101).game_winning_goals == 1
+
+    def test_ingest_late_game_points(self, analyzer):
+        """Test batch recording matches per-event late game points."""
+        analyzer.ingest_late_game_points([100, 101, 100], goals=[2, 0, 1], assists=[3, 1, 1])
+
+        metrics = analyzer.get_metrics(100)
+        assert metrics.late_game_goals == 3
+        assert metrics.late_game_assists == 4
+        assert metrics.late_game_points == 7
+        assert analyzer.get_metrics(101).late_game_points == 1
+
     def test_calculate_clutch_score(self, analyzer):
         """Test clutch score calculation."""
         metrics = ClutchMetrics(
@@ -166,6 +187,20 @@ class TestClutchAnalyzer:
         level = analyzer.classify_player(100)
         assert level == ClutchLevel.POOR
 
+    def test_classify_players(self, analyzer):
+        """Test batch classification matches per-player classification."""
+        analyzer.ingest_player_metrics(
+            ClutchMetrics(player_id=100, games_played=10, game_winning_goals=8)
+        )
+        analyzer.ingest_player_metrics(
+            ClutchMetrics(player_id=101, games_played=50, game_winning_goals=1)
+        )
+
+        levels = analyzer.classify_players([100, 101, 999])
+
+        assert levels == [ClutchLevel.ELITE, ClutchLevel.POOR, ClutchLevel.POOR]
+        assert levels == [analyzer.classify_player(pid) for pid in (100, 101, 999)]
+
     def test_get_clutch_rankings(self, analyzer):
         """Test clutch performer rankings."""
         # Add multiple players with different clutch scores
@@ -331,6 +366,28 @@ class TestStaminaAnalyzer:
         assert len(recommendations) > 0
         assert any("third period" in r.lower() for r in recommendations)
 
+    def test_late_game_recommendation_tags(self, analyzer):
+        """Test recommendations are plain strings that also carry topic tags."""
+        analyzer.ingest_player_metrics(
+            StaminaMetrics(
+                player_id=100,
+                early_game_points_per_60=3.0,
+                late_game_points_per_60=1.5,
+            )
+        )
+
+        recommendations = analyzer.get_late_game_recommendations(100)
+
+        assert recommendations[0] == "Limit ice time in third period"
+        assert all(isinstance(r, str) for r in recommendations)
+        assert [r for r in recommendations if r.tags & RecommendationTag.THIRD_PERIOD] == [
+            "Limit ice time in third period"
+        ]
+        assert pickle.loads(pickle.dumps(recommendations[0])).tags == recommendations[0].tags
+        assert analyzer.get_late_game_recommendations(999)[0].tags == (
+            RecommendationTag.INSUFFICIENT_DATA
+        )
+
 
 class TestTeamResilienceAnalyzer:
     """Tests for TeamResilienceAnalyzer class."""
@@ -351,6 +408,17 @@ class TestTeamResilienceAnalyzer:
         assert metrics.leads_blown == 1
         assert metrics.lead_protection_rate == pytest.approx(2 / 3)
 
+    def test_ingest_lead_results(self, analyzer):
+        """Test batch recording of lead results."""
+        analyzer.ingest_lead_results([1, 2, 1, 1], held=[True, False, True, False])
+
+        metrics = analyzer.get_metrics(1)
+        assert metrics.leads_held == 2
+        assert metrics.leads_blown == 1
+        assert metrics.lead_protection_rate == pytest.approx(2 / 3)
+        assert analyzer.get_metrics(2).lead_protection_rate == 0.0
+        assert analyzer.is_collapse_prone(2) is True
+
     def test_record_comeback_result(self, analyzer):
         """Test recording comeback results."""
         analyzer.record_comeback_result(1, completed=True)
@@ -120,6 +120,39 @@ class TestMetricsCalculator:
         rebound_xg = calculator.calculate_shot_xg(x=80, y=0, is_rebound=True)
         assert rebound_xg > base_xg
 
+    def test_shot_xg_batch_matches_scalar(self, calculator):
+        """Test batch xG matches per-shot calculation."""
+        shots = [
+            (85, 0, None, False),
+            (30, 0, "wrist", False),
+            (80, 40, "deflection", True),
+            (-75, -10, "slap", False),
+        ]
+        xs, ys, shot_types, rebounds = zip(*shots)
+
+        batch = calculator.calculate_shot_xg_batch(xs, ys, shot_types, is_rebound=rebounds)
+
+        expected = [
+            calculator.calculate_shot_xg(x, y, shot_type, is_rebound=rebound)
+            for x, y, shot_type, rebound in shots
+        ]
+        assert batch.tolist() == pytest.approx(expected)
+
+    def test_shot_xg_table_matches_live_computation(self, calculator):
+        """Test integer coordinates served from the table match off-grid math."""
+        for x, y in [(85, 0), (-80, 40), (30, -12), (89, 43)]:
+            assert calculator.calculate_shot_xg(x, y) == calculator._base_xg(abs(x), abs(y))
+
+        # Off-grid coordinates still produce consistent values
+        assert calculator.calculate_shot_xg(85.5, 0.25) == calculator._base_xg(85.5, 0.25)
+        assert calculator.calculate_shot_xg(85.0, 0.0) == calculator.calculate_shot_xg(85, 0)
+
+    def test_shot_xg_batch_missing_coordinates(self, calculator):
+        """Test batch xG falls back to the base rate for missing coordinates."""
+        batch = calculator.calculate_shot_xg_batch([float("nan"), 85.0], [0.0, 0.0])
+        assert batch[0] == calculator.XG_BASE_RATE
+        assert batch[1] == pytest.approx(calculator.calculate_shot_xg(85, 0))
+
     def test_process_shot_attempt_goal(self, calculator):
         """Test processing a goal."""
         xg = calculator.process_shot_attempt(
@@ -191,6 +224,32 @@ class TestMetricsCalculator:
         assert summary["corsi"]["cf"] == 6
         assert summary["xg"]["xgf"] > 0
 
+    def test_process_shot_attempts_batch(self, calculator):
+        """Test batch processing matches per-attempt processing."""
+        attempts = [
+            ("shot", 1, 2, 100, 75, 0),
+            ("goal", 1, 2, 100, 80, 5),
+            ("blocked", 1, 2, 101, 60, -10),
+            ("missed", 2, 1, None, 50, 20),
+        ]
+        for event_type, team_id, opponent_id, player_id, x, y in attempts:
+            calculator.process_shot_attempt(event_type, team_id, opponent_id, player_id, x, y)
+
+        batch_calculator = MetricsCalculator()
+        xg = batch_calculator.process_shot_attempts_batch(*zip(*attempts))
+
+        assert len(xg) == 4
+        for team_id in (1, 2):
+            assert batch_calculator.get_team_corsi(team_id) == calculator.get_team_corsi(team_id)
+            batch_xg = batch_calculator.get_team_xg(team_id)
+            team_xg = calculator.get_team_xg(team_id)
+            assert batch_xg.xg_for == pytest.approx(team_xg.xg_for)
+            assert batch_xg.shots_for == team_xg.shots_for
+            assert batch_xg.goals_against == team_xg.goals_against
+        assert batch_calculator.get_player_corsi(101) == calculator.get_player_corsi(101)
+        assert batch_calculator.get_player_xg(100).goals_for == 1
+        assert batch_calculator.get_player_xg(101) is None
+
     def test_reset(self, calculator):
         """Test reset clears all data."""
         calculator.process_shot_attempt(
@@ -119,6 +119,30 @@ class TestPatternDetector:
         assert pattern.fatigue_indicator < 1.0
         assert pattern.early_game_strength > pattern.late_game_strength
 
+    def test_analyze_segment_performance_batch(self, detector):
+        """Test batch segment analysis matches the per-entity path."""
+        rates = [(3.0, 2.5, 2.0, 2, 20), (0.0, 1.0, 2.0, 0, 10), (0.0, 0.0, 0.0, 1, 0)]
+
+        expected = [
+            detector.analyze_segment_performance(
+                entity_id,
+                "player",
+                {"points_per_60": early},
+                {"points_per_60": mid},
+                {"points_per_60": late, "game_winning_goals": clutch, "games": games},
+            )
+            for entity_id, (early, mid, late, clutch, games) in enumerate(rates)
+        ]
+        detector.reset()
+
+        early, mid, late, clutch, games = zip(*rates)
+        patterns = detector.analyze_segment_performance_batch(
+            [0, 1, 2], "player", early, mid, late, clutch_goals=clutch, games=games
+        )
+
+        assert patterns == expected
+        assert detector.get_temporal_pattern(1) == expected[1]
+
     def test_classify_play_style_offensive(self, detector):
         """Test offensive play style classification."""
         offensive_metrics = {"xg_for": 3.0, "shots_for": 35}
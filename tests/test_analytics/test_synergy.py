@@ -134,3 +134,47 @@ def test_compatibility_matrix_construction():
     assert matrix[3][1] == pytest.approx(1.0)
     assert matrix[2][3] == pytest.approx(2.0)
     assert matrix[3][2] == pytest.approx(2.0)
+
+
+def test_synergy_score_reflects_latest_events_and_weights():
+    """Pair scores follow newly recorded events and edited weights."""
+    analyzer = SynergyAnalyzer(weights={"goal": 2.0, "shot": 1.0, "xg": 0.0, "event": 0.0})
+
+    analyzer.ingest_events(
+        [SynergyEvent(event_type="shot", period=1, game_seconds=50, player_ids=[1, 2])]
+    )
+    assert analyzer.synergy_score(2, 1) == pytest.approx(1.0)
+
+    analyzer.ingest_events(
+        [SynergyEvent(event_type="goal", period=1, game_seconds=80, player_ids=[1, 2])]
+    )
+    assert analyzer.synergy_score(1, 2) == pytest.approx(2.0)
+
+    analyzer.weights["goal"] = 4.0
+    assert analyzer.synergy_score(1, 2) == pytest.approx(3.0)
+
+    analyzer.get_pair_stats(1, 2).record_event(
+        SynergyEvent(event_type="shot", period=2, game_seconds=90, player_ids=[1, 2])
+    )
+    # (1 goal * 4.0 + 3 shots * 1.0) / 3 shared events
+    assert analyzer.synergy_score(1, 2) == pytest.approx(7 / 3)
+
+
+def test_compatibility_array_matches_matrix():
+    """The dense compatibility array mirrors the dict-of-dicts matrix."""
+    analyzer = SynergyAnalyzer(weights={"goal": 2.0, "shot": 1.0, "xg": 0.0, "event": 0.0})
+    analyzer.ingest_events(
+        [
+            SynergyEvent(event_type="goal", period=1, game_seconds=50, player_ids=[1, 2]),
+            SynergyEvent(event_type="shot", period=1, game_seconds=80, player_ids=[3, 1]),
+        ]
+    )
+
+    players, array = analyzer.compatibility_array([3, 1, 2, 1])
+    matrix = analyzer.compatibility_matrix([1, 2, 3])
+
+    assert players == [1, 2, 3]
+    assert array.shape == (3, 3)
+    for i, player in enumerate(players):
+        for j, other in enumerate(players):
+            assert array[i, j] == matrix[player][other]
@@ -4,6 +4,7 @@ Tests for NHL API Client
 Tests for the core NHL API integration module.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -36,44 +37,70 @@ class TestRateLimiter:
 class TestNHLApiClient:
     """Tests for the NHLApiClient class."""
 
-    @patch("src.collectors.nhl_api.Path.exists")
-    @patch("builtins.open")
-    def test_client_initialization(self, mock_open, mock_exists):
+    def test_client_initialization(self, nhl_api_config):
         """Test client initialization with config."""
-        mock_exists.return_value = True
-        mock_config = """
-api:
-  base_url: "https://api-web.nhle.com"
-  stats_base_url: "https://api.nhle.com/stats/rest/en"
-  legacy_base_url: "https://statsapi.web.nhl.com/api/v1"
-  timeout: 30
-  rate_limit:
-    requests_per_minute: 60
-    request_delay: 0.5
-    max_retries: 3
-    retry_delay: 2.0
-    retry_backoff: 2.0
-collection:
-  cache:
-    enabled: false
-    ttl_hours: 24
-    directory: "data/cache"
-endpoints:
-  schedule: "/v1/schedule/{date}"
-  stats:
-    teams: "/team"
-    schedule: "/game"
-    player: "/player"
-  legacy:
-    game: "/game/{game_id}/feed/live"
-"""
-        mock_open.return_value.__enter__.return_value.read.return_value = mock_config
+        from src.collectors.nhl_api import NHLApiClient
+
+        with patch.object(NHLApiClient, "_load_config", return_value=nhl_api_config):
+            client = NHLApiClient()
+
+        try:
+            assert client.base_url == "https://api-web.nhle.com"
+            assert client.rate_limiter.requests_per_minute == 60
+            assert client.max_retries == 3
+            assert client.cache is None
+        finally:
+            client.close()
+
+    def test_concurrent_requests_use_separate_http_clients(self, nhl_api_config):
+        """Test threads sharing one API client never share an HTTP client."""
+        import httpx
 
-        # This would normally initialize the client
-        # For now, just verify imports work
         from src.collectors.nhl_api import NHLApiClient
 
-        assert NHLApiClient is not None
+        barrier = threading.Barrier(2, timeout=5)
+
+        def handler(request):
+            # Both requests must be in flight at once to get past the barrier
+            barrier.wait()
+            return httpx.Response(200, json={"path": request.url.path})
+
+        created = []
+
+        def new_http_client(self):
+            client = httpx.Client(transport=httpx.MockTransport(handler))
+            created.append(client)
+            return client
+
+        nhl_api_config["api"]["rate_limit"]["request_delay"] = 0.0
+        with (
+            patch.object(NHLApiClient, "_load_config", return_value=nhl_api_config),
+            patch.object(NHLApiClient, "_new_http_client", new_http_client),
+        ):
+            client = NHLApiClient()
+
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda path=path: results.append(
+                        client._make_request(f"https://api.test/{path}", use_cache=False)
+                    )
+                )
+                for path in ("a", "b")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        try:
+            assert sorted(result["path"] for result in results) == ["/a", "/b"]
+            assert len(created) == 2
+            assert sorted(map(id, client._idle_clients)) == sorted(map(id, created))
+        finally:
+            client.close()
+
+        assert all(http_client.is_closed for http_client in created)
 
     def test_build_url(self):
         """Test URL building from endpoint templates."""
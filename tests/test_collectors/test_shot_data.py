@@ -4,6 +4,7 @@ Tests for Shot Data Collector
 Tests for shot location and outcome data collection.
 """
 
+import builtins
 import json
 from pathlib import Path
 from typing import Any
@@ -112,6 +113,49 @@ class TestShotDataCollector:
         assert loaded_shots[0].is_goal == shots[0].is_goal
 
 
+    @pytest.mark.parametrize(
+        "orjson_writes", [True, False], ids=["orjson_to_json", "json_to_orjson"]
+    )
+    def test_save_and_load_across_json_backends(self, monkeypatch, tmp_path, orjson_writes):
+        """Test files round-trip non-ASCII names between orjson and the json fallback."""
+        pytest.importorskip("orjson")
+        from src.collectors import shot_data
+        from src.collectors.shot_data import Shot, ShotDataCollector
+
+        # Simulate a non-UTF-8 locale such as cp1252 on Windows
+        monkeypatch.setattr(
+            shot_data,
+            "open",
+            lambda *args, **kwargs: builtins.open(*args, **{"encoding": "cp1252", **kwargs}),
+            raising=False,
+        )
+        shot = Shot(
+            game_id=2023020001,
+            event_id=1,
+            period=1,
+            time_in_period="05:00",
+            time_remaining="15:00",
+            shooter_id=8480801,
+            shooter_name="Tim Stützle",
+            team_id=9,
+            team_abbrev="OTT",
+            shot_type="wrist",
+            x_coord=80.0,
+            y_coord=5.0,
+            distance=10.0,
+            is_goal=True,
+        )
+        save_path = tmp_path / "shots.json"
+        collector = ShotDataCollector.__new__(ShotDataCollector)
+
+        monkeypatch.setattr(shot_data, "ORJSON_AVAILABLE", orjson_writes)
+        collector.save_shots([shot], save_path)
+        monkeypatch.setattr(shot_data, "ORJSON_AVAILABLE", not orjson_writes)
+        loaded = collector.load_shots(save_path)
+
+        assert loaded[0].shooter_name == "Tim Stützle"
+
+
 class TestStrengthDetermination:
     """Tests for strength state determination."""
 
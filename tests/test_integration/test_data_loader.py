@@ -4,100 +4,93 @@ Integration tests for DataLoader service.
 Tests data loading, caching, and offline fallback behavior.
 """
 
-import tempfile
-from pathlib import Path
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.models.player import Player, PlayerPosition
 from src.models.team import Team, TeamRoster
-from src.service.data_loader import CacheStatus, DataLoader
+from src.service.data_loader import CacheStatus, DataLoader, _MemoryCache
 
 
-@pytest.fixture
-def temp_cache_dir():
-    """Create a temporary cache directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+pytestmark = pytest.mark.integration
+
+# Canned API responses, built once per module. DataLoader only reads them.
+_TEAMS_PAYLOAD = {
+    "teams": [
+        {
+            "id": 1,
+            "name": "New Jersey Devils",
+            "abbreviation": "NJD",
+            "division": {"name": "Metropolitan"},
+            "conference": {"name": "Eastern"},
+        },
+        {
+            "id": 2,
+            "name": "New York Islanders",
+            "abbreviation": "NYI",
+            "division": {"name": "Metropolitan"},
+            "conference": {"name": "Eastern"},
+        },
+        {
+            "id": 10,
+            "name": "Toronto Maple Leafs",
+            "abbreviation": "TOR",
+            "division": {"name": "Atlantic"},
+            "conference": {"name": "Eastern"},
+        },
+    ]
+}
+
+_ROSTER_PAYLOAD = {
+    "forwards": [{"id": 8478402}, {"id": 8479318}, {"id": 8480012}],
+    "defensemen": [{"id": 8479325}, {"id": 8480069}],
+    "goalies": [{"id": 8479361}],
+}
+
+_PLAYER_PAYLOAD = {
+    "firstName": {"default": "Auston"},
+    "lastName": {"default": "Matthews"},
+    "position": "C",
+    "currentTeamId": 10,
+    "currentTeamAbbrev": "TOR",
+    "sweaterNumber": 34,
+    "heightInInches": 75,
+    "weightInPounds": 208,
+    "shootsCatches": "L",
+    "birthDate": "1997-09-17",
+    "birthCity": {"default": "San Ramon"},
+    "birthCountry": "USA",
+    "featuredStats": {
+        "regularSeason": {
+            "career": {
+                "gamesPlayed": 500,
+                "goals": 300,
+                "assists": 250,
+                "points": 550,
+            }
+        }
+    },
+}
 
 
 @pytest.fixture
 def mock_api_client():
     """Create a mock NHL API client."""
     client = MagicMock()
-
-    # Mock get_all_teams
-    client.get_all_teams.return_value = {
-        "teams": [
-            {
-                "id": 1,
-                "name": "New Jersey Devils",
-                "abbreviation": "NJD",
-                "division": {"name": "Metropolitan"},
-                "conference": {"name": "Eastern"},
-            },
-            {
-                "id": 2,
-                "name": "New York Islanders",
-                "abbreviation": "NYI",
-                "division": {"name": "Metropolitan"},
-                "conference": {"name": "Eastern"},
-            },
-            {
-                "id": 10,
-                "name": "Toronto Maple Leafs",
-                "abbreviation": "TOR",
-                "division": {"name": "Atlantic"},
-                "conference": {"name": "Eastern"},
-            },
-        ]
-    }
-
-    # Mock get_team_roster
-    client.get_team_roster.return_value = {
-        "forwards": [{"id": 8478402}, {"id": 8479318}, {"id": 8480012}],
-        "defensemen": [{"id": 8479325}, {"id": 8480069}],
-        "goalies": [{"id": 8479361}],
-    }
-
-    # Mock get_player_landing
-    client.get_player_landing.return_value = {
-        "firstName": {"default": "Auston"},
-        "lastName": {"default": "Matthews"},
-        "position": "C",
-        "currentTeamId": 10,
-        "currentTeamAbbrev": "TOR",
-        "sweaterNumber": 34,
-        "heightInInches": 75,
-        "weightInPounds": 208,
-        "shootsCatches": "L",
-        "birthDate": "1997-09-17",
-        "birthCity": {"default": "San Ramon"},
-        "birthCountry": "USA",
-        "featuredStats": {
-            "regularSeason": {
-                "career": {
-                    "gamesPlayed": 500,
-                    "goals": 300,
-                    "assists": 250,
-                    "points": 550,
-                }
-            }
-        },
-    }
-
-    client.close = MagicMock()
-
+    client.get_all_teams.return_value = _TEAMS_PAYLOAD
+    client.get_team_roster.return_value = _ROSTER_PAYLOAD
+    client.get_player_landing.return_value = _PLAYER_PAYLOAD
     return client
 
 
 @pytest.fixture
-def data_loader(mock_api_client, temp_cache_dir):
+def data_loader(mock_api_client, tmp_path):
     """Create a DataLoader with mocked API client."""
     loader = DataLoader(
         api_client=mock_api_client,
-        cache_dir=temp_cache_dir,
+        cache_dir=tmp_path,
     )
     yield loader
     loader.close()
@@ -185,6 +178,23 @@ class TestDataLoader:
         assert len(players) == 6  # 3 forwards + 2 defense + 1 goalie
         assert all(isinstance(p, Player) for p in players.values())
 
+    def test_load_team_players_concurrent_evictions(self, data_loader):
+        """Test threaded roster loading while the player cache keeps evicting."""
+        data_loader._players = _MemoryCache(maxsize=2, ttl_seconds=60)
+        forwards = list(range(100, 130))
+        team = Team(
+            team_id=10,
+            name="Toronto Maple Leafs",
+            abbreviation="TOR",
+            roster=TeamRoster(forwards=forwards, defensemen=[200, 201], goalies=[300]),
+        )
+
+        players = data_loader.load_team_players(team)
+
+        assert list(players) == team.roster.all_players
+        assert all(isinstance(p, Player) for p in players.values())
+        assert len(data_loader._players) <= 2
+
     def test_get_cache_status(self, data_loader, mock_api_client):
         """Test getting cache status."""
         # Load some data first
@@ -218,6 +228,33 @@ class TestDataLoader:
         data_loader.refresh_team_data(team_id=10)
         assert mock_api_client.get_team_roster.call_count == 2
 
+    def test_refresh_team_data_refreshes_departed_players(self, data_loader):
+        """Test players on the old roster are refreshed, not just the new roster."""
+        old_team = Team(
+            team_id=10,
+            name="Toronto Maple Leafs",
+            abbreviation="TOR",
+            roster=TeamRoster(forwards=[100, 101]),
+        )
+        new_team = old_team.model_copy(update={"roster": TeamRoster(forwards=[101, 102])})
+        data_loader._teams[10] = old_team
+        for player_id in (100, 101, 102):
+            data_loader._players[player_id] = Player(
+                player_id=player_id, full_name=f"Player {player_id}"
+            )
+            data_loader.cache.set(f"{DataLoader.PLAYER_PREFIX}{player_id}", {})
+
+        with (
+            patch.object(data_loader, "load_team", return_value=new_team),
+            patch.object(data_loader, "load_team_players"),
+        ):
+            data_loader.refresh_team_data(team_id=10)
+
+        # 100 left the team; its stale entries must go along with the others
+        for player_id in (100, 101, 102):
+            assert data_loader._players.get(player_id) is None
+            assert data_loader.cache.get(f"{DataLoader.PLAYER_PREFIX}{player_id}") is None
+
     def test_offline_fallback(self, data_loader, mock_api_client):
         """Test offline mode with cached data."""
         # First, load data successfully
@@ -231,9 +268,9 @@ class TestDataLoader:
         teams_cached = data_loader.get_available_teams()
         assert len(teams_cached) == 3
 
-    def test_context_manager(self, mock_api_client, temp_cache_dir):
+    def test_context_manager(self, mock_api_client, tmp_path):
         """Test context manager usage."""
-        with DataLoader(api_client=mock_api_client, cache_dir=temp_cache_dir) as loader:
+        with DataLoader(api_client=mock_api_client, cache_dir=tmp_path) as loader:
             teams = loader.get_available_teams()
             assert len(teams) == 3
 
@@ -259,3 +296,52 @@ class TestCacheStatus:
         assert result["players_cached"] == 100
         assert result["cache_size_mb"] == 1.5
         assert result["is_stale"] is False
+
+
+class TestMemoryCache:
+    """Tests for the bounded in-memory session cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is dropped past maxsize."""
+        cache = _MemoryCache(maxsize=2, ttl_seconds=60)
+        cache[1] = "a"
+        cache[2] = "b"
+        cache.get(1)
+        cache[3] = "c"
+
+        assert len(cache) == 2
+        assert cache.get(1) == "a"
+        assert cache.get(2) is None
+        assert cache.get(3) == "c"
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries past their TTL are treated as missing."""
+        cache = _MemoryCache(maxsize=2, ttl_seconds=60)
+        cache[1] = "a"
+
+        with patch("src.service.data_loader.time.monotonic", return_value=1e12):
+            assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_get_is_atomic_with_eviction(self):
+        """Test a writer evicting the key mid-get waits instead of breaking the get."""
+        cache = _MemoryCache(maxsize=1, ttl_seconds=60)
+        writer = threading.Thread(target=cache.__setitem__, args=(2, "b"))
+
+        class _EvictDuringLookup(type(cache._entries)):
+            def get(self, key, default=None):
+                entry = super().get(key, default)
+                # Another thread inserts (and so evicts key) between lookup
+                # and move_to_end; it must block until get has finished
+                if writer.ident is None:
+                    writer.start()
+                    writer.join(timeout=0.2)
+                return entry
+
+        cache._entries = _EvictDuringLookup(cache._entries)
+        cache[1] = "a"
+
+        assert cache.get(1) == "a"
+        writer.join()
+        assert cache.get(2) == "b"
+        assert len(cache) == 1
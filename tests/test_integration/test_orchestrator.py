@@ -4,18 +4,12 @@ Integration tests for Orchestrator service.
 Tests the complete prediction workflow with mocked dependencies.
 """
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from dataclasses import fields
+from unittest.mock import MagicMock
 
 import pytest
 
-from simulation.models import (
-    MatchupAnalysis,
-    ScoreDistribution,
-    SimulationConfig,
-    SimulationResult,
-)
+from simulation import PredictionSummary, SimulationResult
 from src.models.player import Player, PlayerPosition, PlayerStats
 from src.models.team import Team, TeamRoster, TeamStats
 from src.service.data_loader import CacheStatus, DataLoader
@@ -27,17 +21,16 @@ from src.service.orchestrator import (
     TeamInfo,
 )
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-def temp_cache_dir():
-    """Create a temporary cache directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# Lowest iteration count SimulationConfig accepts (ge=100); tests that only
+# check the shape of a prediction use it
+MIN_ITERATIONS = 100
 
 
-@pytest.fixture
-def mock_data_loader():
-    """Create a mock data loader."""
+@pytest.fixture(scope="module")
+def shared_data_loader():
+    """Mock data loader built once per module; see mock_data_loader."""
     loader = MagicMock(spec=DataLoader)
 
     # Mock get_available_teams
@@ -58,66 +51,83 @@ def mock_data_loader():
         },
     ]
 
+    # Teams and players are built once and served from these tables; the
+    # orchestrator only reads them (enrichment, which mutates, is mocked)
+    teams = {
+        10: Team(
+            team_id=10,
+            name="Toronto Maple Leafs",
+            abbreviation="TOR",
+            division="Atlantic",
+            conference="Eastern",
+            roster=TeamRoster(
+                forwards=[8478402, 8479318, 8480012],
+                defensemen=[8479325, 8480069],
+                goalies=[8479361],
+            ),
+            current_season_stats=TeamStats(games_played=20),
+        ),
+        6: Team(
+            team_id=6,
+            name="Boston Bruins",
+            abbreviation="BOS",
+            division="Atlantic",
+            conference="Eastern",
+            roster=TeamRoster(
+                forwards=[8478498, 8479326, 8480013],
+                defensemen=[8479026, 8480070],
+                goalies=[8479973],
+            ),
+            current_season_stats=TeamStats(games_played=20),
+        ),
+    }
+    team_ids_by_abbrev = {team.abbreviation: team_id for team_id, team in teams.items()}
+    players_by_team = {
+        team_id: {
+            pid: Player(
+                player_id=pid,
+                full_name=f"Player {pid}",
+                position=PlayerPosition.CENTER,
+                current_team_id=team_id,
+                career_stats=PlayerStats(games_played=50, goals=20, assists=30),
+            )
+            for pid in team.roster.all_players
+        }
+        for team_id, team in teams.items()
+    }
+
     # Mock load_team
     def mock_load_team(team_id=None, team_abbrev=None):
-        if team_id == 10 or team_abbrev == "TOR":
-            return Team(
-                team_id=10,
-                name="Toronto Maple Leafs",
-                abbreviation="TOR",
-                division="Atlantic",
-                conference="Eastern",
-                roster=TeamRoster(
-                    forwards=[8478402, 8479318, 8480012],
-                    defensemen=[8479325, 8480069],
-                    goalies=[8479361],
-                ),
-                current_season_stats=TeamStats(games_played=20),
-            )
-        elif team_id == 6 or team_abbrev == "BOS":
-            return Team(
-                team_id=6,
-                name="Boston Bruins",
-                abbreviation="BOS",
-                division="Atlantic",
-                conference="Eastern",
-                roster=TeamRoster(
-                    forwards=[8478498, 8479326, 8480013],
-                    defensemen=[8479026, 8480070],
-                    goalies=[8479973],
-                ),
-                current_season_stats=TeamStats(games_played=20),
-            )
-        raise ValueError(f"Team not found: {team_id or team_abbrev}")
+        team = teams.get(team_id) or teams.get(team_ids_by_abbrev.get(team_abbrev))
+        if team is None:
+            raise ValueError(f"Team not found: {team_id or team_abbrev}")
+        return team
 
     loader.load_team.side_effect = mock_load_team
 
     # Mock load_team_players
     def mock_load_players(team):
-        players = {}
-        for pid in team.roster.all_players:
-            players[pid] = Player(
-                player_id=pid,
-                full_name=f"Player {pid}",
-                position=PlayerPosition.CENTER,
-                current_team_id=team.team_id,
-                career_stats=PlayerStats(games_played=50, goals=20, assists=30),
-            )
-        return players
+        return dict(players_by_team[team.team_id])
 
     loader.load_team_players.side_effect = mock_load_players
 
     # Mock cache status
     loader.get_cache_status.return_value = CacheStatus(teams_cached=2, players_cached=12)
 
-    loader.close = MagicMock()
-
     return loader
 
 
 @pytest.fixture
-def mock_db_enrichment():
-    """Create a mock DB enrichment service."""
+def mock_data_loader(shared_data_loader):
+    """Create a mock data loader."""
+    # reset_mock keeps the configured return values and side effects
+    shared_data_loader.reset_mock()
+    return shared_data_loader
+
+
+@pytest.fixture(scope="module")
+def shared_db_enrichment():
+    """Mock DB enrichment service built once per module; see mock_db_enrichment."""
     enrichment = MagicMock(spec=DBEnrichment)
 
     # Mock enrich_all to return a summary with plausible data
@@ -140,13 +150,37 @@ def mock_db_enrichment():
 
 
 @pytest.fixture
-def orchestrator(mock_data_loader, mock_db_enrichment):
-    """Create an Orchestrator with mocked dependencies."""
-    orch = Orchestrator(data_loader=mock_data_loader, db_enrichment=mock_db_enrichment)
+def mock_db_enrichment(shared_db_enrichment):
+    """Create a mock DB enrichment service."""
+    shared_db_enrichment.reset_mock()
+    return shared_db_enrichment
+
+
+@pytest.fixture(scope="module")
+def shared_orchestrator(shared_data_loader, shared_db_enrichment):
+    """Orchestrator over the shared mocks, built once per module; see orchestrator."""
+    orch = Orchestrator(data_loader=shared_data_loader, db_enrichment=shared_db_enrichment)
     yield orch
     orch.close()
 
 
+@pytest.fixture
+def orchestrator(shared_orchestrator, mock_data_loader, mock_db_enrichment):
+    """Create an Orchestrator with mocked dependencies."""
+    # Requesting the mock fixtures resets their call records for this test
+    return shared_orchestrator
+
+
+@pytest.fixture(scope="module")
+def predicted_result(shared_orchestrator):
+    """TOR vs BOS prediction run once and shared by read-only result checks."""
+    return shared_orchestrator.predict_game(
+        home_team_id=10,
+        away_team_id=6,
+        options=PredictionOptions(iterations=MIN_ITERATIONS),
+    )
+
+
 class TestOrchestrator:
     """Tests for Orchestrator class."""
 
@@ -158,13 +192,9 @@ class TestOrchestrator:
         assert all(isinstance(t, TeamInfo) for t in teams)
         assert teams[0].name == "Toronto Maple Leafs"
 
-    def test_predict_game_by_id(self, orchestrator):
+    def test_predict_game_by_id(self, predicted_result):
         """Test running a prediction by team IDs."""
-        result = orchestrator.predict_game(
-            home_team_id=10,
-            away_team_id=6,
-            options=PredictionOptions(iterations=100),  # Low for speed
-        )
+        result = predicted_result
 
         assert isinstance(result, PredictionResult)
         assert result.home_team.name == "Toronto Maple Leafs"
@@ -204,19 +234,6 @@ class TestOrchestrator:
         assert "predicted_winner" in result
         assert "confidence" in result
 
-    def test_prediction_options_quick_mode(self):
-        """Test that quick mode sets lower iterations."""
-        options = PredictionOptions(quick_mode=True)
-        assert options.iterations == 1000
-
-    def test_prediction_options_default(self):
-        """Test default prediction options."""
-        options = PredictionOptions()
-        assert options.iterations == 10000
-        assert options.use_synergy is True
-        assert options.use_clutch is True
-        assert options.use_fatigue is True
-
     def test_get_cache_status(self, orchestrator):
         """Test getting cache status through orchestrator."""
         status = orchestrator.get_cache_status()
@@ -246,41 +263,35 @@ class TestOrchestrator:
 
         mock_data_loader.close.assert_called_once()
 
-    def test_simulation_result_structure(self, orchestrator):
+    def test_simulation_result_structure(self, predicted_result):
         """Test that simulation result has expected structure."""
-        result = orchestrator.predict_game(
-            home_team_id=10,
-            away_team_id=6,
-            options=PredictionOptions(iterations=100),
-        )
-
-        sim_result = result.simulation_result
+        sim_result = predicted_result.simulation_result
 
         # Check simulation result structure
-        assert hasattr(sim_result, "total_iterations")
-        assert hasattr(sim_result, "home_wins")
-        assert hasattr(sim_result, "away_wins")
-        assert hasattr(sim_result, "home_win_probability")
-        assert hasattr(sim_result, "score_distribution")
+        assert isinstance(sim_result, SimulationResult)
+        assert {
+            "total_iterations",
+            "home_wins",
+            "away_wins",
+            "home_win_probability",
+            "score_distribution",
+        } <= {f.name for f in fields(sim_result)}
 
         # Check prediction structure
-        pred = result.prediction
-        assert hasattr(pred, "home_team_name")
-        assert hasattr(pred, "away_team_name")
-        assert hasattr(pred, "win_probability")
-        assert hasattr(pred, "predicted_winner_name")
-        assert hasattr(pred, "most_likely_score")
-
-    def test_players_loaded_count(self, orchestrator):
+        pred = predicted_result.prediction
+        assert isinstance(pred, PredictionSummary)
+        assert {
+            "home_team_name",
+            "away_team_name",
+            "win_probability",
+            "predicted_winner_name",
+            "most_likely_score",
+        } <= {f.name for f in fields(pred)}
+
+    def test_players_loaded_count(self, predicted_result):
         """Test that players are loaded and counted correctly."""
-        result = orchestrator.predict_game(
-            home_team_id=10,
-            away_team_id=6,
-            options=PredictionOptions(iterations=100),
-        )
-
         # Both teams have 6 players each in the mock
-        assert result.players_loaded == 12
+        assert predicted_result.players_loaded == 12
 
 
 class TestTeamInfo:
@@ -322,25 +333,27 @@ class TestTeamInfo:
 class TestPredictionOptions:
     """Tests for PredictionOptions dataclass."""
 
-    def test_default_values(self):
-        """Test default option values."""
-        options = PredictionOptions()
-
-        assert options.iterations == 10000
-        assert options.use_synergy is True
-        assert options.use_clutch is True
-        assert options.use_fatigue is True
-        assert options.quick_mode is False
-
-    def test_quick_mode_overrides_iterations(self):
-        """Test that quick mode overrides iterations."""
-        options = PredictionOptions(iterations=50000, quick_mode=True)
-
-        # quick_mode should override iterations in __post_init__
-        assert options.iterations == 1000
-
-    def test_custom_iterations(self):
-        """Test setting custom iteration count."""
-        options = PredictionOptions(iterations=25000)
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {},
+                {
+                    "iterations": 10000,
+                    "use_synergy": True,
+                    "use_clutch": True,
+                    "use_fatigue": True,
+                    "quick_mode": False,
+                },
+            ),
+            ({"quick_mode": True}, {"iterations": 1000}),
+            # quick_mode overrides iterations in __post_init__
+            ({"iterations": 50000, "quick_mode": True}, {"iterations": 1000}),
+            ({"iterations": 25000}, {"iterations": 25000}),
+        ],
+    )
+    def test_option_values(self, kwargs, expected):
+        """Test option values for defaults, quick mode and custom iterations."""
+        options = PredictionOptions(**kwargs)
 
-        assert options.iterations == 25000
+        assert {name: getattr(options, name) for name in expected} == expected
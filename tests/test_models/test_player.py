@@ -6,14 +6,14 @@ Tests for player data model and statistics.
 
 import pytest
 
+from src.models.player import Player, PlayerPosition, PlayerStats, ZoneStats
+
 
 class TestPlayerPosition:
     """Tests for PlayerPosition enum."""
 
     def test_position_values(self):
         """Test position enum values."""
-        from src.models.player import PlayerPosition
-
         assert PlayerPosition.CENTER.value == "C"
         assert PlayerPosition.LEFT_WING.value == "LW"
         assert PlayerPosition.RIGHT_WING.value == "RW"
@@ -26,8 +26,6 @@ class TestPlayer:
 
     def test_player_creation(self, sample_player_profile):
         """Test creating a player from profile data."""
-        from src.models.player import Player, PlayerPosition
-
         player = Player(
             player_id=sample_player_profile["player_id"],
             full_name=sample_player_profile["full_name"],
@@ -45,55 +43,23 @@ class TestPlayer:
         assert player.is_goalie is False
         assert player.is_defenseman is False
 
-    def test_player_is_forward(self):
-        """Test forward position detection."""
-        from src.models.player import Player, PlayerPosition
-
-        center = Player(
-            player_id=1,
-            full_name="Test Center",
-            position=PlayerPosition.CENTER,
-        )
-        assert center.is_forward is True
-
-        lw = Player(
-            player_id=2,
-            full_name="Test LW",
-            position=PlayerPosition.LEFT_WING,
-        )
-        assert lw.is_forward is True
-
-        rw = Player(
-            player_id=3,
-            full_name="Test RW",
-            position=PlayerPosition.RIGHT_WING,
-        )
-        assert rw.is_forward is True
-
-    def test_player_is_defenseman(self):
-        """Test defenseman position detection."""
-        from src.models.player import Player, PlayerPosition
-
-        defenseman = Player(
-            player_id=1,
-            full_name="Test D",
-            position=PlayerPosition.DEFENSEMAN,
-        )
-        assert defenseman.is_defenseman is True
-        assert defenseman.is_forward is False
-
-    def test_player_is_goalie(self):
-        """Test goalie position detection."""
-        from src.models.player import Player, PlayerPosition
-
-        goalie = Player(
-            player_id=1,
-            full_name="Test G",
-            position=PlayerPosition.GOALIE,
-        )
-        assert goalie.is_goalie is True
-        assert goalie.is_forward is False
-        assert goalie.is_defenseman is False
+    @pytest.mark.parametrize(
+        ("position", "is_forward", "is_defenseman", "is_goalie"),
+        [
+            (PlayerPosition.CENTER, True, False, False),
+            (PlayerPosition.LEFT_WING, True, False, False),
+            (PlayerPosition.RIGHT_WING, True, False, False),
+            (PlayerPosition.DEFENSEMAN, False, True, False),
+            (PlayerPosition.GOALIE, False, False, True),
+        ],
+    )
+    def test_player_position_predicates(self, position, is_forward, is_defenseman, is_goalie):
+        """Test forward/defenseman/goalie detection for each position."""
+        player = Player(player_id=1, full_name="Test Player", position=position)
+
+        assert player.is_forward is is_forward
+        assert player.is_defenseman is is_defenseman
+        assert player.is_goalie is is_goalie
 
 
 class TestPlayerStats:
@@ -101,8 +67,6 @@ class TestPlayerStats:
 
     def test_player_stats_defaults(self):
         """Test default values for player stats."""
-        from src.models.player import PlayerStats
-
         stats = PlayerStats()
 
         assert stats.games_played == 0
@@ -113,8 +77,6 @@ class TestPlayerStats:
 
     def test_player_stats_zone_stats(self):
         """Test zone stats in player stats."""
-        from src.models.player import PlayerStats, ZoneStats
-
         stats = PlayerStats()
         stats.zone_stats["slot"] = ZoneStats(
             zone_name="slot",
@@ -132,8 +94,6 @@ class TestZoneStats:
 
     def test_zone_stats_creation(self):
         """Test creating zone stats."""
-        from src.models.player import ZoneStats
-
         zone_stats = ZoneStats(
             zone_name="slot",
             shots=50,
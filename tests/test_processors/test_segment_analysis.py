@@ -6,14 +6,24 @@ Tests for game segment processing and time-based analytics.
 
 import pytest
 
+from src.processors.segment_analysis import PlayerSegmentStats, SegmentDefinition, SegmentProcessor
+
+
+@pytest.fixture
+def make_segment_processor(sample_segments_config):
+    """Factory for empty SegmentProcessors over the three-segment sample config."""
+
+    def make() -> SegmentProcessor:
+        return SegmentProcessor.from_config(sample_segments_config)
+
+    return make
+
 
 class TestSegmentDefinition:
     """Tests for SegmentDefinition class."""
 
     def test_contains_time_early_game(self):
         """Test time containment for early game segment."""
-        from src.processors.segment_analysis import SegmentDefinition
-
         segment = SegmentDefinition(
             name="early_game",
             time_ranges=[
@@ -39,8 +49,6 @@ class TestSegmentDefinition:
 
     def test_contains_game_seconds(self):
         """Test containment by game seconds."""
-        from src.processors.segment_analysis import SegmentDefinition
-
         segment = SegmentDefinition(
             name="early_game",
             time_ranges=[
@@ -59,31 +67,9 @@ class TestSegmentDefinition:
 class TestSegmentProcessor:
     """Tests for SegmentProcessor class."""
 
-    def test_identify_segment_early_game(self):
+    def test_identify_segment_early_game(self, make_segment_processor):
         """Test segment identification for early game."""
-        from src.processors.segment_analysis import SegmentProcessor
-
-        processor = SegmentProcessor.__new__(SegmentProcessor)
-        processor.config = {
-            "segments": {
-                "early_game": {
-                    "time_ranges": [
-                        {"period": 1, "start_minute": 0, "end_minute": 20},
-                        {"period": 2, "start_minute": 0, "end_minute": 10},
-                    ],
-                    "total_minutes": 30,
-                    "characteristics": [],
-                },
-                "mid_game": {
-                    "time_ranges": [
-                        {"period": 2, "start_minute": 10, "end_minute": 20},
-                    ],
-                    "total_minutes": 10,
-                    "characteristics": [],
-                },
-            }
-        }
-        processor.segments = processor._build_segment_definitions()
+        processor = make_segment_processor()
 
         # Test early game
         assert processor.identify_segment(1, "05:30") == "early_game"
@@ -92,26 +78,9 @@ class TestSegmentProcessor:
         # Test mid game
         assert processor.identify_segment(2, "15:00") == "mid_game"
 
-    def test_process_goal_event(self, sample_game_events):
+    def test_process_goal_event(self, sample_game_events, make_segment_processor):
         """Test processing a goal event."""
-        from src.processors.segment_analysis import SegmentProcessor
-
-        processor = SegmentProcessor.__new__(SegmentProcessor)
-        processor.config = {
-            "segments": {
-                "early_game": {
-                    "time_ranges": [
-                        {"period": 1, "start_minute": 0, "end_minute": 20},
-                    ],
-                    "total_minutes": 20,
-                    "characteristics": [],
-                },
-            }
-        }
-        processor.segments = processor._build_segment_definitions()
-        processor.player_stats = {"early_game": {}}
-        processor.team_stats = {"early_game": {}}
-        processor.games_processed = set()
+        processor = make_segment_processor()
 
         # Process goal event
         goal_event = sample_game_events[2]  # The goal event
@@ -132,50 +101,9 @@ class TestSegmentProcessor:
         assert stats.goals == 1
         assert stats.points == 1
 
-    def test_process_game_events(self, sample_game_events):
+    def test_process_game_events(self, sample_game_events, make_segment_processor):
         """Test processing all events from a game."""
-        from src.processors.segment_analysis import SegmentProcessor
-
-        processor = SegmentProcessor.__new__(SegmentProcessor)
-        processor.config = {
-            "segments": {
-                "early_game": {
-                    "time_ranges": [
-                        {"period": 1, "start_minute": 0, "end_minute": 20},
-                        {"period": 2, "start_minute": 0, "end_minute": 10},
-                    ],
-                    "total_minutes": 30,
-                    "characteristics": [],
-                },
-                "mid_game": {
-                    "time_ranges": [
-                        {"period": 2, "start_minute": 10, "end_minute": 20},
-                        {"period": 3, "start_minute": 0, "end_minute": 10},
-                    ],
-                    "total_minutes": 20,
-                    "characteristics": [],
-                },
-                "late_game": {
-                    "time_ranges": [
-                        {"period": 3, "start_minute": 10, "end_minute": 20},
-                    ],
-                    "total_minutes": 10,
-                    "characteristics": [],
-                },
-            }
-        }
-        processor.segments = processor._build_segment_definitions()
-        processor.player_stats = {
-            "early_game": {},
-            "mid_game": {},
-            "late_game": {},
-        }
-        processor.team_stats = {
-            "early_game": {},
-            "mid_game": {},
-            "late_game": {},
-        }
-        processor.games_processed = set()
+        processor = make_segment_processor()
 
         processor.process_game_events(
             game_id="2023020001",
@@ -191,14 +119,9 @@ class TestSegmentProcessor:
 class TestFatigueAndClutchMetrics:
     """Tests for fatigue and clutch performance calculations."""
 
-    def test_fatigue_indicator_decline(self):
+    def test_fatigue_indicator_decline(self, make_segment_processor):
         """Test fatigue indicator showing performance decline."""
-        from src.processors.segment_analysis import (
-            PlayerSegmentStats,
-            SegmentProcessor,
-        )
-
-        processor = SegmentProcessor.__new__(SegmentProcessor)
+        processor = make_segment_processor()
         processor.player_stats = {
             "early_game": {
                 8478402: PlayerSegmentStats(
@@ -217,22 +140,15 @@ class TestFatigueAndClutchMetrics:
                 )
             },
         }
-        processor.segments = {"early_game": None, "mid_game": None, "late_game": None}
-
         fatigue = processor.calculate_fatigue_indicator(8478402)
 
         # Late game PPG (1.0) / Early game PPG (1.5) = 0.67
         assert fatigue == pytest.approx(1.0 / 1.5)
         assert fatigue < 1.0  # Indicates decline
 
-    def test_clutch_rating(self):
+    def test_clutch_rating(self, make_segment_processor):
         """Test clutch performance rating calculation."""
-        from src.processors.segment_analysis import (
-            PlayerSegmentStats,
-            SegmentProcessor,
-        )
-
-        processor = SegmentProcessor.__new__(SegmentProcessor)
+        processor = make_segment_processor()
         processor.player_stats = {
             "late_game": {
                 8478402: PlayerSegmentStats(
@@ -245,8 +161,6 @@ class TestFatigueAndClutchMetrics:
                 )
             },
         }
-        processor.segments = {"early_game": None, "mid_game": None, "late_game": None}
-
         clutch_rating = processor.calculate_clutch_rating(8478402)
 
         # Expected: (3 * 5.0 + 2 * 3.0 + 15 * 1.0) / 20 = (15 + 6 + 15) / 20 = 1.8
@@ -256,14 +170,9 @@ class TestFatigueAndClutchMetrics:
 class TestSegmentLeaders:
     """Tests for segment leader calculations."""
 
-    def test_get_segment_leaders(self):
+    def test_get_segment_leaders(self, make_segment_processor):
         """Test getting top performers in a segment."""
-        from src.processors.segment_analysis import (
-            PlayerSegmentStats,
-            SegmentProcessor,
-        )
-
-        processor = SegmentProcessor.__new__(SegmentProcessor)
+        processor = make_segment_processor()
         processor.player_stats = {
             "late_game": {
                 1: PlayerSegmentStats(player_id=1, player_name="P1", points=10),
@@ -271,8 +180,6 @@ class TestSegmentLeaders:
                 3: PlayerSegmentStats(player_id=3, player_name="P3", points=8),
             },
         }
-        processor.segments = {"late_game": None}
-
         leaders = processor.get_segment_leaders("late_game", "points", limit=2)
 
         assert len(leaders) == 2
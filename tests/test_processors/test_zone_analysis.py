@@ -6,14 +6,20 @@ Tests for zone-based aggregation and heat map generation.
 
 import pytest
 
+from src.processors.zone_analysis import (
+    PlayerZoneProfile,
+    TeamZoneProfile,
+    ZoneAnalyzer,
+    ZoneDefinition,
+    ZoneStats,
+)
+
 
 class TestZoneDefinition:
     """Tests for ZoneDefinition class."""
 
     def test_zone_contains_point(self):
         """Test point containment check."""
-        from src.processors.zone_analysis import ZoneDefinition
-
         zone = ZoneDefinition(
             name="slot",
             x_min=69,
@@ -38,8 +44,6 @@ class TestZoneAnalyzer:
 
     def test_identify_zone_slot(self):
         """Test zone identification for slot area."""
-        from src.processors.zone_analysis import ZoneAnalyzer
-
         analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
         analyzer.config = {
             "zones": {
@@ -61,8 +65,6 @@ class TestZoneAnalyzer:
 
     def test_identify_zone_none(self):
         """Test zone identification with None coordinates."""
-        from src.processors.zone_analysis import ZoneAnalyzer
-
         analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
         analyzer.config = {"zones": {}}
         analyzer.zones = {}
@@ -70,10 +72,39 @@ class TestZoneAnalyzer:
         assert analyzer.identify_zone(None, None) is None
         assert analyzer.identify_zone(50.0, None) is None
 
+    def test_identify_zones_matches_scalar(self):
+        """Test batch zone identification matches per-point identification."""
+        analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
+        analyzer.config = analyzer._default_zones_config()
+        analyzer.zones = analyzer._build_zone_definitions()
+
+        points = [(85.0, 0.0), (-75.0, 5.0), (60.0, -20.0), (10.0, 0.0), (89.0, 22.0), (54.5, 42.5)]
+        xs, ys = zip(*points)
+
+        zones = analyzer.identify_zones(xs, ys)
+
+        assert zones == [analyzer.identify_zone(x, y) for x, y in points]
+        assert zones[:2] == ["inner_slot", "slot"]
+        assert analyzer.identify_zones([float("nan")], [0.0]) == [None]
+
+    def test_identify_zone_grid_tracks_zone_changes(self):
+        """Test the integer-coordinate grid agrees with off-grid lookups and is rebuilt."""
+        analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
+        analyzer.config = analyzer._default_zones_config()
+        analyzer.zones = analyzer._build_zone_definitions()
+
+        assert analyzer.identify_zone(-85, 0) == "inner_slot"
+        assert analyzer.identify_zone(85.0, 0.5) == "inner_slot"
+        assert analyzer.identify_zone(40, 42) == "right_point"
+        assert analyzer.identify_zone(40, 43) == "other"
+
+        analyzer.zones = {
+            "slot": ZoneDefinition("slot", 69, 89, -22, 22, "high", 0.15),
+        }
+        assert analyzer.identify_zone(85, 0) == "slot"
+
     def test_process_shot(self, sample_shot_data):
         """Test processing a single shot."""
-        from src.processors.zone_analysis import ZoneAnalyzer
-
         analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
         analyzer.config = {
             "zones": {
@@ -110,10 +141,58 @@ class TestZoneAnalyzer:
         assert profile.total_shots == 1
         assert profile.total_goals == 1
 
+    def test_process_shots_batch_matches_process_shot(self, sample_shot_data):
+        """Test batch shot processing builds the same profiles as per-shot processing."""
+        shots = sample_shot_data + [
+            {"shooter_id": 1, "team_id": 22, "x_coord": -85.0, "y_coord": 0.0, "is_goal": True},
+            {"shooter_id": 1, "team_id": 10, "x_coord": None, "y_coord": 4.0},
+            # Shooter missing from the feed
+            {"shooter_id": None, "team_id": 10, "x_coord": 80.0, "y_coord": 2.0},
+        ]
+        game_context = {"home_team_id": 22, "away_team_id": 10}
+
+        def make_analyzer():
+            analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
+            analyzer.config = analyzer._default_zones_config()
+            analyzer.zones = analyzer._build_zone_definitions()
+            analyzer.player_profiles = {}
+            analyzer.team_profiles = {}
+            return analyzer
+
+        expected = make_analyzer()
+        for shot in shots:
+            team_id = shot.get("team_id")
+            expected.process_shot(
+                x=shot.get("x_coord"),
+                y=shot.get("y_coord"),
+                is_goal=shot.get("is_goal", False),
+                shot_type=shot.get("shot_type"),
+                player_id=shot.get("shooter_id", 0),
+                player_name=shot.get("shooter_name", ""),
+                team_id=team_id,
+                team_abbrev=shot.get("team_abbrev", ""),
+                opponent_team_id=10 if team_id == 22 else 22,
+            )
+
+        analyzer = make_analyzer()
+        analyzer.process_shots_batch(shots, game_context)
+
+        assert list(analyzer.player_profiles) == list(expected.player_profiles)
+        assert analyzer.player_profiles[None].total_shots == 1
+        assert list(analyzer.team_profiles) == list(expected.team_profiles)
+        for player_id, profile in expected.player_profiles.items():
+            batch_profile = analyzer.player_profiles[player_id]
+            assert batch_profile.zone_stats == profile.zone_stats
+            assert batch_profile.total_shots == profile.total_shots
+            assert batch_profile.total_xg == pytest.approx(profile.total_xg)
+        for team_id, profile in expected.team_profiles.items():
+            batch_profile = analyzer.team_profiles[team_id]
+            assert batch_profile.team_abbrev == profile.team_abbrev
+            assert batch_profile.offensive_zone_stats == profile.offensive_zone_stats
+            assert batch_profile.defensive_zone_stats == profile.defensive_zone_stats
+
     def test_player_heat_map_generation(self):
         """Test heat map generation for a player."""
-        from src.processors.zone_analysis import PlayerZoneProfile, ZoneStats
-
         profile = PlayerZoneProfile(
             player_id=8478402,
             player_name="Connor McDavid",
@@ -129,12 +208,6 @@ class TestZoneAnalyzer:
 
     def test_zone_mismatch_calculation(self):
         """Test zone mismatch calculation between teams."""
-        from src.processors.zone_analysis import (
-            TeamZoneProfile,
-            ZoneAnalyzer,
-            ZoneStats,
-        )
-
         analyzer = ZoneAnalyzer.__new__(ZoneAnalyzer)
         analyzer.config = {
             "zones": {
@@ -175,8 +248,6 @@ class TestZoneStats:
 
     def test_shooting_percentage_calculation(self):
         """Test shooting percentage update."""
-        from src.processors.zone_analysis import ZoneStats
-
         stats = ZoneStats(shots=20, goals=3)
         stats.update_shooting_percentage()
 
@@ -184,8 +255,6 @@ class TestZoneStats:
 
     def test_shooting_percentage_zero_shots(self):
         """Test shooting percentage with zero shots."""
-        from src.processors.zone_analysis import ZoneStats
-
         stats = ZoneStats(shots=0, goals=0)
         stats.update_shooting_percentage()
 
@@ -21,7 +21,7 @@ from src.models.team import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_home_team():
     """Create a sample home team for testing."""
     return Team(
@@ -94,7 +94,7 @@ def sample_home_team():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_away_team():
     """Create a sample away team for testing."""
     return Team(
@@ -156,6 +156,12 @@ def sample_away_team():
     )
 
 
+@pytest.fixture(scope="module")
+def engine():
+    """Simulation engine shared by the module (simulate reseeds it per call)."""
+    return GameSimulationEngine()
+
+
 class TestGameSimulationEngine:
     """Tests for the main simulation engine."""
 
@@ -179,9 +185,8 @@ class TestGameSimulationEngine:
         assert engine.xg_calculator is xg_calc
         assert engine.matchup_analyzer is matchup_analyzer
 
-    def test_simulate_single_game_basic(self, sample_home_team, sample_away_team):
+    def test_simulate_single_game_basic(self, engine, sample_home_team, sample_away_team):
         """Test basic single game simulation."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -197,9 +202,8 @@ class TestGameSimulationEngine:
         assert 0 <= result.home_win_probability <= 1
         assert 0 <= result.away_win_probability <= 1
 
-    def test_simulate_deterministic_with_seed(self, sample_home_team, sample_away_team):
+    def test_simulate_deterministic_with_seed(self, engine, sample_home_team, sample_away_team):
         """Test that same seed produces same results."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -214,9 +218,8 @@ class TestGameSimulationEngine:
         assert result1.away_wins == result2.away_wins
         assert result1.overtime_games == result2.overtime_games
 
-    def test_simulate_produces_varied_scores(self, sample_home_team, sample_away_team):
+    def test_simulate_produces_varied_scores(self, engine, sample_home_team, sample_away_team):
         """Test that simulation produces varied scores."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -229,9 +232,8 @@ class TestGameSimulationEngine:
         # Should have multiple different scores
         assert len(result.score_distribution.score_counts) > 1
 
-    def test_simulate_overtime_occurs(self, sample_home_team, sample_away_team):
+    def test_simulate_overtime_occurs(self, engine, sample_home_team, sample_away_team):
         """Test that overtime can occur in simulation."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -245,9 +247,8 @@ class TestGameSimulationEngine:
         # Note: This might occasionally fail due to randomness
         assert result.overtime_games >= 0  # At least non-negative
 
-    def test_simulate_generates_sample_games(self, sample_home_team, sample_away_team):
+    def test_simulate_generates_sample_games(self, engine, sample_home_team, sample_away_team):
         """Test that sample games are generated."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -265,9 +266,8 @@ class TestGameSimulationEngine:
         for game in result.sample_games:
             assert len(game.segments) >= 3  # At least 3 periods
 
-    def test_simulate_calculates_xg(self, sample_home_team, sample_away_team):
+    def test_simulate_calculates_xg(self, engine, sample_home_team, sample_away_team):
         """Test that expected goals are calculated."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -281,9 +281,8 @@ class TestGameSimulationEngine:
         assert result.average_home_xg > 0
         assert result.average_away_xg > 0
 
-    def test_simulate_matchup_analysis(self, sample_home_team, sample_away_team):
+    def test_simulate_matchup_analysis(self, engine, sample_home_team, sample_away_team):
         """Test that matchup analysis is generated."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -297,9 +296,8 @@ class TestGameSimulationEngine:
         assert result.matchup_analysis.home_team_id == 1
         assert result.matchup_analysis.away_team_id == 2
 
-    def test_simulate_confidence_score(self, sample_home_team, sample_away_team):
+    def test_simulate_confidence_score(self, engine, sample_home_team, sample_away_team):
         """Test that confidence score is calculated."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -311,9 +309,8 @@ class TestGameSimulationEngine:
 
         assert 0 <= result.confidence_score <= 1
 
-    def test_simulate_variance_indicator(self, sample_home_team, sample_away_team):
+    def test_simulate_variance_indicator(self, engine, sample_home_team, sample_away_team):
         """Test that variance indicator is set."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -362,9 +359,8 @@ class TestSegmentContext:
 class TestSimulationWithDisabledFeatures:
     """Tests for simulation with various features disabled."""
 
-    def test_simulate_without_synergy(self, sample_home_team, sample_away_team):
+    def test_simulate_without_synergy(self, engine, sample_home_team, sample_away_team):
         """Test simulation without synergy adjustments."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -377,9 +373,8 @@ class TestSimulationWithDisabledFeatures:
 
         assert result.total_iterations == 100
 
-    def test_simulate_without_clutch(self, sample_home_team, sample_away_team):
+    def test_simulate_without_clutch(self, engine, sample_home_team, sample_away_team):
         """Test simulation without clutch adjustments."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -392,9 +387,8 @@ class TestSimulationWithDisabledFeatures:
 
         assert result.total_iterations == 100
 
-    def test_simulate_without_fatigue(self, sample_home_team, sample_away_team):
+    def test_simulate_without_fatigue(self, engine, sample_home_team, sample_away_team):
         """Test simulation without fatigue adjustments."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
@@ -407,9 +401,8 @@ class TestSimulationWithDisabledFeatures:
 
         assert result.total_iterations == 100
 
-    def test_simulate_all_adjustments_disabled(self, sample_home_team, sample_away_team):
+    def test_simulate_all_adjustments_disabled(self, engine, sample_home_team, sample_away_team):
         """Test simulation with all adjustments disabled."""
-        engine = GameSimulationEngine()
         config = SimulationConfig(
             home_team_id=1,
             away_team_id=2,
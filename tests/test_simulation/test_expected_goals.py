@@ -14,13 +14,13 @@ from simulation.expected_goals import (
 from src.models.team import Team, TeamRoster, TeamStats, LineConfiguration
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def xg_calculator():
     """Create an ExpectedGoalsCalculator instance."""
     return ExpectedGoalsCalculator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_team():
     """Create a sample team for testing."""
     return Team(
@@ -74,7 +74,7 @@ def sample_team():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_opponent():
     """Create a sample opponent team."""
     return Team(
@@ -97,6 +97,32 @@ def sample_opponent():
     )
 
 
+@pytest.fixture(scope="module")
+def team_xg_result(xg_calculator, sample_team, sample_opponent):
+    """Team xG for sample_team against sample_opponent, computed once."""
+    return xg_calculator.calculate_team_xg(sample_team, sample_opponent)
+
+
+@pytest.fixture(scope="module")
+def matchup_xg_result(xg_calculator, sample_team, sample_opponent):
+    """Matchup xG with sample_team at home, computed once."""
+    return xg_calculator.calculate_matchup_xg(sample_team, sample_opponent)
+
+
+@pytest.fixture(scope="module")
+def away_forward_line():
+    """Create an opposing forward line for line matchup tests."""
+    return LineConfiguration(
+        line_number=1,
+        line_type="forward",
+        player_ids=[501, 502, 503],
+        chemistry_score=0.6,
+        corsi_percentage=0.48,
+        expected_goals_percentage=0.47,
+        time_on_ice_seconds=3600,
+    )
+
+
 class TestExpectedGoalsCalculator:
     """Tests for ExpectedGoalsCalculator class."""
 
@@ -114,18 +140,18 @@ class TestExpectedGoalsCalculator:
         assert calc.zone_xg_rates["slot"] == 0.25
         assert calc.zone_xg_rates["point"] == 0.05
 
-    def test_calculate_team_xg(self, xg_calculator, sample_team, sample_opponent):
+    def test_calculate_team_xg(self, team_xg_result, sample_team):
         """Test team xG calculation."""
-        result = xg_calculator.calculate_team_xg(sample_team, sample_opponent)
+        result = team_xg_result
 
         assert isinstance(result, TeamExpectedGoals)
         assert result.team_id == sample_team.team_id
         assert result.total_xg_for > 0
         assert result.total_xg_against > 0
 
-    def test_calculate_team_xg_zone_breakdown(self, xg_calculator, sample_team, sample_opponent):
+    def test_calculate_team_xg_zone_breakdown(self, team_xg_result):
         """Test that zone breakdown is calculated."""
-        result = xg_calculator.calculate_team_xg(sample_team, sample_opponent)
+        result = team_xg_result
 
         assert len(result.zone_xg) > 0
         # Slot should have highest xG rate
@@ -133,9 +159,9 @@ class TestExpectedGoalsCalculator:
             slot_xg = result.zone_xg["slot"]
             assert slot_xg.offensive_xg >= 0
 
-    def test_calculate_team_xg_segment_breakdown(self, xg_calculator, sample_team, sample_opponent):
+    def test_calculate_team_xg_segment_breakdown(self, team_xg_result):
         """Test segment xG breakdown."""
-        result = xg_calculator.calculate_team_xg(sample_team, sample_opponent)
+        result = team_xg_result
 
         assert result.early_game_xg_for >= 0
         assert result.mid_game_xg_for >= 0
@@ -150,18 +176,20 @@ class TestExpectedGoalsCalculator:
         # Allow some tolerance
         assert abs(segment_sum - result.total_xg_for * 0.75) < result.total_xg_for
 
-    def test_calculate_matchup_xg(self, xg_calculator, sample_team, sample_opponent):
+    def test_calculate_matchup_xg(self, matchup_xg_result, sample_team, sample_opponent):
         """Test matchup xG calculation for both teams."""
-        home_xg, away_xg = xg_calculator.calculate_matchup_xg(sample_team, sample_opponent)
+        home_xg, away_xg = matchup_xg_result
 
         assert home_xg.team_id == sample_team.team_id
         assert away_xg.team_id == sample_opponent.team_id
         assert home_xg.total_xg_for > 0
         assert away_xg.total_xg_for > 0
 
-    def test_calculate_matchup_home_ice_advantage(self, xg_calculator, sample_team, sample_opponent):
+    def test_calculate_matchup_home_ice_advantage(
+        self, xg_calculator, matchup_xg_result, sample_team, sample_opponent
+    ):
         """Test that home ice advantage is applied."""
-        home_xg, away_xg = xg_calculator.calculate_matchup_xg(sample_team, sample_opponent)
+        home_xg, away_xg = matchup_xg_result
 
         # Home team should have slight xG boost
         # Create reverse matchup to compare
@@ -171,21 +199,14 @@ class TestExpectedGoalsCalculator:
         # Note: This depends on team strengths too
         assert home_xg.total_xg_for > 0
 
-    def test_calculate_line_matchup_xg(self, xg_calculator, sample_team, sample_opponent):
+    def test_calculate_line_matchup_xg(
+        self, xg_calculator, sample_team, sample_opponent, away_forward_line
+    ):
         """Test line matchup xG calculation."""
         home_line = sample_team.forward_lines[0]
-        away_line = LineConfiguration(
-            line_number=1,
-            line_type="forward",
-            player_ids=[501, 502, 503],
-            chemistry_score=0.6,
-            corsi_percentage=0.48,
-            expected_goals_percentage=0.47,
-            time_on_ice_seconds=3600,
-        )
 
         home_xg, away_xg = xg_calculator.calculate_line_matchup_xg(
-            home_line, away_line, sample_team, sample_opponent
+            home_line, away_forward_line, sample_team, sample_opponent
         )
 
         assert home_xg >= 0
@@ -205,43 +226,46 @@ class TestZoneExpectedGoals:
         )
 
         assert zone_xg.zone_name == "slot"
-        assert zone_xg.net_xg == 0.2  # 0.5 - 0.3
+        assert zone_xg.shot_volume == 10.0
 
-    def test_zone_xg_net_calculation(self):
+    @pytest.mark.parametrize(
+        "offensive, defensive, net",
+        [
+            (0.5, 0.3, 0.2),
+            (0.1, 0.15, pytest.approx(-0.05, rel=0.01)),  # Negative = defensive zone
+        ],
+    )
+    def test_zone_xg_net_calculation(self, offensive, defensive, net):
         """Test net xG calculation."""
         zone_xg = ZoneExpectedGoals(
             zone_name="point",
-            offensive_xg=0.1,
-            defensive_xg_against=0.15,
+            offensive_xg=offensive,
+            defensive_xg_against=defensive,
         )
 
-        assert zone_xg.net_xg == pytest.approx(-0.05, rel=0.01)  # Negative = defensive zone
+        assert zone_xg.net_xg == net
 
 
 class TestTeamExpectedGoals:
     """Tests for TeamExpectedGoals dataclass."""
 
-    def test_team_xg_properties(self):
-        """Test team expected goals properties."""
-        team_xg = TeamExpectedGoals(
-            team_id=1,
-            total_xg_for=2.8,
-            total_xg_against=2.2,
-        )
-
-        assert team_xg.net_xg == pytest.approx(0.6, rel=0.01)
-        assert team_xg.xg_percentage == pytest.approx(0.56, rel=0.01)
-
-    def test_team_xg_balanced(self):
-        """Test balanced team xG."""
+    @pytest.mark.parametrize(
+        "xg_for, xg_against, net, percentage",
+        [
+            (2.8, 2.2, pytest.approx(0.6, rel=0.01), pytest.approx(0.56, rel=0.01)),
+            (2.5, 2.5, 0.0, 0.5),  # Balanced teams split exactly
+        ],
+    )
+    def test_team_xg_properties(self, xg_for, xg_against, net, percentage):
+        """Test team net xG and xG percentage."""
         team_xg = TeamExpectedGoals(
             team_id=1,
-            total_xg_for=2.5,
-            total_xg_against=2.5,
+            total_xg_for=xg_for,
+            total_xg_against=xg_against,
         )
 
-        assert team_xg.net_xg == 0.0
-        assert team_xg.xg_percentage == 0.5
+        assert team_xg.net_xg == net
+        assert team_xg.xg_percentage == percentage
 
 
 class TestLineExpectedGoals:
@@ -292,48 +316,53 @@ class TestLineExpectedGoals:
         assert adjusted > 2.0  # Fatigue makes defense worse
 
 
-class TestExpectedGoalsEdgeCases:
-    """Tests for edge cases in expected goals calculations."""
+@pytest.fixture(scope="module")
+def minimal_opponent():
+    """Create an opponent with only basic season stats."""
+    return Team(
+        team_id=2,
+        name="Opponent",
+        abbreviation="OPP",
+        roster=TeamRoster(),
+        current_season_stats=TeamStats(games_played=10, shots_for=100),
+    )
 
-    def test_empty_team_stats(self, xg_calculator):
-        """Test with minimal team stats."""
-        minimal_team = Team(
-            team_id=1,
-            name="Minimal",
-            abbreviation="MIN",
-            roster=TeamRoster(),
-            current_season_stats=TeamStats(games_played=1),
-        )
-        opponent = Team(
-            team_id=2,
-            name="Opponent",
-            abbreviation="OPP",
-            roster=TeamRoster(),
-            current_season_stats=TeamStats(games_played=1),
-        )
 
-        result = xg_calculator.calculate_team_xg(minimal_team, opponent)
+@pytest.fixture(scope="module")
+def single_game_opponent():
+    """Create an opponent with a single game of stats."""
+    return Team(
+        team_id=2,
+        name="Opponent",
+        abbreviation="OPP",
+        roster=TeamRoster(),
+        current_season_stats=TeamStats(games_played=1),
+    )
+
 
-        # Should not crash, return some reasonable values
-        assert isinstance(result, TeamExpectedGoals)
+class TestExpectedGoalsEdgeCases:
+    """Tests for edge cases in expected goals calculations."""
 
-    def test_zero_shots(self, xg_calculator):
-        """Test team with zero shots."""
+    @pytest.mark.parametrize(
+        "stats, opponent_fixture",
+        [
+            (TeamStats(games_played=1), "single_game_opponent"),
+            (TeamStats(games_played=10, shots_for=0), "minimal_opponent"),
+        ],
+        ids=["minimal_stats", "zero_shots"],
+    )
+    def test_sparse_team_stats(self, request, xg_calculator, stats, opponent_fixture):
+        """Test teams with minimal stats or no shots still produce xG."""
         team = Team(
             team_id=1,
-            name="NoShots",
-            abbreviation="NS",
-            roster=TeamRoster(),
-            current_season_stats=TeamStats(games_played=10, shots_for=0),
-        )
-        opponent = Team(
-            team_id=2,
-            name="Opponent",
-            abbreviation="OPP",
+            name="Minimal",
+            abbreviation="MIN",
             roster=TeamRoster(),
-            current_season_stats=TeamStats(games_played=10, shots_for=100),
+            current_season_stats=stats,
         )
+        opponent = request.getfixturevalue(opponent_fixture)
 
         result = xg_calculator.calculate_team_xg(team, opponent)
 
+        # Should not crash, return some reasonable values
         assert isinstance(result, TeamExpectedGoals)
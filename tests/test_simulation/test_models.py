@@ -2,6 +2,10 @@
 Tests for Simulation Data Models
 """
 
+import copy
+import pickle
+
+import numpy as np
 import pytest
 
 from simulation.models import (
@@ -57,6 +61,23 @@ class TestSimulationConfig:
         assert "late_game" in config.segment_weights
         assert config.segment_weights["late_game"] > config.segment_weights["early_game"]
 
+    def test_default_config_copies(self):
+        """Test default configs survive pickling and deep copies."""
+        config = SimulationConfig(home_team_id=1, away_team_id=2)
+
+        for clone in (
+            pickle.loads(pickle.dumps(config)),
+            copy.deepcopy(config),
+            config.model_copy(deep=True),
+        ):
+            assert clone == config
+            assert type(clone.segment_weights) is dict
+
+        # Each config owns its weights
+        other = SimulationConfig(home_team_id=1, away_team_id=2)
+        other.segment_weights["overtime"] = 2.0
+        assert config.segment_weights["overtime"] == 1.2
+
     def test_config_validation(self):
         """Test config validation constraints."""
         # Valid minimum iterations
@@ -103,18 +124,30 @@ class TestScoreDistribution:
         """Test adding results to distribution."""
         dist = ScoreDistribution()
 
-        # Add multiple 3-2 home wins
-        for _ in range(5):
-            dist.add_result(3, 2)
-
-        # Add some 2-1 games
-        for _ in range(3):
-            dist.add_result(2, 1)
+        # Five 3-2 home wins followed by three 2-1 games
+        dist.add_results(np.repeat([3, 2], [5, 3]), np.repeat([2, 1], [5, 3]))
 
         assert dist.score_counts[(3, 2)] == 5
         assert dist.score_counts[(2, 1)] == 3
         assert dist.most_likely_score() == (3, 2)
 
+    def test_add_results_batch_matches_add_result(self):
+        """Test batch adding matches adding results one at a time, in order."""
+        home_scores = [3, 2, 3, 0, 2, 5]
+        away_scores = [2, 1, 2, 4, 1, 0]
+
+        single = ScoreDistribution()
+        for home, away in zip(home_scores, away_scores):
+            single.add_result(home, away)
+
+        batch = ScoreDistribution()
+        batch.add_results(np.array(home_scores), np.array(away_scores))
+
+        assert list(batch.score_counts.items()) == list(single.score_counts.items())
+        assert batch.home_goals_distribution == single.home_goals_distribution
+        assert batch.total_goals_distribution == single.total_goals_distribution
+        assert batch.most_likely_score() == (3, 2)
+
     def test_average_goals(self):
         """Test average goal calculations."""
         dist = ScoreDistribution()
@@ -130,56 +163,32 @@ class TestScoreDistribution:
 class TestSimulatedGame:
     """Tests for SimulatedGame model."""
 
-    def test_game_properties(self):
-        """Test game properties."""
-        game = SimulatedGame(
-            game_number=1,
-            home_score=4,
-            away_score=2,
-            winner=1,
-        )
-
-        assert game.goal_differential == 2
-        assert game.total_goals == 6
-        assert game.was_blowout is False
-        assert game.was_close is False
-
-    def test_close_game(self):
-        """Test close game detection."""
-        game = SimulatedGame(
-            game_number=1,
-            home_score=3,
-            away_score=2,
-            winner=1,
-        )
-
-        assert game.was_close is True
-        assert game.was_blowout is False
-
-    def test_blowout_game(self):
-        """Test blowout detection."""
-        game = SimulatedGame(
-            game_number=1,
-            home_score=7,
-            away_score=1,
-            winner=1,
-        )
-
-        assert game.was_blowout is True
-        assert game.goal_differential == 6
-
-    def test_overtime_game(self):
-        """Test overtime game."""
+    @pytest.mark.parametrize(
+        "home_score, away_score, overtime, differential, close, blowout",
+        [
+            (4, 2, False, 2, False, False),
+            (3, 2, False, 1, True, False),
+            (7, 1, False, 6, False, True),
+            (3, 2, True, 1, True, False),
+        ],
+    )
+    def test_game_properties(
+        self, home_score, away_score, overtime, differential, close, blowout
+    ):
+        """Test goal differential, close game and blowout detection."""
         game = SimulatedGame(
             game_number=1,
-            home_score=3,
-            away_score=2,
+            home_score=home_score,
+            away_score=away_score,
             winner=1,
-            went_to_overtime=True,
+            went_to_overtime=overtime,
         )
 
-        assert game.was_close is True
-        assert game.went_to_overtime is True
+        assert game.goal_differential == differential
+        assert game.total_goals == home_score + away_score
+        assert game.was_close is close
+        assert game.was_blowout is blowout
+        assert game.went_to_overtime is overtime
 
 
 class TestSimulationResult:
@@ -295,18 +304,18 @@ class TestMatchupAnalysis:
 class TestGameEnums:
     """Tests for game-related enums."""
 
-    def test_game_segment_values(self):
-        """Test GameSegment enum values."""
-        assert GameSegment.EARLY_GAME.value == "early_game"
-        assert GameSegment.LATE_GAME.value == "late_game"
-        assert GameSegment.OVERTIME.value == "overtime"
-
-    def test_game_situation_values(self):
-        """Test GameSituation enum values."""
-        assert GameSituation.EVEN_STRENGTH.value == "5v5"
-        assert GameSituation.POWER_PLAY_HOME.value == "5v4_home"
-
-    def test_simulation_mode_values(self):
-        """Test SimulationMode enum values."""
-        assert SimulationMode.SINGLE_GAME.value == "single_game"
-        assert SimulationMode.SERIES.value == "series"
+    @pytest.mark.parametrize(
+        "member, expected",
+        [
+            (GameSegment.EARLY_GAME, "early_game"),
+            (GameSegment.LATE_GAME, "late_game"),
+            (GameSegment.OVERTIME, "overtime"),
+            (GameSituation.EVEN_STRENGTH, "5v5"),
+            (GameSituation.POWER_PLAY_HOME, "5v4_home"),
+            (SimulationMode.SINGLE_GAME, "single_game"),
+            (SimulationMode.SERIES, "series"),
+        ],
+    )
+    def test_enum_value(self, member, expected):
+        """Test GameSegment, GameSituation and SimulationMode enum values."""
+        assert member.value == expected
@@ -2,6 +2,7 @@
 Tests for Prediction Generator
 """
 
+import numpy as np
 import pytest
 
 from simulation.models import (
@@ -19,21 +20,17 @@ from simulation.predictions import (
     format_score,
 )
 
+MATCHUP_TYPES = frozenset({"blowout", "competitive", "toss-up"})
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_simulation_result():
     """Create a sample simulation result for testing."""
     config = SimulationConfig(home_team_id=1, away_team_id=2)
 
+    counts = [600, 200, 150, 50]
     score_dist = ScoreDistribution()
-    for _ in range(600):
-        score_dist.add_result(3, 2)
-    for _ in range(200):
-        score_dist.add_result(4, 1)
-    for _ in range(150):
-        score_dist.add_result(2, 3)
-    for _ in range(50):
-        score_dist.add_result(1, 4)
+    score_dist.add_results(np.repeat([3, 4, 2, 1], counts), np.repeat([2, 1, 3, 4], counts))
 
     matchup = MatchupAnalysis(
         home_team_id=1,
@@ -80,12 +77,42 @@ def sample_simulation_result():
     )
 
 
-@pytest.fixture
+def make_win_split_result(
+    home_wins: int, away_wins: int, overtime_games: int, shootout_games: int
+) -> SimulationResult:
+    """Build a 1000-iteration result carrying only win and overtime counts."""
+    return SimulationResult(
+        config=SimulationConfig(home_team_id=1, away_team_id=2),
+        total_iterations=1000,
+        home_wins=home_wins,
+        away_wins=away_wins,
+        overtime_games=overtime_games,
+        shootout_games=shootout_games,
+    )
+
+
+@pytest.fixture(scope="module")
 def prediction_generator():
     """Create a PredictionGenerator instance."""
     return PredictionGenerator()
 
 
+@pytest.fixture(scope="module")
+def sample_prediction(prediction_generator, sample_simulation_result):
+    """Prediction for the sample simulation result, generated once."""
+    return prediction_generator.generate_prediction(
+        sample_simulation_result,
+        home_team_name="Home Team",
+        away_team_name="Away Team",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_json_output(prediction_generator, sample_prediction):
+    """JSON output for the sample prediction, generated once."""
+    return prediction_generator.generate_json_output(sample_prediction)
+
+
 class TestPredictionGenerator:
     """Tests for PredictionGenerator class."""
 
@@ -94,78 +121,54 @@ class TestPredictionGenerator:
         assert prediction_generator.CONFIDENCE_THRESHOLDS is not None
         assert prediction_generator.BLOWOUT_THRESHOLD > prediction_generator.TOSSUP_THRESHOLD
 
-    def test_generate_prediction(self, prediction_generator, sample_simulation_result):
+    def test_generate_prediction(self, sample_prediction):
         """Test basic prediction generation."""
-        prediction = prediction_generator.generate_prediction(
-            sample_simulation_result,
-            home_team_name="Home Team",
-            away_team_name="Away Team",
-        )
+        assert isinstance(sample_prediction, PredictionSummary)
+        assert sample_prediction.home_team_id == 1
+        assert sample_prediction.away_team_id == 2
+        assert sample_prediction.home_team_name == "Home Team"
+        assert sample_prediction.away_team_name == "Away Team"
 
-        assert isinstance(prediction, PredictionSummary)
-        assert prediction.home_team_id == 1
-        assert prediction.away_team_id == 2
-        assert prediction.home_team_name == "Home Team"
-        assert prediction.away_team_name == "Away Team"
-
-    def test_prediction_win_probability(self, prediction_generator, sample_simulation_result):
+    def test_prediction_win_probability(self, sample_prediction):
         """Test win probability is calculated correctly."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-
-        assert prediction.win_probability.home_win_pct == 0.65
-        assert prediction.win_probability.away_win_pct == 0.35
-        assert prediction.win_probability.overtime_pct == 0.1
+        assert sample_prediction.win_probability.home_win_pct == 0.65
+        assert sample_prediction.win_probability.away_win_pct == 0.35
+        assert sample_prediction.win_probability.overtime_pct == 0.1
 
-    def test_prediction_predicted_winner(self, prediction_generator, sample_simulation_result):
+    def test_prediction_predicted_winner(self, sample_prediction):
         """Test predicted winner is correct."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-
-        assert prediction.predicted_winner_id == 1  # Home team wins more
-        assert prediction.win_confidence in ["low", "medium", "high", "very_high"]
+        assert sample_prediction.predicted_winner_id == 1  # Home team wins more
+        assert sample_prediction.win_confidence in PredictionGenerator.CONFIDENCE_THRESHOLDS
 
-    def test_prediction_score(self, prediction_generator, sample_simulation_result):
+    def test_prediction_score(self, sample_prediction):
         """Test score predictions."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
+        assert sample_prediction.most_likely_score == (3, 2)  # Most common score
+        assert sample_prediction.average_home_goals > 0
+        assert sample_prediction.average_away_goals > 0
 
-        assert prediction.most_likely_score == (3, 2)  # Most common score
-        assert prediction.average_home_goals > 0
-        assert prediction.average_away_goals > 0
-
-    def test_prediction_matchup_type(self, prediction_generator, sample_simulation_result):
+    def test_prediction_matchup_type(self, sample_prediction):
         """Test matchup type classification."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-
         # 65% win probability should be competitive
-        assert prediction.matchup_type in ["blowout", "competitive", "toss-up"]
+        assert sample_prediction.matchup_type in MATCHUP_TYPES
 
-    def test_prediction_key_advantages(self, prediction_generator, sample_simulation_result):
+    def test_prediction_key_advantages(self, sample_prediction):
         """Test key advantages are identified."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-
         # Should have some advantages based on matchup analysis
-        assert isinstance(prediction.key_advantages, list)
-        assert isinstance(prediction.key_disadvantages, list)
+        assert isinstance(sample_prediction.key_advantages, list)
+        assert isinstance(sample_prediction.key_disadvantages, list)
 
-    def test_prediction_confidence_metrics(self, prediction_generator, sample_simulation_result):
+    def test_prediction_confidence_metrics(self, sample_prediction):
         """Test confidence metrics."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-
-        assert 0 <= prediction.data_quality_score <= 1
-        assert 0 <= prediction.prediction_confidence <= 1
+        assert 0 <= sample_prediction.data_quality_score <= 1
+        assert 0 <= sample_prediction.prediction_confidence <= 1
 
 
 class TestPredictionReport:
     """Tests for prediction report generation."""
 
-    def test_generate_report(self, prediction_generator, sample_simulation_result):
+    def test_generate_report(self, prediction_generator, sample_prediction):
         """Test text report generation."""
-        prediction = prediction_generator.generate_prediction(
-            sample_simulation_result,
-            home_team_name="Home Team",
-            away_team_name="Away Team",
-        )
-
-        report = prediction_generator.generate_report(prediction)
+        report = prediction_generator.generate_report(sample_prediction)
 
         assert isinstance(report, str)
         assert "Home Team" in report
@@ -173,11 +176,9 @@ class TestPredictionReport:
         assert "WIN PROBABILITIES" in report
         assert "PREDICTION" in report
 
-    def test_generate_report_without_details(self, prediction_generator, sample_simulation_result):
+    def test_generate_report_without_details(self, prediction_generator, sample_prediction):
         """Test report without detailed analysis."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-
-        report = prediction_generator.generate_report(prediction, include_details=False)
+        report = prediction_generator.generate_report(sample_prediction, include_details=False)
 
         assert isinstance(report, str)
         assert "KEY ADVANTAGES" not in report or "CONFIDENCE METRICS" not in report
@@ -186,39 +187,25 @@ class TestPredictionReport:
 class TestPredictionJSON:
     """Tests for JSON output generation."""
 
-    def test_generate_json_output(self, prediction_generator, sample_simulation_result):
+    def test_generate_json_output(self, sample_json_output):
         """Test JSON output generation."""
-        prediction = prediction_generator.generate_prediction(
-            sample_simulation_result,
-            home_team_name="Home Team",
-            away_team_name="Away Team",
-        )
-
-        json_output = prediction_generator.generate_json_output(prediction)
-
-        assert isinstance(json_output, dict)
-        assert "matchup" in json_output
-        assert "win_probability" in json_output
-        assert "prediction" in json_output
-        assert "expected_goals" in json_output
-        assert "analysis" in json_output
-        assert "confidence" in json_output
-
-    def test_json_matchup_section(self, prediction_generator, sample_simulation_result):
+        assert isinstance(sample_json_output, dict)
+        assert "matchup" in sample_json_output
+        assert "win_probability" in sample_json_output
+        assert "prediction" in sample_json_output
+        assert "expected_goals" in sample_json_output
+        assert "analysis" in sample_json_output
+        assert "confidence" in sample_json_output
+
+    def test_json_matchup_section(self, sample_json_output):
         """Test JSON matchup section."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-        json_output = prediction_generator.generate_json_output(prediction)
-
-        matchup = json_output["matchup"]
+        matchup = sample_json_output["matchup"]
         assert matchup["home_team"]["id"] == 1
         assert matchup["away_team"]["id"] == 2
 
-    def test_json_win_probability_section(self, prediction_generator, sample_simulation_result):
+    def test_json_win_probability_section(self, sample_json_output):
         """Test JSON win probability section."""
-        prediction = prediction_generator.generate_prediction(sample_simulation_result)
-        json_output = prediction_generator.generate_json_output(prediction)
-
-        wp = json_output["win_probability"]
+        wp = sample_json_output["win_probability"]
         assert wp["home"] == 0.65
         assert wp["away"] == 0.35
         assert "overtime" in wp
@@ -250,10 +237,10 @@ class TestWinProbability:
         )
 
         # Home: 0.6 * 2 + 0.15 * 0.4 = 1.26
-        assert wp.home_points_expected == pytest.approx(1.26, rel=0.01)
+        assert wp.home_points_expected == 0.6 * 2 + 0.15 * 0.4
 
         # Away: 0.4 * 2 + 0.15 * 0.6 = 0.89
-        assert wp.away_points_expected == pytest.approx(0.89, rel=0.01)
+        assert wp.away_points_expected == 0.4 * 2 + 0.15 * 0.6
 
 
 class TestPredictionSummary:
@@ -284,82 +271,54 @@ class TestPredictionSummary:
 class TestHelperFunctions:
     """Tests for helper functions."""
 
-    def test_format_probability(self):
-        """Test probability formatting."""
+    def test_format_probability_default_places(self):
+        """Test probability formatting defaults to one decimal place."""
         assert format_probability(0.5) == "50.0%"
-        assert format_probability(0.652, decimal_places=1) == "65.2%"
-        assert format_probability(0.333, decimal_places=2) == "33.30%"
 
-    def test_format_score(self):
+    @pytest.mark.parametrize(
+        "prob, decimal_places, expected",
+        [(0.652, 1, "65.2%"), (0.333, 2, "33.30%")],
+    )
+    def test_format_probability(self, prob, decimal_places, expected):
+        """Test probability formatting."""
+        assert format_probability(prob, decimal_places=decimal_places) == expected
+
+    @pytest.mark.parametrize(
+        "home, away, expected",
+        [(3, 2, "3-2"), (0, 0, "0-0"), (7, 1, "7-1")],
+    )
+    def test_format_score(self, home, away, expected):
         """Test score formatting."""
-        assert format_score(3, 2) == "3-2"
-        assert format_score(0, 0) == "0-0"
-        assert format_score(7, 1) == "7-1"
+        assert format_score(home, away) == expected
 
 
 class TestConfidenceClassification:
     """Tests for confidence classification."""
 
-    def test_very_high_confidence(self, prediction_generator):
-        """Test very high confidence classification."""
-        config = SimulationConfig(home_team_id=1, away_team_id=2)
-        result = SimulationResult(
-            config=config,
-            total_iterations=1000,
-            home_wins=800,
-            away_wins=200,
-            overtime_games=50,
-            shootout_games=10,
-        )
-
-        prediction = prediction_generator.generate_prediction(result)
-        assert prediction.win_confidence == "very_high"
-
-    def test_low_confidence(self, prediction_generator):
-        """Test low confidence classification."""
-        config = SimulationConfig(home_team_id=1, away_team_id=2)
-        result = SimulationResult(
-            config=config,
-            total_iterations=1000,
-            home_wins=520,
-            away_wins=480,
-            overtime_games=50,
-            shootout_games=10,
-        )
-
+    @pytest.mark.parametrize(
+        "result, expected",
+        [
+            (make_win_split_result(800, 200, 50, 10), "very_high"),
+            (make_win_split_result(520, 480, 50, 10), "low"),
+        ],
+    )
+    def test_win_confidence(self, prediction_generator, result, expected):
+        """Test win confidence classification."""
         prediction = prediction_generator.generate_prediction(result)
-        assert prediction.win_confidence == "low"
+        assert prediction.win_confidence == expected
 
 
 class TestMatchupClassification:
     """Tests for matchup type classification."""
 
-    def test_blowout_classification(self, prediction_generator):
-        """Test blowout matchup classification."""
-        config = SimulationConfig(home_team_id=1, away_team_id=2)
-        result = SimulationResult(
-            config=config,
-            total_iterations=1000,
-            home_wins=750,
-            away_wins=250,
-            overtime_games=30,
-            shootout_games=5,
-        )
-
-        prediction = prediction_generator.generate_prediction(result)
-        assert prediction.matchup_type == "blowout"
-
-    def test_tossup_classification(self, prediction_generator):
-        """Test toss-up matchup classification."""
-        config = SimulationConfig(home_team_id=1, away_team_id=2)
-        result = SimulationResult(
-            config=config,
-            total_iterations=1000,
-            home_wins=530,
-            away_wins=470,
-            overtime_games=100,
-            shootout_games=20,
-        )
-
+    @pytest.mark.parametrize(
+        "result, expected",
+        [
+            (make_win_split_result(750, 250, 30, 5), "blowout"),
+            (make_win_split_result(530, 470, 100, 20), "toss-up"),
+        ],
+    )
+    def test_matchup_type(self, prediction_generator, result, expected):
+        """Test blowout and toss-up matchup classification."""
         prediction = prediction_generator.generate_prediction(result)
-        assert prediction.matchup_type == "toss-up"
+        assert prediction.matchup_type == expected
@@ -0,0 +1 @@
+"""Tests for visualization module."""
@@ -0,0 +1,134 @@
+"""
+Tests for Charts Visualization Module
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+
+from src.visualization import charts
+from src.visualization.charts import ChartVisualizer
+
+LONG_ZONE = "a_really_long_zone_label_for_layout_testing"
+
+
+def _key(value):
+    """Digest a single value the way _cached_png keys arguments."""
+    digest = hashlib.blake2b(digest_size=16)
+    if not charts._digest_value(digest, value):
+        return None
+    return digest.hexdigest()
+
+
+@pytest.fixture
+def visualizer():
+    """Create a chart visualizer with empty figure pool and PNG cache."""
+    chart_visualizer = ChartVisualizer()
+    chart_visualizer.close_all()
+    chart_visualizer._png_cache.clear()
+    yield chart_visualizer
+    chart_visualizer.close_all()
+
+
+class TestChartVisualizer:
+    """Tests for ChartVisualizer class."""
+
+    def test_pooled_figure_layout_ignores_current_figure(self, visualizer):
+        """Test a reused figure is laid out even when another figure is current."""
+        fresh = visualizer.render_zone_breakdown({LONG_ZONE: {"shots": 3}}, "Team")
+        expected_x0 = fresh.axes[0].get_position().x0
+        visualizer.close_all()
+
+        short = visualizer.render_zone_breakdown({"slot": {"shots": 3}}, "Team")
+        visualizer.release_figure(short)
+        # Radar charts create a new figure, which becomes pyplot's current one
+        visualizer.render_player_comparison({"goals": 1}, {"goals": 2}, "A", "B")
+
+        reused = visualizer.render_zone_breakdown({LONG_ZONE: {"shots": 3}}, "Team")
+
+        assert reused is short
+        assert reused.axes[0].get_position().x0 == pytest.approx(expected_x0)
+
+    def test_style_reapplied_between_visualizers(self, visualizer):
+        """Test each visualizer renders in its own style after another applied one."""
+        classic = ChartVisualizer(style="classic")
+        grid = ChartVisualizer(style="ggplot")
+
+        classic.close_all()
+        classic.render_zone_breakdown({"slot": {"shots": 3}}, "Team")
+        classic_face = matplotlib.rcParams["axes.facecolor"]
+        grid.render_zone_breakdown({"slot": {"shots": 3}}, "Team")
+        assert matplotlib.rcParams["axes.facecolor"] != classic_face
+
+        classic.render_zone_breakdown({"slot": {"shots": 4}}, "Team")
+        assert matplotlib.rcParams["axes.facecolor"] == classic_face
+
+    def test_unknown_style_falls_back_to_ggplot(self, visualizer):
+        """Test an unavailable style records and applies the ggplot fallback."""
+        missing = ChartVisualizer(style="no-such-style")
+        missing.render_zone_breakdown({"slot": {"shots": 3}}, "Team")
+
+        assert charts._ACTIVE_STYLE == ("no-such-style", "ggplot")
+
+    def test_png_cache_key_includes_array_dtype_and_shape(self):
+        """Test arrays with identical bytes but different dtype or shape get distinct keys."""
+        values = np.arange(4, dtype=np.int32)
+
+        keys = {
+            _key(values),
+            _key(values.view(np.float32)),
+            _key(values.reshape(2, 2)),
+        }
+
+        assert len(keys) == 3
+        assert _key(np.arange(4, dtype=np.int32)) == _key(values)
+
+    def test_png_cache_skips_arguments_without_value_repr(self, visualizer, tmp_path):
+        """Test renders with identity-repr arguments are not cached."""
+        assert _key([object()]) is None
+        assert _key({"slot": {"shots": object()}}) is None
+
+        output = tmp_path / "zones.png"
+        visualizer.render_zone_breakdown(
+            {"slot": {"shots": 3}}, "Team", output_path=output, close_after_save=True
+        )
+        assert len(visualizer._png_cache) == 1
+
+        visualizer.render_corsi_chart(
+            [10.0], [8.0], [object()], output_path=output, close_after_save=True
+        )
+        assert len(visualizer._png_cache) == 1
+        assert output.read_bytes().startswith(b"\x89PNG")
+
+    def test_render_batch_returns_png_per_spec(self, visualizer):
+        """Test batch rendering returns PNG bytes in spec order, None for empty charts."""
+        zones = {
+            "method": "render_zone_breakdown",
+            "kwargs": {"zone_stats": {"slot": {"shots": 3}}, "entity_name": "Team"},
+        }
+        corsi = {
+            "method": "render_corsi_chart",
+            "kwargs": {"corsi_for": [10.0, 12.0], "corsi_against": [8.0, 15.0], "labels": ["G1", "G2"]},
+        }
+        empty = {
+            "method": "render_shooting_percentage_trend",
+            "kwargs": {"games": [], "shooting_pcts": []},
+        }
+
+        results = visualizer.render_batch([zones, corsi, empty], max_workers=2)
+
+        assert len(results) == 3
+        assert results[0].startswith(b"\x89PNG")
+        assert results[1].startswith(b"\x89PNG")
+        assert results[2] is None
+        assert results[0] == visualizer.render_batch([zones])[0]
+        assert results[1] == visualizer.render_batch([corsi])[0]
+
+    @pytest.mark.parametrize("method", ["render_nothing", "close_all"])
+    def test_render_batch_rejects_unknown_method(self, visualizer, method):
+        """Test specs naming anything but a render method are rejected up front."""
+        with pytest.raises(ValueError, match="Unknown render method"):
+            visualizer.render_batch([{"method": method}])
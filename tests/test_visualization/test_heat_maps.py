@@ -0,0 +1,84 @@
+"""
+Tests for Heat Map Visualization Module
+"""
+
+import numpy as np
+import pytest
+
+from src.visualization import _kernels as kernels
+from src.visualization.heat_maps import HeatMapVisualizer
+
+
+@pytest.fixture
+def visualizer():
+    """Create a heat map visualizer."""
+    return HeatMapVisualizer()
+
+
+@pytest.fixture(params=[False, True], ids=["numpy", "numba"])
+def kernel_backend(request, monkeypatch):
+    """Run a test against the NumPy path and, when installed, the numba kernels."""
+    if request.param and not kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+
+class TestHeatMapVisualizer:
+    """Tests for HeatMapVisualizer class."""
+
+    @pytest.mark.parametrize("shape", [(5, 0), (0, 5), (0, 0)])
+    def test_export_for_web_empty_grid(self, visualizer, kernel_backend, shape):
+        """Test grids without cells export no data points."""
+        payload = visualizer.export_for_web(np.zeros(shape), "Team")
+
+        assert payload["data_points"] == []
+
+    def test_export_for_web_binary_buffers(self, visualizer, kernel_backend):
+        """Test binary export packs the web export's points as little-endian float32."""
+        grid = np.zeros((4, 5))
+        grid[1, 2] = 3.0
+        grid[3, 0] = 0.5
+        grid[2, 4] = -1.0
+
+        payload = visualizer.export_for_web_binary(grid, "Team")
+        points = visualizer.export_for_web(grid, "Team")["data_points"]
+
+        assert payload["entity_name"] == "Team"
+        assert payload["count"] == len(points) == 2
+        assert payload["dtype"] == "float32"
+        assert payload["bounds"] == {"x_min": 0, "x_max": 100, "y_min": -42.5, "y_max": 42.5}
+        for name in ("x", "y", "value"):
+            assert isinstance(payload[name], bytes)
+            column = np.frombuffer(payload[name], dtype="<f4")
+            np.testing.assert_allclose(column, [point[name] for point in points], rtol=1e-6)
+
+    def test_render_overlay_png_one_pixel_per_cell(self, visualizer, tmp_path):
+        """Test the overlay is an RGBA image of the grid's shape with row 0 at the bottom."""
+        pytest.importorskip("matplotlib")
+        image = pytest.importorskip("PIL.Image")
+        grid = np.zeros((6, 8))
+        grid[0] = 10.0
+
+        output = visualizer.render_overlay_png(grid, tmp_path / "overlay.png", colormap="gray")
+
+        assert output == tmp_path / "overlay.png"
+        with image.open(output) as png:
+            assert png.mode == "RGBA"
+            assert png.size == (8, 6)
+            pixels = np.asarray(png)
+        assert pixels[-1, :, 0].min() > pixels[0, :, 0].max()
+
+    def test_save_keeps_artists_outside_figure(self, visualizer, tmp_path):
+        """Test saved PNGs include artists past the figure edge and record the dpi."""
+        pytest.importorskip("matplotlib")
+        image = pytest.importorskip("PIL.Image")
+
+        fig = visualizer.render_shot_heat_map(np.ones((10, 10)), "Shots")
+        fig.text(1.5, 0.5, "outside the figure")
+        output = tmp_path / "heat_map.png"
+        visualizer._save(fig, output)
+
+        with image.open(output) as png:
+            assert png.width > fig.get_figwidth() * visualizer.dpi
+            assert png.info["dpi"] == pytest.approx((visualizer.dpi, visualizer.dpi), abs=0.01)
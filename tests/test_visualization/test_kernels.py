@@ -0,0 +1,104 @@
+"""
+Tests for Visualization Numeric Kernels
+"""
+
+import numpy as np
+import pytest
+
+from src.visualization import _kernels as kernels
+from src.visualization.heat_maps import HeatMapVisualizer
+
+requires_numba = pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason="numba not installed")
+
+
+@pytest.fixture
+def rng():
+    """Create a seeded random generator."""
+    return np.random.default_rng(42)
+
+
+class TestKernelValidation:
+    """Tests for argument checks made before dispatching to a kernel."""
+
+    @pytest.mark.parametrize("numba_available", [False, True], ids=["numpy", "numba"])
+    def test_cf_pct_length_mismatch(self, monkeypatch, numba_available):
+        """Test CF% rejects arrays of different lengths on both paths."""
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", numba_available)
+
+        with pytest.raises(ValueError, match="differ in length"):
+            kernels.cf_pct(np.ones(3), np.ones(2))
+
+    @pytest.mark.parametrize("numba_available", [False, True], ids=["numpy", "numba"])
+    @pytest.mark.parametrize("window", [0, 4])
+    def test_rolling_mean_window_out_of_range(self, monkeypatch, numba_available, window):
+        """Test the rolling mean rejects windows that do not fit the series."""
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", numba_available)
+
+        with pytest.raises(ValueError, match="window must be between 1 and 3"):
+            kernels.rolling_mean(np.ones(3), window)
+
+
+@requires_numba
+class TestJitKernels:
+    """Tests comparing each numba kernel against its NumPy path."""
+
+    def test_cf_pct_matches_numpy(self, rng):
+        """Test the CF% kernel matches NumPy, including entries without attempts."""
+        cf = rng.integers(0, 30, 200).astype(np.float64)
+        ca = rng.integers(0, 30, 200).astype(np.float64)
+        cf[:5] = ca[:5] = 0.0
+        # Missing games
+        cf[5] = np.nan
+        ca[6] = np.nan
+
+        result = kernels._cf_pct_jit(cf, ca)
+
+        np.testing.assert_allclose(result, kernels._cf_pct_numpy(cf, ca))
+        assert np.all(result[:5] == 50.0)
+        assert np.all(result[5:7] == 50.0)
+
+    @pytest.mark.parametrize("window", [1, 5, 50])
+    def test_rolling_mean_matches_numpy(self, rng, window):
+        """Test the rolling mean kernel matches NumPy."""
+        values = rng.random(50)
+        values[20] = np.nan  # Missing game
+
+        result = kernels._rolling_mean_jit(values, window)
+
+        assert result.shape == (51 - window,)
+        np.testing.assert_allclose(result, kernels._rolling_mean_numpy(values, window))
+
+    @pytest.mark.parametrize(
+        "kernel",
+        [kernels._collect_nonzero_jit, kernels._collect_nonzero_parallel_jit],
+        ids=["serial", "parallel"],
+    )
+    def test_collect_nonzero_matches_numpy(self, monkeypatch, rng, kernel):
+        """Test both nonzero kernels match the visualizer's NumPy path."""
+        grid = rng.random((40, 60)) - 0.5
+        grid[:10] = 0.0
+        grid[20, 30] = np.nan
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+        expected = HeatMapVisualizer()._nonzero_points(grid)
+
+        result = kernel(grid)
+
+        for actual, wanted in zip(result, expected, strict=True):
+            assert actual.dtype == np.float64
+            np.testing.assert_allclose(actual, wanted)
+
+    def test_collect_nonzero_uses_parallel_kernel_for_large_grids(self, monkeypatch, rng):
+        """Test grids above the threshold take the parallel kernel."""
+        monkeypatch.setattr(kernels, "PARALLEL_MIN_CELLS", 100)
+        grid = rng.random((20, 20)) - 0.5
+        calls = []
+        parallel = kernels._collect_nonzero_parallel_jit
+        monkeypatch.setattr(
+            kernels,
+            "_collect_nonzero_parallel_jit",
+            lambda g: calls.append(g.shape) or parallel(g),
+        )
+
+        kernels.collect_nonzero(grid)
+
+        assert calls == [(20, 20)]